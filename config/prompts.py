@@ -31,6 +31,28 @@ NEWS_SELECTION_USER = """아래 뉴스 목록에서 YouTube Shorts로 만들기
     ]
 }}"""
 
+NEWS_SELECTION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "selected": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "index": {"type": "integer"},
+                    "title": {"type": "string"},
+                    "reason": {"type": "string"},
+                    "hook_idea": {"type": "string"},
+                },
+                "required": ["index", "title", "reason", "hook_idea"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": ["selected"],
+    "additionalProperties": False,
+}
+
 
 SCRIPT_GENERATION_SYSTEM = """당신은 YouTube Shorts 스크립트 작가입니다.
 IT/테크 뉴스를 30-50초 분량의 짧고 임팩트 있는 스크립트로 변환합니다.
@@ -72,6 +94,29 @@ SCRIPT_GENERATION_USER = """다음 뉴스를 YouTube Shorts 스크립트로 변
     "description": "YouTube 설명란 (100자 이내)"
 }}"""
 
+SCRIPT_GENERATION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "script": {
+            "type": "object",
+            "properties": {
+                "hook": {"type": "string"},
+                "body": {"type": "string"},
+                "outro": {"type": "string"},
+            },
+            "required": ["hook", "body", "outro"],
+            "additionalProperties": False,
+        },
+        "full_script": {"type": "string"},
+        "keywords": {"type": "array", "items": {"type": "string"}},
+        "hashtags": {"type": "array", "items": {"type": "string"}},
+        "description": {"type": "string"},
+    },
+    "required": ["title", "script", "full_script", "keywords", "hashtags", "description"],
+    "additionalProperties": False,
+}
+
 
 KEYWORD_TRANSLATION_SYSTEM = """주어진 한국어 키워드를 Pexels에서 검색하기 좋은 영어 키워드로 변환합니다.
 추상적인 개념은 시각적으로 표현 가능한 구체적인 키워드로 변환하세요."""
@@ -87,3 +132,16 @@ JSON 형식으로 응답:
         {{"ko": "원본", "en": "translation", "visual_alternative": "시각적 대안 키워드"}}
     ]
 }}"""
+
+
+STRUCTURED_RETRY_USER = """{user_prompt}
+
+이전 응답이 요청한 JSON 형식과 맞지 않았습니다.
+
+문제:
+{errors}
+
+이전 응답:
+{response}
+
+위 문제를 고쳐서 JSON만 다시 출력해주세요."""
@@ -18,14 +18,31 @@ class Settings(BaseSettings):
     
     openai_api_key: str = Field(...)
     openai_model: str = Field(default="gpt-4o-mini")
+    openai_requests_per_minute: int = Field(default=500)
+    openai_tokens_per_minute: int = Field(default=200000)
+    openai_max_retries: int = Field(default=5)
+    openai_structured_output: bool = Field(default=True)
+    openai_base_url: str = Field(default="")
+    openai_batch_poll_interval: float = Field(default=30.0)
+    
+    ai_cache_enabled: bool = Field(default=False)
+    ai_cache_ttl_hours: float = Field(default=72.0)
+    ai_cache_max_mb: float = Field(default=100.0)
+    script_concurrency: int = Field(default=4)
     
     typecast_api_key: str = Field(default="")
     typecast_voice_id: str = Field(default="")
     
     pexels_api_key: str = Field(default="")
+    pexels_per_page: int = Field(default=15)
+    media_concurrency: int = Field(default=4)
+    media_download_retries: int = Field(default=3)
+    media_download_chunk_kb: int = Field(default=1024)
     
     youtube_client_secret_file: str = Field(default="config/client_secret.json")
     youtube_token_file: str = Field(default="config/youtube_token.json")
+    youtube_category_id: str = Field(default="28")
+    youtube_daily_quota: int = Field(default=10000)
     
     discord_webhook_url: str = Field(default="")
     
@@ -34,9 +51,43 @@ class Settings(BaseSettings):
     temp_dir: str = Field(default="output/temp")
     
     tts_provider: Literal["typecast", "edge"] = Field(default="typecast")
+    edge_voice: str = Field(default="ko-KR-SunHiNeural")
+    tts_typecast_concurrency: int = Field(default=4)
+    tts_edge_concurrency: int = Field(default=8)
+    tts_cache_enabled: bool = Field(default=True)
+    tts_cache_max_mb: float = Field(default=500.0)
+    pipeline_tts_workers: int = Field(default=2)
+    pipeline_media_workers: int = Field(default=2)
+    
+    ffmpeg_path: str = Field(default="")
+    render_fps: int = Field(default=30)
+    render_preset: str = Field(default="veryfast")
+    render_crf: int = Field(default=23)
+    render_threads: int = Field(default=0)
+    render_workers: int = Field(default=0)
+    render_min_threads: int = Field(default=2)
+    render_cache_enabled: bool = Field(default=True)
+    render_cache_max_mb: float = Field(default=2000.0)
+    render_profile_enabled: bool = Field(default=True)
+    render_font_file: str = Field(default="")
+    render_font_size: int = Field(default=72)
+    caption_max_chars: int = Field(default=14)
     
     daily_shorts_count: int = Field(default=3)
     upload_privacy: Literal["public", "unlisted", "private"] = Field(default="private")
+    upload_enabled: bool = Field(default=False)
+    upload_concurrency: int = Field(default=2)
+    upload_chunk_mb: int = Field(default=8)
+    upload_max_retries: int = Field(default=5)
+    upload_while_rendering: bool = Field(default=False)
+    
+    crawl_queries: list[str] = Field(default=["IT 테크", "AI 인공지능", "스마트폰"])
+    crawl_limit: int = Field(default=10)
+    crawl_max_connections: int = Field(default=20)
+    crawl_per_host_concurrency: int = Field(default=4)
+    crawl_http2: bool = Field(default=True)
+    crawl_feed_cache_enabled: bool = Field(default=True)
+    crawl_incremental: bool = Field(default=False)
     
     @property
     def output_path(self) -> Path:
@@ -1,14 +1,53 @@
+import argparse
+import asyncio
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
 from config.settings import settings
+from src.pipeline import ShortsPipeline
+from src.pipeline.journal import RUN_ID_PATTERN
 from src.utils.logger import setup_logger, get_logger
 
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="YouTube Shorts 자동 생성 파이프라인")
+    parser.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        help="이전 실행을 이어서 진행 (output/runs/<RUN_ID>)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="이전 실행 이후의 새 뉴스만 수집 (output/state/crawl_watermarks.json)",
+    )
+    parser.add_argument(
+        "--upload",
+        action="store_true",
+        help="생성한 쇼츠를 YouTube에 업로드 (OAuth 인증 필요)",
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="렌더 인코더 설정 벤치마크 후 output/render_profile.json 기록",
+    )
+    args = parser.parse_args()
+    
+    if args.resume and not RUN_ID_PATTERN.fullmatch(args.resume):
+        parser.error(f"잘못된 실행 ID입니다 (영문, 숫자, _, -만 사용): {args.resume}")
+    return args
+
+
 def main():
+    args = parse_args()
     config = settings()
+    
+    if args.benchmark:
+        from src.media.benchmark import main as run_benchmark
+        sys.exit(run_benchmark([]))
+    
     setup_logger(log_level=config.log_level)
     logger = get_logger("main")
     
@@ -17,7 +56,22 @@ def main():
     logger.info("=" * 50)
     
     try:
-        # TODO: 파이프라인 단계별 실행
+        pipeline = ShortsPipeline(
+            incremental=args.incremental or None,
+            upload=args.upload or None,
+        )
+        result = asyncio.run(pipeline.run(resume_run_id=args.resume))
+        
+        logger.info(
+            f"Shorts: {len(result.shorts_videos)}, uploads: {len(result.upload_results)}, "
+            f"duration: {result.duration:.1f}s"
+        )
+        for error in result.errors:
+            logger.error(f"Pipeline error: {error}")
+        
+        if not result.success:
+            sys.exit(1)
+        
         logger.info("Pipeline completed successfully!")
         
     except Exception as e:
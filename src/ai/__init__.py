@@ -1,5 +1,5 @@
-from src.ai.client import OpenAIClient
+from src.ai.client import OpenAIClient, ResponseCache
 from src.ai.selector import NewsSelector
-from src.ai.script_writer import ScriptWriter
+from src.ai.script_writer import ScriptStreamError, ScriptWriter
 
-__all__ = ["OpenAIClient", "NewsSelector", "ScriptWriter"]
+__all__ = ["OpenAIClient", "ResponseCache", "NewsSelector", "ScriptStreamError", "ScriptWriter"]
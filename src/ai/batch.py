@@ -0,0 +1,210 @@
+import asyncio
+import json
+import time
+from typing import Any, Optional
+
+import httpx
+
+from config.settings import settings
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+DEFAULT_BASE_URL = "https://api.openai.com/v1"
+FINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+# 끝난 요청의 결과 파일이 남는 종료 상태 (처리되지 못한 요청만 다시 제출)
+PARTIAL_STATUSES = {"expired", "cancelled"}
+# 다시 제출하면 성공할 수 있는 요청별 실패 (응답 없음은 만료/취소로 처리되지 못한 요청)
+RETRYABLE_STATUS_CODES = {None, 408, 409, 429, 500, 502, 503, 504}
+
+
+class BatchError(Exception):
+    """Batch API 작업 실패"""
+
+
+class BatchClient:
+    """OpenAI Batch API 클라이언트
+    
+    요청들을 JSONL 파일로 올리고 배치를 생성한 뒤, 완료될 때까지 폴링해서
+    custom_id별 응답을 돌려줍니다. 실시간 API보다 처리량 한도가 크고 저렴해
+    야간 백필처럼 지연이 중요하지 않은 대량 작업에 씁니다. 오류 파일에 남은
+    일시적 실패 요청은 새 배치로 다시 제출합니다.
+    """
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        poll_interval: Optional[float] = None,
+        completion_window: str = "24h",
+        client: Optional[httpx.AsyncClient] = None,
+        max_retries: int = 1,
+    ):
+        config = settings()
+        self.api_key = api_key or config.openai_api_key
+        self.base_url = (base_url or config.openai_base_url or DEFAULT_BASE_URL).rstrip("/")
+        self.poll_interval = poll_interval or config.openai_batch_poll_interval
+        self.completion_window = completion_window
+        self.client = client
+        self.max_retries = max_retries
+    
+    @property
+    def _headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.api_key}"}
+    
+    async def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        url = f"{self.base_url}{path}"
+        if self.client is not None:
+            response = await self.client.request(method, url, headers=self._headers, **kwargs)
+        else:
+            async with httpx.AsyncClient(timeout=60.0) as client:
+                response = await client.request(method, url, headers=self._headers, **kwargs)
+        response.raise_for_status()
+        return response
+    
+    async def submit(self, requests: list[dict], endpoint: str = "/v1/chat/completions") -> str:
+        """요청 JSONL을 업로드하고 배치를 생성합니다.
+        
+        Args:
+            requests: {"custom_id", "method", "url", "body"} 형식의 요청 리스트
+            endpoint: 배치 대상 엔드포인트
+        
+        Returns:
+            배치 ID
+        """
+        jsonl = "\n".join(json.dumps(request, ensure_ascii=False) for request in requests)
+        
+        upload = await self._request(
+            "POST",
+            "/files",
+            data={"purpose": "batch"},
+            files={"file": ("batch.jsonl", jsonl.encode("utf-8"), "application/jsonl")},
+        )
+        file_id = upload.json()["id"]
+        
+        created = await self._request(
+            "POST",
+            "/batches",
+            json={
+                "input_file_id": file_id,
+                "endpoint": endpoint,
+                "completion_window": self.completion_window,
+            },
+        )
+        batch_id = created.json()["id"]
+        
+        logger.info(f"Submitted batch {batch_id} ({len(requests)} requests)")
+        return batch_id
+    
+    async def wait(self, batch_id: str, timeout: Optional[float] = None) -> dict[str, Any]:
+        """배치가 끝날 때까지 폴링합니다.
+        
+        만료/취소된 배치도 끝난 요청의 결과가 남아 있으므로 그대로 반환합니다.
+        
+        Raises:
+            BatchError: 배치가 실패했거나(입력 검증 실패 등) timeout을 넘긴 경우
+        """
+        started = time.monotonic()
+        
+        while True:
+            batch = (await self._request("GET", f"/batches/{batch_id}")).json()
+            status = batch.get("status")
+            counts = batch.get("request_counts") or {}
+            logger.debug(
+                f"Batch {batch_id}: {status} "
+                f"({counts.get('completed', 0)}/{counts.get('total', 0)})"
+            )
+            
+            if status == "completed":
+                return batch
+            if status in PARTIAL_STATUSES:
+                logger.warning(
+                    f"Batch {batch_id} {status} with "
+                    f"{counts.get('completed', 0)}/{counts.get('total', 0)} requests done"
+                )
+                return batch
+            if status in FINAL_STATUSES:
+                raise BatchError(f"배치 {batch_id}가 {status} 상태로 종료되었습니다")
+            if timeout is not None and time.monotonic() - started > timeout:
+                raise BatchError(f"배치 {batch_id} 대기 시간 초과 ({timeout:.0f}초)")
+            
+            await asyncio.sleep(self.poll_interval)
+    
+    async def _read_file(self, file_id: Optional[str]) -> list[dict]:
+        """결과/오류 JSONL 파일을 내려받아 레코드 리스트로 반환합니다."""
+        if not file_id:
+            return []
+        content = (await self._request("GET", f"/files/{file_id}/content")).text
+        return [json.loads(line) for line in content.splitlines() if line.strip()]
+    
+    async def results(self, batch: dict[str, Any]) -> tuple[dict[str, dict], dict[str, dict]]:
+        """끝난 배치의 custom_id별 응답 본문과 실패한 요청을 반환합니다.
+        
+        실패한 요청은 결과 파일(200이 아닌 응답)과 오류 파일(error_file_id)에서 모읍니다.
+        만료/취소된 배치에서 어느 파일에도 없는 요청은 호출자가 처리되지 않은 것으로 봅니다.
+        
+        Returns:
+            (custom_id별 응답 본문, custom_id별 실패 레코드)
+        """
+        results: dict[str, dict] = {}
+        failures: dict[str, dict] = {}
+        
+        records = await self._read_file(batch.get("output_file_id"))
+        records += await self._read_file(batch.get("error_file_id"))
+        for record in records:
+            response = record.get("response") or {}
+            if response.get("status_code") == 200:
+                results[record["custom_id"]] = response["body"]
+            else:
+                failures[record["custom_id"]] = record
+        
+        return results, failures
+    
+    async def run(
+        self,
+        requests: list[dict],
+        timeout: Optional[float] = None,
+    ) -> dict[str, dict]:
+        """제출, 완료 대기, 결과 수집을 한 번에 수행합니다.
+        
+        일시적으로 실패했거나 배치 만료/취소로 처리되지 못한 요청은 max_retries번까지
+        새 배치로 다시 제출하고, 끝내 실패한 요청은 결과에서 빠집니다.
+        """
+        results: dict[str, dict] = {}
+        pending = requests
+        
+        for attempt in range(self.max_retries + 1):
+            batch_id = await self.submit(pending)
+            batch = await self.wait(batch_id, timeout=timeout)
+            succeeded, failures = await self.results(batch)
+            results.update(succeeded)
+            
+            for request in pending:
+                custom_id = request["custom_id"]
+                if custom_id not in succeeded and custom_id not in failures:
+                    failures[custom_id] = {
+                        "custom_id": custom_id,
+                        "error": f"batch {batch.get('status')}",
+                    }
+            
+            retry_ids = set()
+            for custom_id, record in failures.items():
+                response = record.get("response") or {}
+                status_code = response.get("status_code")
+                retryable = status_code in RETRYABLE_STATUS_CODES and attempt < self.max_retries
+                logger.warning(
+                    f"Batch request {custom_id} failed ({status_code}): "
+                    f"{record.get('error') or response.get('body')}"
+                    f"{', retrying' if retryable else ''}"
+                )
+                if retryable:
+                    retry_ids.add(custom_id)
+            
+            pending = [request for request in pending if request["custom_id"] in retry_ids]
+            if not pending:
+                break
+        
+        logger.info(f"Batch completed: {len(results)}/{len(requests)} succeeded")
+        return results
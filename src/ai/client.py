@@ -1,22 +1,131 @@
 import json
-from typing import Any
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Optional
 
+import openai
 from openai import AsyncOpenAI
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 
 from config.settings import settings
+from config.prompts import STRUCTURED_RETRY_USER
+from src.ai.batch import DEFAULT_BASE_URL
+from src.ai.rate_limit import RateLimiter, rate_limiter
+from src.ai.structured import json_schema_format, parse_json, parse_structured
+from src.utils.cache import CacheStats, DiskCache, make_cache_key
 from src.utils.logger import get_logger
 
 
 logger = get_logger(__name__)
 
 
+class ResponseCache:
+    """GPT 응답 캐시 (콘텐츠 주소 기반)
+    
+    (model, 시스템 프롬프트, 사용자 프롬프트, temperature, max_tokens) 해시를 키로
+    응답 텍스트를 디스크에 저장합니다. 실패한 실행을 다시 돌릴 때 같은 프롬프트의
+    API 호출을 건너뜁니다. 호출자가 검증 함수를 주면 통과한 응답만 저장하므로
+    잘못된 응답이 TTL 동안 재생되지 않습니다.
+    """
+    
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl_hours: Optional[float] = None,
+        max_size_mb: Optional[float] = None,
+    ):
+        config = settings()
+        ttl_hours = config.ai_cache_ttl_hours if ttl_hours is None else ttl_hours
+        
+        self.store = DiskCache(
+            cache_dir=cache_dir or config.output_path / "cache" / "openai",
+            max_size_mb=max_size_mb or config.ai_cache_max_mb,
+            ttl_seconds=ttl_hours * 3600 if ttl_hours > 0 else None,
+            suffix=".json",
+        )
+    
+    @property
+    def stats(self) -> CacheStats:
+        return self.store.stats
+    
+    @staticmethod
+    def make_key(
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float,
+        max_tokens: int,
+        response_format: Optional[dict] = None,
+    ) -> str:
+        parts = [model, system_prompt, user_prompt, temperature, max_tokens]
+        if response_format is not None:
+            parts.append(response_format)
+        return make_cache_key(*parts)
+    
+    def get(self, key: str) -> Optional[str]:
+        data = self.store.get_bytes(key)
+        if data is None:
+            return None
+        
+        try:
+            return json.loads(data)["content"]
+        except (ValueError, KeyError) as e:
+            logger.warning(f"Corrupted response cache entry {key[:12]}: {e}")
+            return None
+    
+    def set(self, key: str, content: str) -> None:
+        payload = json.dumps({"content": content}, ensure_ascii=False)
+        self.store.put_bytes(key, payload.encode("utf-8"))
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """429, 5xx, 타임아웃, 연결 오류만 재시도"""
+    if isinstance(error, (openai.RateLimitError, openai.APITimeoutError, openai.APIConnectionError)):
+        return True
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code >= 500
+    return False
+
+
+def _parses_as_json(response: str) -> bool:
+    try:
+        parse_json(response)
+        return True
+    except ValueError:
+        return False
+
+
+def _estimate_tokens(system_prompt: str, user_prompt: str, max_tokens: int) -> int:
+    """요청 토큰 수 추정 (한국어는 대략 2자당 1토큰, 출력 한도 포함)"""
+    return (len(system_prompt) + len(user_prompt)) // 2 + max_tokens
+
+
 class OpenAIClient:
     """OpenAI API 클라이언트"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        cache: Optional[ResponseCache] = None,
+        limiter: Optional[RateLimiter] = None,
+    ):
         config = settings()
-        self.client = AsyncOpenAI(api_key=config.openai_api_key)
+        # 재시도는 리미터와 함께 여기서 처리하므로 SDK 자체 재시도는 끔
+        self.client = AsyncOpenAI(
+            api_key=config.openai_api_key,
+            base_url=config.openai_base_url or DEFAULT_BASE_URL,
+            max_retries=0,
+        )
         self.model = config.openai_model
+        self.max_retries = config.openai_max_retries
+        self.limiter = limiter or rate_limiter()
+        
+        if cache is None and config.ai_cache_enabled:
+            cache = ResponseCache()
+        self.cache = cache
     
     async def chat(
         self,
@@ -24,26 +133,204 @@ class OpenAIClient:
         user_prompt: str,
         temperature: float = 0.7,
         max_tokens: int = 2000,
+        response_format: Optional[dict] = None,
+        validate: Optional[Callable[[str], bool]] = None,
     ) -> str:
-        """GPT 채팅 완성 요청"""
+        """GPT 채팅 완성 요청
         
-        logger.debug(f"OpenAI request: model={self.model}, temp={temperature}")
+        validate가 주어지면 통과한 응답만 캐시에 저장하고 캐시에서 읽습니다.
+        """
         
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            temperature=temperature,
-            max_tokens=max_tokens,
+        cache_key, cached = self._lookup_cache(
+            system_prompt, user_prompt, temperature, max_tokens, response_format, validate
         )
+        if cached is not None:
+            return cached
+        
+        logger.debug(f"OpenAI request: model={self.model}, temp={temperature}")
+        
+        estimated_tokens = _estimate_tokens(system_prompt, user_prompt, max_tokens)
+        
+        async for attempt in self._retrying():
+            with attempt:
+                response = await self._create(
+                    system_prompt, user_prompt, temperature, max_tokens,
+                    estimated_tokens, response_format,
+                )
         
         content = response.choices[0].message.content
         logger.debug(f"OpenAI response: {len(content)} chars")
         
+        self._store_cache(cache_key, content, validate)
+        
         return content
     
+    async def chat_stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        response_format: Optional[dict] = None,
+        validate: Optional[Callable[[str], bool]] = None,
+    ) -> AsyncIterator[str]:
+        """GPT 채팅 완성 스트리밍 요청
+        
+        validate가 주어지면 스트림이 끝난 뒤 전체 응답이 통과할 때만 캐시에 저장합니다.
+        
+        Yields:
+            생성되는 텍스트 조각 (캐시 적중 시 전체 응답 한 번)
+        """
+        
+        cache_key, cached = self._lookup_cache(
+            system_prompt, user_prompt, temperature, max_tokens, response_format, validate
+        )
+        if cached is not None:
+            yield cached
+            return
+        
+        logger.debug(f"OpenAI stream request: model={self.model}, temp={temperature}")
+        
+        estimated_tokens = _estimate_tokens(system_prompt, user_prompt, max_tokens)
+        extra = {"response_format": response_format} if response_format else {}
+        
+        # 재시도는 스트림 연결까지만 (토큰을 내보낸 뒤에는 되돌릴 수 없음)
+        async for attempt in self._retrying():
+            with attempt:
+                await self.limiter.acquire(estimated_tokens)
+                try:
+                    stream = await self.client.chat.completions.create(
+                        model=self.model,
+                        messages=[
+                            {"role": "system", "content": system_prompt},
+                            {"role": "user", "content": user_prompt},
+                        ],
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        stream=True,
+                        **extra,
+                    )
+                except openai.RateLimitError as e:
+                    delay = self.limiter.pause(e.response.headers)
+                    logger.warning(f"OpenAI rate limited, pausing requests for {delay:.1f}s")
+                    raise
+        
+        parts = []
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                parts.append(delta)
+                yield delta
+        
+        content = "".join(parts)
+        logger.debug(f"OpenAI stream response: {len(content)} chars")
+        
+        self._store_cache(cache_key, content, validate)
+    
+    def _lookup_cache(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float,
+        max_tokens: int,
+        response_format: Optional[dict],
+        validate: Optional[Callable[[str], bool]] = None,
+    ) -> tuple[Optional[str], Optional[str]]:
+        """(캐시 키, 캐시된 응답)을 반환합니다. 캐시가 꺼져 있으면 (None, None).
+        
+        검증에 실패하는 캐시 항목(검증 도입 전에 저장된 응답 등)은 없는 것으로 봅니다.
+        """
+        if self.cache is None:
+            return None, None
+        
+        cache_key = self.cache.make_key(
+            self.model, system_prompt, user_prompt, temperature, max_tokens,
+            response_format,
+        )
+        cached = self.cache.get(cache_key)
+        if cached is not None and validate is not None and not validate(cached):
+            logger.warning(f"Ignoring invalid cached response {cache_key[:12]}")
+            cached = None
+        if cached is not None:
+            logger.debug(
+                f"OpenAI cache hit ({self.cache.stats.hits} hits / "
+                f"{self.cache.stats.misses} misses)"
+            )
+        return cache_key, cached
+    
+    def _store_cache(
+        self,
+        cache_key: Optional[str],
+        content: str,
+        validate: Optional[Callable[[str], bool]],
+    ) -> None:
+        if cache_key is None:
+            return
+        if validate is not None and not validate(content):
+            logger.debug(f"Not caching invalid response {cache_key[:12]}")
+            return
+        self.cache.set(cache_key, content)
+    
+    def _retrying(self) -> AsyncRetrying:
+        """429/5xx/타임아웃에 지터가 있는 지수 백오프로 재시도"""
+        return AsyncRetrying(
+            retry=retry_if_exception(_is_retryable),
+            wait=wait_random_exponential(multiplier=1, max=60),
+            stop=stop_after_attempt(self.max_retries + 1),
+            before_sleep=self._log_retry,
+            reraise=True,
+        )
+    
+    async def _create(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float,
+        max_tokens: int,
+        estimated_tokens: int,
+        response_format: Optional[dict] = None,
+    ):
+        """리미터를 거쳐 한 번 요청하고, 응답 헤더로 리미터를 보정합니다."""
+        await self.limiter.acquire(estimated_tokens)
+        
+        extra = {"response_format": response_format} if response_format else {}
+        
+        try:
+            raw = await self.client.chat.completions.with_raw_response.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **extra,
+            )
+        except openai.RateLimitError as e:
+            delay = self.limiter.pause(e.response.headers)
+            logger.warning(f"OpenAI rate limited, pausing requests for {delay:.1f}s")
+            raise
+        
+        response = raw.parse()
+        
+        if "x-ratelimit-remaining-tokens" in raw.headers:
+            self.limiter.update_from_headers(raw.headers)
+        elif response.usage:
+            # 헤더가 없으면 실제 사용량으로 예상치를 보정
+            self.limiter.reconcile(estimated_tokens, response.usage.total_tokens)
+        
+        return response
+    
+    @staticmethod
+    def _log_retry(retry_state) -> None:
+        error = retry_state.outcome.exception()
+        logger.warning(
+            f"OpenAI request failed ({type(error).__name__}), "
+            f"retry {retry_state.attempt_number} in {retry_state.next_action.sleep:.1f}s"
+        )
+    
     async def chat_json(
         self,
         system_prompt: str,
@@ -58,24 +345,77 @@ class OpenAIClient:
             user_prompt=user_prompt,
             temperature=temperature,
             max_tokens=max_tokens,
+            response_format={"type": "json_object"},
+            validate=_parses_as_json,
         )
         
-        # JSON 파싱 시도
+        # JSON 파싱 시도 (코드 펜스 제거, 잘린 응답은 로컬 복구)
         try:
-            # ```json ... ``` 블록 제거
-            content = response.strip()
-            if content.startswith("```json"):
-                content = content[7:]
-            if content.startswith("```"):
-                content = content[3:]
-            if content.endswith("```"):
-                content = content[:-3]
-            
-            return json.loads(content.strip())
+            return parse_json(response)
             
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             logger.error(f"JSON parse error: {e}")
             logger.debug(f"Raw response: {response}")
             raise ValueError(f"GPT 응답을 JSON으로 파싱할 수 없습니다: {e}")
-
-
+    
+    async def chat_structured(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        schema_name: str,
+        schema: dict,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+    ) -> dict[str, Any]:
+        """스키마를 강제한 JSON 응답 요청
+        
+        스키마 강제 모드(json_schema)로 요청하고, 파싱 실패 시 로컬에서 복구합니다.
+        그래도 스키마에 맞지 않으면 오류 내용을 알려주는 재요청을 한 번만 보냅니다.
+        
+        Raises:
+            ValueError: 재요청 후에도 유효한 JSON을 얻지 못한 경우
+        """
+        
+        if settings().openai_structured_output:
+            response_format = json_schema_format(schema_name, schema)
+        else:
+            response_format = {"type": "json_object"}
+        
+        def validate(response: str) -> bool:
+            return not parse_structured(response, schema)[1]
+        
+        response = await self.chat(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            response_format=response_format,
+            validate=validate,
+        )
+        
+        data, errors = parse_structured(response, schema)
+        if not errors:
+            return data
+        
+        logger.warning(f"Invalid structured response ({schema_name}): {errors[:3]}")
+        
+        retry_prompt = STRUCTURED_RETRY_USER.format(
+            user_prompt=user_prompt,
+            errors="\n".join(f"- {error}" for error in errors[:10]),
+            response=response[:4000],
+        )
+        response = await self.chat(
+            system_prompt=system_prompt,
+            user_prompt=retry_prompt,
+            temperature=0.0,
+            max_tokens=max_tokens,
+            response_format=response_format,
+            validate=validate,
+        )
+        
+        data, errors = parse_structured(response, schema)
+        if errors:
+            logger.debug(f"Raw response: {response}")
+            raise ValueError(f"GPT 응답이 스키마({schema_name})와 맞지 않습니다: {errors[:3]}")
+        
+        return data
@@ -0,0 +1,162 @@
+import asyncio
+import re
+import time
+from typing import Awaitable, Callable, Mapping, Optional
+
+from config.settings import settings
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+_DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_reset_duration(value: str) -> Optional[float]:
+    """'6m0s', '1.5s', '20ms' 형식의 리셋 시간을 초로 변환"""
+    if not value:
+        return None
+    
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    
+    matches = _DURATION_PATTERN.findall(value)
+    if not matches:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in matches)
+
+
+class TokenBucket:
+    """분당 한도를 초당 보충량으로 환산한 토큰 버킷"""
+    
+    def __init__(self, per_minute: float, clock: Callable[[], float] = time.monotonic):
+        self.capacity = float(per_minute)
+        self.tokens = float(per_minute)
+        self.clock = clock
+        self.updated = clock()
+    
+    @property
+    def refill_rate(self) -> float:
+        return self.capacity / 60.0
+    
+    def refill(self) -> None:
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_rate)
+        self.updated = now
+    
+    def wait_time(self, amount: float) -> float:
+        # 한 번의 요청이 버킷 크기보다 크면 가득 찬 버킷으로 처리
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.refill_rate
+    
+    def set_limit(self, per_minute: float) -> None:
+        if per_minute > 0 and per_minute != self.capacity:
+            self.capacity = float(per_minute)
+            self.tokens = min(self.tokens, self.capacity)
+    
+    def set_remaining(self, remaining: float) -> None:
+        # 서버 기준 잔량이 더 적으면 그에 맞춤 (다른 프로세스와 쿼터를 공유하는 경우)
+        self.tokens = min(self.tokens, float(remaining))
+
+
+class RateLimiter:
+    """OpenAI 요청 수/토큰 수 분당 한도 리미터
+    
+    요청 전 예상 토큰만큼 버킷에서 차감하고, 응답의 x-ratelimit-* 헤더로
+    한도와 잔량을 보정합니다. 429를 받으면 retry-after 동안 모든 요청을 멈춥니다.
+    clock/sleep은 테스트에서 가짜 시계를 넣을 때만 바꿉니다.
+    """
+    
+    def __init__(
+        self,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        self.clock = clock
+        self.sleep = sleep
+        self.requests = TokenBucket(requests_per_minute, clock)
+        self.tokens = TokenBucket(tokens_per_minute, clock)
+        self._paused_until = 0.0
+    
+    async def acquire(self, estimated_tokens: int) -> None:
+        """요청 1회와 예상 토큰만큼의 여유가 생길 때까지 대기합니다."""
+        while True:
+            now = self.clock()
+            if now < self._paused_until:
+                await self.sleep(self._paused_until - now)
+                continue
+            
+            self.requests.refill()
+            self.tokens.refill()
+            wait = max(self.requests.wait_time(1), self.tokens.wait_time(estimated_tokens))
+            
+            if wait <= 0:
+                # 검사와 차감 사이에 await가 없으므로 코루틴 간 경합 없음
+                self.requests.tokens -= 1
+                self.tokens.tokens -= min(estimated_tokens, self.tokens.capacity)
+                return
+            
+            logger.debug(f"Rate limiter waiting {wait:.2f}s")
+            await self.sleep(wait)
+    
+    def reconcile(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """실제 사용 토큰과 예상치의 차이를 돌려주거나 추가 차감합니다."""
+        self.tokens.tokens = min(
+            self.tokens.capacity,
+            self.tokens.tokens + (estimated_tokens - actual_tokens),
+        )
+    
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """응답 헤더의 한도/잔량으로 버킷을 보정합니다."""
+        for bucket, kind in ((self.requests, "requests"), (self.tokens, "tokens")):
+            limit = headers.get(f"x-ratelimit-limit-{kind}")
+            remaining = headers.get(f"x-ratelimit-remaining-{kind}")
+            try:
+                if limit:
+                    bucket.set_limit(float(limit))
+                if remaining:
+                    bucket.refill()
+                    bucket.set_remaining(float(remaining))
+            except ValueError:
+                continue
+    
+    def pause(self, headers: Optional[Mapping[str, str]] = None, default: float = 1.0) -> float:
+        """429 응답 후 retry-after(또는 리셋 시간)만큼 모든 요청을 멈춥니다."""
+        delay = None
+        if headers:
+            delay = parse_reset_duration(headers.get("retry-after", ""))
+            if delay is None:
+                resets = [
+                    parse_reset_duration(headers.get(f"x-ratelimit-reset-{kind}", ""))
+                    for kind in ("requests", "tokens")
+                ]
+                resets = [value for value in resets if value]
+                delay = max(resets) if resets else None
+        
+        delay = delay if delay is not None else default
+        self._paused_until = max(self._paused_until, self.clock() + delay)
+        self.requests.tokens = 0.0
+        return delay
+
+
+_rate_limiter: RateLimiter | None = None
+
+
+def rate_limiter() -> RateLimiter:
+    """프로세스 전체가 공유하는 리미터 (쿼터는 API 키 단위)"""
+    global _rate_limiter
+    if _rate_limiter is None:
+        config = settings()
+        _rate_limiter = RateLimiter(
+            requests_per_minute=config.openai_requests_per_minute,
+            tokens_per_minute=config.openai_tokens_per_minute,
+        )
+    return _rate_limiter
@@ -1,24 +1,42 @@
+import asyncio
+from typing import AsyncIterator, Literal, Optional
+
+from src.ai.batch import BatchClient
 from src.ai.client import OpenAIClient
-from src.models import SelectedNews, Script
+from src.ai.structured import StreamingFieldParser, json_schema_format, parse_structured
+from src.models import SelectedNews, Script, ScriptSegment
 from src.utils.logger import get_logger
-from config.prompts import SCRIPT_GENERATION_SYSTEM, SCRIPT_GENERATION_USER
+from config.prompts import (
+    SCRIPT_GENERATION_SCHEMA,
+    SCRIPT_GENERATION_SYSTEM,
+    SCRIPT_GENERATION_USER,
+)
+from config.settings import settings
 
 
 logger = get_logger(__name__)
 
 
+SCRIPT_SEGMENTS = ("hook", "body", "outro")
+
+
+class ScriptStreamError(ValueError):
+    """스트리밍 응답을 복구해도 유효한 스크립트가 아님 (이미 받은 구간은 버려야 함)"""
+
+
 class ScriptWriter:
     """GPT를 사용하여 쇼츠 스크립트를 생성"""
     
-    def __init__(self):
+    def __init__(self, batch_client: Optional[BatchClient] = None):
         self.client = OpenAIClient()
+        self.batch_client = batch_client
     
     async def write(self, selected_news: SelectedNews) -> Script:
         """선별된 뉴스를 바탕으로 쇼츠 스크립트를 생성합니다.
         
         Args:
             selected_news: 선별된 뉴스 정보
-            
+        
         Returns:
             생성된 스크립트
         """
@@ -26,32 +44,18 @@ class ScriptWriter:
         news = selected_news.news_item
         logger.info(f"Writing script for: {news.title[:50]}...")
         
-        user_prompt = SCRIPT_GENERATION_USER.format(
-            title=news.title,
-            summary=news.summary or "요약 없음",
-            url=news.url,
-            hook_idea=selected_news.hook_idea,
-        )
+        user_prompt = self._build_prompt(selected_news)
         
         try:
-            result = await self.client.chat_json(
+            result = await self.client.chat_structured(
                 system_prompt=SCRIPT_GENERATION_SYSTEM,
                 user_prompt=user_prompt,
+                schema_name="shorts_script",
+                schema=SCRIPT_GENERATION_SCHEMA,
                 temperature=0.7,
             )
             
-            script_data = result.get("script", {})
-            
-            script = Script(
-                title=result.get("title", news.title),
-                hook=script_data.get("hook", ""),
-                body=script_data.get("body", ""),
-                outro=script_data.get("outro", ""),
-                full_script=result.get("full_script", ""),
-                keywords=result.get("keywords", []),
-                hashtags=result.get("hashtags", []),
-                description=result.get("description", ""),
-            )
+            script = self._build_script(result, news.title)
             
             logger.info(
                 f"Script generated: {script.character_count} chars, "
@@ -64,22 +68,184 @@ class ScriptWriter:
             logger.error(f"Script generation failed: {e}")
             raise
     
+    async def write_stream(self, selected_news: SelectedNews) -> AsyncIterator[ScriptSegment]:
+        """스크립트를 스트리밍으로 생성하며 완성된 구간부터 내보냅니다.
+        
+        hook, body, outro 순으로 각 구간이 완성되는 즉시 내보내므로
+        나머지를 생성하는 동안 훅 음성 합성을 시작할 수 있습니다.
+        
+        Args:
+            selected_news: 선별된 뉴스 정보
+        
+        Yields:
+            ScriptSegment (hook, body, outro, 마지막으로 전체 Script를 담은 complete)
+        
+        Raises:
+            ScriptStreamError: 응답을 로컬 복구해도 스키마에 맞지 않을 때. 다른 생성
+                결과와 섞이지 않도록 재요청하지 않으므로, 호출자는 이미 받은 구간을
+                버리고 write()로 다시 생성해야 합니다.
+        """
+        
+        news = selected_news.news_item
+        logger.info(f"Streaming script for: {news.title[:50]}...")
+        
+        user_prompt = self._build_prompt(selected_news)
+        
+        if settings().openai_structured_output:
+            response_format = json_schema_format("shorts_script", SCRIPT_GENERATION_SCHEMA)
+        else:
+            response_format = {"type": "json_object"}
+        
+        parser = StreamingFieldParser(list(SCRIPT_SEGMENTS))
+        parts = []
+        
+        async for delta in self.client.chat_stream(
+            system_prompt=SCRIPT_GENERATION_SYSTEM,
+            user_prompt=user_prompt,
+            temperature=0.7,
+            response_format=response_format,
+            validate=lambda content: not parse_structured(content, SCRIPT_GENERATION_SCHEMA)[1],
+        ):
+            parts.append(delta)
+            for name, text in parser.feed(delta):
+                logger.debug(f"Script segment ready: {name} ({len(text)} chars)")
+                yield ScriptSegment(name=name, text=text)
+        
+        # 같은 응답을 복구해서 마무리 (parse_structured가 잘린 꼬리를 repair_json으로 복구)
+        result, errors = parse_structured("".join(parts), SCRIPT_GENERATION_SCHEMA)
+        
+        if errors:
+            logger.warning(f"Streamed script invalid: {errors[:3]}")
+            raise ScriptStreamError(f"Streamed script invalid: {errors[:3]}")
+        
+        script = self._build_script(result, news.title)
+        
+        for name in parser.pending:
+            yield ScriptSegment(name=name, text=getattr(script, name))
+        
+        logger.info(
+            f"Script streamed: {script.character_count} chars, "
+            f"~{script.estimated_duration:.1f}s"
+        )
+        yield ScriptSegment(name="complete", text=script.full_script, script=script)
+    
+    def _build_prompt(self, selected_news: SelectedNews) -> str:
+        news = selected_news.news_item
+        return SCRIPT_GENERATION_USER.format(
+            title=news.title,
+            summary=news.summary or "요약 없음",
+            url=news.url,
+            hook_idea=selected_news.hook_idea,
+        )
+    
+    @staticmethod
+    def _build_script(result: dict, fallback_title: str) -> Script:
+        """GPT 응답(JSON)을 Script로 변환"""
+        script_data = result.get("script", {})
+        
+        return Script(
+            title=result.get("title") or fallback_title,
+            hook=script_data.get("hook", ""),
+            body=script_data.get("body", ""),
+            outro=script_data.get("outro", ""),
+            full_script=result.get("full_script", ""),
+            keywords=result.get("keywords", []),
+            hashtags=result.get("hashtags", []),
+            description=result.get("description", ""),
+        )
+    
     async def write_batch(
         self,
         selected_news_list: list[SelectedNews],
-    ) -> list[Script]:
-        """여러 뉴스에 대해 스크립트를 일괄 생성합니다."""
-        
-        scripts = []
-        for selected in selected_news_list:
-            try:
-                script = await self.write(selected)
-                scripts.append(script)
-            except Exception as e:
-                logger.error(f"Failed to write script: {e}")
-                continue
-        
-        logger.info(f"Generated {len(scripts)} scripts")
+        max_concurrency: Optional[int] = None,
+        mode: Literal["realtime", "batch"] = "realtime",
+    ) -> list[Optional[Script]]:
+        """여러 뉴스에 대해 스크립트를 동시에 생성합니다.
+        
+        Args:
+            selected_news_list: 선별된 뉴스 리스트
+            max_concurrency: 동시 요청 수 (기본: settings().script_concurrency)
+            mode: realtime(실시간 API) 또는 batch(Batch API, 백필용)
+        
+        Returns:
+            입력과 같은 순서/길이의 스크립트 리스트 (실패한 항목은 None)
+        """
+        
+        if mode == "batch":
+            return await self._write_batch_offline(selected_news_list)
+        
+        limit = max_concurrency or settings().script_concurrency
+        semaphore = asyncio.Semaphore(max(1, limit))
+        
+        async def write_one(selected: SelectedNews) -> Optional[Script]:
+            async with semaphore:
+                try:
+                    return await self.write(selected)
+                except Exception as e:
+                    logger.error(f"Failed to write script: {e}")
+                    return None
+        
+        scripts = await asyncio.gather(*(write_one(s) for s in selected_news_list))
+        
+        logger.info(f"Generated {sum(s is not None for s in scripts)}/{len(scripts)} scripts")
+        return list(scripts)
+    
+    async def _write_batch_offline(
+        self,
+        selected_news_list: list[SelectedNews],
+        timeout: Optional[float] = None,
+    ) -> list[Optional[Script]]:
+        """Batch API로 스크립트를 일괄 생성합니다 (완료까지 폴링, 실패한 항목은 None)."""
+        
+        if not selected_news_list:
+            return []
+        
+        if self.batch_client is None:
+            self.batch_client = BatchClient()
+        
+        if settings().openai_structured_output:
+            response_format = json_schema_format("shorts_script", SCRIPT_GENERATION_SCHEMA)
+        else:
+            response_format = {"type": "json_object"}
+        
+        requests = [
+            {
+                "custom_id": f"script-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.client.model,
+                    "messages": [
+                        {"role": "system", "content": SCRIPT_GENERATION_SYSTEM},
+                        {"role": "user", "content": self._build_prompt(selected)},
+                    ],
+                    "temperature": 0.7,
+                    "max_tokens": 2000,
+                    "response_format": response_format,
+                },
+            }
+            for i, selected in enumerate(selected_news_list)
+        ]
+        
+        results = await self.batch_client.run(requests, timeout=timeout)
+        
+        scripts: list[Optional[Script]] = []
+        for i, selected in enumerate(selected_news_list):
+            script = None
+            body = results.get(f"script-{i}")
+            if body is None:
+                logger.error(f"Batch script missing for: {selected.news_item.title[:50]}")
+            else:
+                try:
+                    content = body["choices"][0]["message"]["content"]
+                    result, errors = parse_structured(content, SCRIPT_GENERATION_SCHEMA)
+                    if errors:
+                        raise ValueError(errors[:3])
+                    script = self._build_script(result, selected.news_item.title)
+                except Exception as e:
+                    logger.error(f"Failed to parse batch script: {e}")
+            scripts.append(script)
+        
+        generated = sum(script is not None for script in scripts)
+        logger.info(f"Generated {generated}/{len(scripts)} scripts via Batch API")
         return scripts
-
-
@@ -1,7 +1,11 @@
+from typing import Optional
+
 from src.ai.client import OpenAIClient
+from src.crawlers.dedup import NewsDeduplicator
+from src.crawlers.story_index import StoryIndex
 from src.models import NewsItem, SelectedNews
 from src.utils.logger import get_logger
-from config.prompts import NEWS_SELECTION_SYSTEM, NEWS_SELECTION_USER
+from config.prompts import NEWS_SELECTION_SCHEMA, NEWS_SELECTION_SYSTEM, NEWS_SELECTION_USER
 
 
 logger = get_logger(__name__)
@@ -10,8 +14,14 @@ logger = get_logger(__name__)
 class NewsSelector:
     """GPT를 사용하여 쇼츠에 적합한 뉴스를 선별"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        deduplicator: Optional[NewsDeduplicator] = None,
+        story_index: Optional[StoryIndex] = None,
+    ):
         self.client = OpenAIClient()
+        self.deduplicator = deduplicator or NewsDeduplicator()
+        self.story_index = story_index
     
     async def select(
         self,
@@ -23,7 +33,7 @@ class NewsSelector:
         Args:
             news_items: 뉴스 아이템 리스트
             count: 선별할 개수
-            
+        
         Returns:
             선별된 뉴스 리스트 (SelectedNews)
         """
@@ -32,6 +42,16 @@ class NewsSelector:
             logger.warning("No news items to select from")
             return []
         
+        # 이미 쇼츠로 만든 뉴스 제외
+        if self.story_index is not None:
+            news_items = self.story_index.filter_unseen(news_items)
+            if not news_items:
+                logger.warning("All news items were already covered")
+                return []
+        
+        # 소스 간 중복 기사를 먼저 묶어 프롬프트를 줄임
+        news_items = self.deduplicator.deduplicate(news_items)
+        
         logger.info(f"Selecting {count} news from {len(news_items)} items")
         
         # 뉴스 목록을 텍스트로 변환
@@ -44,9 +64,11 @@ class NewsSelector:
         )
         
         try:
-            result = await self.client.chat_json(
+            result = await self.client.chat_structured(
                 system_prompt=NEWS_SELECTION_SYSTEM,
                 user_prompt=user_prompt,
+                schema_name="news_selection",
+                schema=NEWS_SELECTION_SCHEMA,
                 temperature=0.5,
             )
             
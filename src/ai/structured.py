@@ -0,0 +1,207 @@
+import json
+import re
+from typing import Any
+
+
+_FENCE_PATTERN = re.compile(r"```(?:json)?\s*(.*?)(?:```|$)", re.DOTALL)
+
+_JSON_TYPES = {
+    "object": dict,
+    "array": list,
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "null": type(None),
+}
+
+
+def strip_code_fence(text: str) -> str:
+    """```json ... ``` 블록이 있으면 안쪽만 꺼냅니다."""
+    text = text.strip()
+    fence = text.find("```")
+    brace = text.find("{")
+    
+    # JSON 문자열 값 안의 ``` 는 건드리지 않음
+    if fence >= 0 and (brace < 0 or fence < brace):
+        match = _FENCE_PATTERN.search(text)
+        if match:
+            return match.group(1).strip()
+    return text
+
+
+def _close_json(text: str) -> tuple[str, list[int]]:
+    """열린 문자열/괄호를 닫은 JSON 문자열과, 잘라볼 수 있는 쉼표 위치를 반환합니다."""
+    out: list[str] = []
+    stack: list[str] = []
+    comma_positions: list[int] = []
+    in_string = False
+    escaped = False
+    
+    for ch in text:
+        if in_string:
+            out.append(ch)
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+        
+        if ch == '"':
+            in_string = True
+        elif ch in "{[":
+            stack.append("}" if ch == "{" else "]")
+        elif ch in "}]":
+            # 닫는 괄호 앞의 불필요한 쉼표 제거
+            while out and out[-1] in " \t\r\n":
+                out.pop()
+            if out and out[-1] == ",":
+                out.pop()
+            if stack:
+                stack.pop()
+            out.append(ch)
+            if not stack:
+                break
+            continue
+        elif ch == "," and stack:
+            comma_positions.append(len(out))
+        
+        out.append(ch)
+    
+    if in_string:
+        if escaped:
+            out.pop()
+        out.append('"')
+    
+    result = "".join(out).rstrip()
+    if result.endswith(","):
+        result = result[:-1]
+    elif result.endswith(":"):
+        result += " null"
+    
+    return result + "".join(reversed(stack)), comma_positions
+
+
+def repair_json(text: str) -> str:
+    """잘리거나 앞뒤에 설명이 붙은 JSON을 로컬에서 복구합니다.
+    
+    코드 펜스와 앞뒤 문장을 제거하고, 닫히지 않은 문자열/괄호를 닫고,
+    불필요한 쉼표를 지웁니다. 그래도 안 되면 마지막 항목부터 하나씩 잘라냅니다.
+    
+    Raises:
+        ValueError: 복구할 수 없는 경우
+    """
+    text = strip_code_fence(text)
+    starts = [i for i in (text.find("{"), text.find("[")) if i >= 0]
+    if not starts:
+        raise ValueError("JSON 시작 문자를 찾을 수 없습니다")
+    text = text[min(starts):]
+    
+    candidate, comma_positions = _close_json(text)
+    for cut in [None, *reversed(comma_positions)]:
+        if cut is not None:
+            candidate, _ = _close_json(text[:cut])
+        try:
+            json.loads(candidate)
+            return candidate
+        except json.JSONDecodeError:
+            continue
+    
+    raise ValueError("JSON을 복구할 수 없습니다")
+
+
+def parse_json(text: str) -> Any:
+    """JSON을 파싱하고, 실패하면 로컬 복구 후 다시 파싱합니다."""
+    try:
+        return json.loads(strip_code_fence(text))
+    except json.JSONDecodeError:
+        return json.loads(repair_json(text))
+
+
+def validate_schema(data: Any, schema: dict, path: str = "$") -> list[str]:
+    """JSON Schema의 기본 항목(type, required, properties, items)만 검사합니다.
+    
+    Returns:
+        오류 메시지 리스트 (비어 있으면 유효)
+    """
+    errors = []
+    
+    expected = schema.get("type")
+    if expected:
+        python_type = _JSON_TYPES[expected]
+        is_bool = isinstance(data, bool)
+        if not isinstance(data, python_type) or (is_bool and expected in ("integer", "number")):
+            return [f"{path}: {expected} 타입이어야 합니다"]
+    
+    if isinstance(data, dict):
+        for key in schema.get("required", []):
+            if key not in data:
+                errors.append(f"{path}.{key}: 필수 항목이 없습니다")
+        for key, sub_schema in schema.get("properties", {}).items():
+            if key in data:
+                errors.extend(validate_schema(data[key], sub_schema, f"{path}.{key}"))
+    
+    if isinstance(data, list) and "items" in schema:
+        for i, item in enumerate(data):
+            errors.extend(validate_schema(item, schema["items"], f"{path}[{i}]"))
+    
+    return errors
+
+
+def parse_structured(text: str, schema: dict) -> tuple[Any, list[str]]:
+    """JSON을 파싱(필요하면 복구)하고 스키마를 검사합니다.
+    
+    Returns:
+        (파싱 결과, 오류 메시지 리스트). 파싱에 실패하면 결과는 None
+    """
+    try:
+        data = parse_json(text)
+    except ValueError as e:
+        return None, [f"JSON 파싱 실패: {e}"]
+    return data, validate_schema(data, schema)
+
+
+class StreamingFieldParser:
+    """스트리밍 중인 JSON에서 완성된 문자열 필드를 순서대로 꺼냅니다.
+    
+    닫는 따옴표까지 도착한 필드만 반환하므로, 전체 응답을 기다리지 않고
+    앞쪽 필드(예: hook)를 먼저 사용할 수 있습니다.
+    """
+    
+    def __init__(self, fields: list[str]):
+        self.fields = fields
+        self.buffer = ""
+        self._next = 0
+        self._patterns = {
+            field: re.compile(rf'"{re.escape(field)}"\s*:\s*"((?:[^"\\]|\\.)*)"')
+            for field in fields
+        }
+    
+    def feed(self, text: str) -> list[tuple[str, str]]:
+        """텍스트 조각을 추가하고 새로 완성된 (필드, 값) 목록을 반환합니다."""
+        self.buffer += text
+        completed = []
+        
+        while self._next < len(self.fields):
+            field = self.fields[self._next]
+            match = self._patterns[field].search(self.buffer)
+            if not match:
+                break
+            completed.append((field, json.loads(f'"{match.group(1)}"')))
+            self._next += 1
+        
+        return completed
+    
+    @property
+    def pending(self) -> list[str]:
+        return self.fields[self._next:]
+
+
+def json_schema_format(name: str, schema: dict) -> dict:
+    """Chat Completions response_format (스키마 강제 모드)"""
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": name, "strict": True, "schema": schema},
+    }
@@ -1,5 +1,20 @@
 from src.crawlers.base import BaseCrawler
+from src.crawlers.dedup import NewsDeduplicator
+from src.crawlers.feed_cache import FeedCache
 from src.crawlers.google_news import GoogleNewsCrawler
 from src.crawlers.naver_news import NaverNewsCrawler
+from src.crawlers.orchestrator import CrawlJob, CrawlOrchestrator
+from src.crawlers.story_index import StoryIndex
+from src.crawlers.watermark import WatermarkStore
 
-__all__ = ["BaseCrawler", "GoogleNewsCrawler", "NaverNewsCrawler"]
+__all__ = [
+    "BaseCrawler",
+    "NewsDeduplicator",
+    "FeedCache",
+    "GoogleNewsCrawler",
+    "NaverNewsCrawler",
+    "CrawlJob",
+    "CrawlOrchestrator",
+    "StoryIndex",
+    "WatermarkStore",
+]
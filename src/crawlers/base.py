@@ -1,10 +1,29 @@
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from typing import AsyncIterator, Optional
+
+import httpx
+
+from src.crawlers.http_client import HostLimiter
+from src.crawlers.watermark import WatermarkStore
 from src.models import NewsItem
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
 
 
 class BaseCrawler(ABC):
     """뉴스 크롤러 베이스 클래스"""
     
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        limiter: Optional[HostLimiter] = None,
+    ):
+        self.client = client
+        self.limiter = limiter
+    
     @abstractmethod
     async def fetch(self, query: str = "", limit: int = 10) -> list[NewsItem]:
         """뉴스 목록을 가져옵니다.
@@ -12,7 +31,7 @@ class BaseCrawler(ABC):
         Args:
             query: 검색어 (빈 문자열이면 기본 IT/테크 뉴스)
             limit: 가져올 최대 개수
-            
+        
         Returns:
             NewsItem 리스트
         """
@@ -22,4 +41,70 @@ class BaseCrawler(ABC):
     def get_source_name(self) -> str:
         """크롤러 소스 이름 반환"""
         pass
-
+    
+    async def fetch_new(
+        self,
+        store: WatermarkStore,
+        query: Optional[str] = None,
+        limit: int = 10,
+    ) -> AsyncIterator[NewsItem]:
+        """워터마크 이후의 새 뉴스만 스트리밍합니다 (증분 크롤링).
+        
+        Args:
+            store: 소스/검색어별 워터마크 저장소
+            query: 검색어 (None이면 크롤러 기본값)
+            limit: 가져올 최대 개수
+        
+        Yields:
+            이전 크롤링에서 보지 못한 NewsItem
+        """
+        news_items = await (
+            self.fetch(limit=limit) if query is None else self.fetch(query=query, limit=limit)
+        )
+        
+        key = store.make_key(self.get_source_name(), query or "")
+        watermark = store.get(key)
+        seen = set(watermark.seen_urls)
+        
+        # 오래된 뉴스부터 워터마크를 전진시키기 위해 정렬
+        news_items = sorted(
+            news_items,
+            key=lambda item: item.published_at.timestamp() if item.published_at else 0.0,
+        )
+        
+        new_count = 0
+        try:
+            for item in news_items:
+                if not watermark.is_new(item, seen):
+                    continue
+                
+                seen.add(item.url)
+                watermark.advance(item, store.max_seen)
+                new_count += 1
+                yield item
+        finally:
+            store.save()
+            logger.info(
+                f"{self.get_source_name()} incremental crawl: "
+                f"{new_count} new of {len(news_items)} items"
+            )
+    
+    async def _get(
+        self,
+        url: str,
+        headers: Optional[dict[str, str]] = None,
+        timeout: float = 10.0,
+    ) -> httpx.Response:
+        """GET 요청을 보냅니다.
+        
+        주입된 공유 클라이언트가 있으면 커넥션을 재사용하고,
+        없으면 요청마다 일회용 클라이언트를 엽니다.
+        """
+        slot = self.limiter.slot(url) if self.limiter else nullcontext()
+        
+        async with slot:
+            if self.client is not None:
+                return await self.client.get(url, headers=headers, timeout=timeout)
+            
+            async with httpx.AsyncClient() as client:
+                return await client.get(url, headers=headers, timeout=timeout)
@@ -0,0 +1,265 @@
+import base64
+import re
+import zlib
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from src.models import NewsItem
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+TRACKING_PARAMS = {"fbclid", "gclid", "ref", "cmpid", "from"}
+
+# [단독], (종합), 【속보】 같은 머리말/꼬리말
+TITLE_TAG_PATTERN = re.compile(r"[\[\(【<〈][^\]\)】>〉]{1,10}[\]\)】>〉]")
+NON_WORD_PATTERN = re.compile(r"[^0-9a-z가-힣]+")
+
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+def _decode_google_news_id(article_id: str) -> Optional[str]:
+    """Google News 기사 ID(base64 protobuf)에서 원본 URL을 추출합니다.
+    
+    새로운 형식(AU_yqL...)은 암호화되어 있어 디코딩할 수 없으므로 None을 반환합니다.
+    """
+    try:
+        padded = article_id + "=" * (-len(article_id) % 4)
+        data = base64.urlsafe_b64decode(padded)
+    except Exception:
+        return None
+    
+    prefix = b"\x08\x13\x22"
+    if data.startswith(prefix):
+        data = data[len(prefix):]
+    
+    if not data:
+        return None
+    
+    # protobuf varint 길이 필드
+    length = data[0]
+    offset = 1
+    if length & 0x80:
+        if len(data) < 2:
+            return None
+        length = (length & 0x7F) | (data[1] << 7)
+        offset = 2
+    
+    raw = data[offset:offset + length]
+    try:
+        url = raw.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+    
+    return url if url.startswith(("http://", "https://")) else None
+
+
+def canonical_url(url: str) -> str:
+    """같은 기사를 가리키는 URL을 하나의 형태로 정규화합니다.
+    
+    - Google News 리다이렉트 링크를 원본 URL로 변환
+    - 네이버 뉴스 기사 URL을 oid/aid 기준으로 통일
+    - 스킴/호스트 소문자화, www./m. 제거, 추적 파라미터/프래그먼트 제거
+    """
+    if not url:
+        return ""
+    
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    
+    if host == "news.google.com":
+        query = dict(parse_qsl(parts.query))
+        if query.get("url"):
+            return canonical_url(query["url"])
+        
+        segments = [s for s in parts.path.split("/") if s]
+        if "articles" in segments and segments[-1] != "articles":
+            decoded = _decode_google_news_id(segments[-1])
+            if decoded:
+                return canonical_url(decoded)
+    
+    if host.endswith("news.naver.com"):
+        match = re.search(r"/article/(?:\d+/)?(\d+)/(\d+)", parts.path)
+        if match:
+            return f"naver:{match.group(1)}/{match.group(2)}"
+        query = dict(parse_qsl(parts.query))
+        if query.get("oid") and query.get("aid"):
+            return f"naver:{query['oid']}/{query['aid']}"
+    
+    for prefix in ("www.", "m."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    
+    params = sorted(
+        (k, v) for k, v in parse_qsl(parts.query)
+        if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    
+    return urlunsplit(("https", host, path, urlencode(params), ""))
+
+
+def normalize_title(title: str) -> str:
+    """비교용 제목 정규화 (머리말 제거, 소문자, 공백/문장부호 제거)
+    
+    한국어 기사 제목은 띄어쓰기가 매체마다 달라 공백까지 제거합니다.
+    """
+    text = TITLE_TAG_PATTERN.sub(" ", title.lower())
+    return NON_WORD_PATTERN.sub("", text)
+
+
+def shingles(text: str, size: int = 3) -> set[str]:
+    """문자 n-gram 집합"""
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def jaccard(a: set[str], b: set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class NewsDeduplicator:
+    """소스 간 중복 뉴스 클러스터링
+    
+    URL 정규화로 같은 기사를 묶고, 제목 문자 n-gram의 MinHash + LSH로
+    유사 제목 후보를 찾은 뒤 실제 Jaccard 유사도로 검증합니다.
+    
+    "주가 상승"/"주가 하락"처럼 제목이 한두 글자만 다른 반대 내용의 기사를
+    합치지 않도록, 제목이 threshold 이상 비슷하고 요약도 summary_threshold
+    이상 비슷하거나 같은 매체의 기사일 때만 같은 뉴스로 봅니다.
+    클러스터마다 요약이 가장 풍부한 뉴스 하나만 남깁니다.
+    """
+    
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        summary_threshold: float = 0.3,
+        shingle_size: int = 3,
+        num_perm: int = 64,
+        bands: int = 16,
+    ):
+        if num_perm % bands != 0:
+            raise ValueError("num_perm은 bands의 배수여야 합니다")
+        
+        self.threshold = threshold
+        self.summary_threshold = summary_threshold
+        self.shingle_size = shingle_size
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        
+        # 해시 함수 계수는 고정 시드로 생성 (실행마다 같은 결과)
+        self._coefficients = [
+            (
+                zlib.crc32(f"a{i}".encode()) * 2654435761 % _MERSENNE_PRIME or 1,
+                zlib.crc32(f"b{i}".encode()) * 40503 % _MERSENNE_PRIME,
+            )
+            for i in range(num_perm)
+        ]
+    
+    def _minhash(self, shingle_set: set[str]) -> list[int]:
+        hashes = [zlib.crc32(s.encode("utf-8")) for s in shingle_set]
+        return [
+            min((a * h + b) % _MERSENNE_PRIME for h in hashes)
+            for a, b in self._coefficients
+        ]
+    
+    def cluster(self, news_items: list[NewsItem]) -> list[list[NewsItem]]:
+        """중복 뉴스를 클러스터로 묶습니다 (입력 순서 유지)."""
+        
+        parent = list(range(len(news_items)))
+        
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        
+        def union(i: int, j: int) -> None:
+            ri, rj = find(i), find(j)
+            if ri != rj:
+                parent[max(ri, rj)] = min(ri, rj)
+        
+        # 1) 정규화된 URL이 같으면 같은 기사
+        by_url: dict[str, int] = {}
+        for i, item in enumerate(news_items):
+            key = canonical_url(item.url)
+            if not key:
+                continue
+            if key in by_url:
+                union(by_url[key], i)
+            else:
+                by_url[key] = i
+        
+        # 2) 제목 MinHash LSH로 후보 쌍 찾기
+        title_shingles = [
+            shingles(normalize_title(item.title), self.shingle_size)
+            for item in news_items
+        ]
+        buckets: dict[tuple, list[int]] = {}
+        for i, shingle_set in enumerate(title_shingles):
+            if not shingle_set:
+                continue
+            signature = self._minhash(shingle_set)
+            for band in range(self.bands):
+                start = band * self.rows
+                key = (band, *signature[start:start + self.rows])
+                buckets.setdefault(key, []).append(i)
+        
+        checked: set[tuple[int, int]] = set()
+        for members in buckets.values():
+            for x in range(len(members)):
+                for y in range(x + 1, len(members)):
+                    pair = (members[x], members[y])
+                    if pair in checked:
+                        continue
+                    checked.add(pair)
+                    if jaccard(title_shingles[pair[0]], title_shingles[pair[1]]) < self.threshold:
+                        continue
+                    if self._corroborated(news_items[pair[0]], news_items[pair[1]]):
+                        union(*pair)
+        
+        clusters: dict[int, list[NewsItem]] = {}
+        for i, item in enumerate(news_items):
+            clusters.setdefault(find(i), []).append(item)
+        
+        return list(clusters.values())
+    
+    def _corroborated(self, a: NewsItem, b: NewsItem) -> bool:
+        """제목 외의 신호(같은 매체 또는 비슷한 요약)로 같은 뉴스인지 확인합니다."""
+        if a.source_name and a.source_name == b.source_name:
+            return True
+        
+        summary_a = shingles(normalize_title(a.summary or ""), self.shingle_size)
+        summary_b = shingles(normalize_title(b.summary or ""), self.shingle_size)
+        return jaccard(summary_a, summary_b) >= self.summary_threshold
+    
+    def deduplicate(self, news_items: list[NewsItem]) -> list[NewsItem]:
+        """클러스터마다 대표 뉴스 하나만 남깁니다."""
+        
+        if len(news_items) < 2:
+            return list(news_items)
+        
+        clusters = self.cluster(news_items)
+        representatives = [self._pick_representative(cluster) for cluster in clusters]
+        
+        removed = len(news_items) - len(representatives)
+        if removed:
+            logger.info(
+                f"Deduplicated news: {len(news_items)} -> {len(representatives)} "
+                f"({removed} duplicates removed)"
+            )
+        
+        return representatives
+    
+    def _pick_representative(self, cluster: list[NewsItem]) -> NewsItem:
+        """요약이 가장 길고, 발행 시각이 있는 뉴스를 우선"""
+        return max(
+            cluster,
+            key=lambda item: (len(item.summary or ""), item.published_at is not None),
+        )
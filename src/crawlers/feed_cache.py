@@ -0,0 +1,94 @@
+import hashlib
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from config.settings import settings
+from src.models import NewsItem
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CachedFeed:
+    url: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    items: list[NewsItem] = field(default_factory=list)
+    fetched_at: datetime = field(default_factory=datetime.now)
+    
+    def conditional_headers(self) -> dict[str, str]:
+        """조건부 GET 요청 헤더"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+    
+    def to_dict(self) -> dict:
+        return {
+            "url": self.url,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "items": [item.to_dict() for item in self.items],
+            "fetched_at": self.fetched_at.isoformat(),
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "CachedFeed":
+        return cls(
+            url=data["url"],
+            etag=data.get("etag"),
+            last_modified=data.get("last_modified"),
+            items=[NewsItem.from_dict(item) for item in data.get("items", [])],
+            fetched_at=datetime.fromisoformat(data["fetched_at"]),
+        )
+
+
+class FeedCache:
+    """RSS 피드 HTTP 캐시 (ETag / Last-Modified + 파싱 결과)
+    
+    피드 URL마다 검증자와 파싱된 NewsItem 리스트를 JSON 파일로 저장합니다.
+    서버가 304를 반환하면 다운로드와 feedparser 파싱을 모두 건너뜁니다.
+    """
+    
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = cache_dir or settings().output_path / "cache" / "feeds"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+    
+    def _path(self, url: str) -> Path:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.json"
+    
+    def get(self, url: str) -> Optional[CachedFeed]:
+        path = self._path(url)
+        if not path.exists():
+            return None
+        
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            return CachedFeed.from_dict(data)
+        except Exception as e:
+            logger.warning(f"Failed to read feed cache {path.name}: {e}")
+            return None
+    
+    def put(self, feed: CachedFeed) -> None:
+        if not feed.etag and not feed.last_modified:
+            # 검증자가 없으면 조건부 요청을 보낼 수 없으므로 저장하지 않음
+            return
+        
+        path = self._path(feed.url)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            tmp_path.write_text(
+                json.dumps(feed.to_dict(), ensure_ascii=False),
+                encoding="utf-8",
+            )
+            tmp_path.replace(path)
+        except Exception as e:
+            logger.warning(f"Failed to write feed cache {path.name}: {e}")
@@ -7,6 +7,8 @@ import feedparser
 import httpx
 
 from src.crawlers.base import BaseCrawler
+from src.crawlers.feed_cache import CachedFeed, FeedCache
+from src.crawlers.http_client import HostLimiter
 from src.models import NewsItem, NewsSource
 from src.utils.logger import get_logger
 
@@ -19,9 +21,18 @@ class GoogleNewsCrawler(BaseCrawler):
     
     BASE_URL = "https://news.google.com/rss/search"
     
-    def __init__(self, language: str = "ko", country: str = "KR"):
+    def __init__(
+        self,
+        language: str = "ko",
+        country: str = "KR",
+        client: Optional[httpx.AsyncClient] = None,
+        limiter: Optional[HostLimiter] = None,
+        cache: Optional[FeedCache] = None,
+    ):
+        super().__init__(client=client, limiter=limiter)
         self.language = language
         self.country = country
+        self.cache = cache
     
     def get_source_name(self) -> str:
         return "Google News"
@@ -40,22 +51,41 @@ class GoogleNewsCrawler(BaseCrawler):
         logger.info(f"Fetching Google News: {query}")
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, timeout=10.0)
-                response.raise_for_status()
-                content = response.text
+            cached = self.cache.get(url) if self.cache else None
+            headers = cached.conditional_headers() if cached else None
+            
+            response = await self._get(url, headers=headers, timeout=10.0)
+            
+            if cached and response.status_code == 304:
+                logger.info(f"Google News feed not modified, using cache: {query}")
+                return cached.items[:limit]
+            
+            response.raise_for_status()
+            content = response.text
             
             feed = feedparser.parse(content)
             
             if feed.bozo:
                 logger.warning(f"Feed parsing warning: {feed.bozo_exception}")
             
+            # 캐시 사용 시 limit과 무관하게 재사용할 수 있도록 전체 엔트리 파싱
+            entries = feed.entries if self.cache else feed.entries[:limit]
+            
             news_items = []
-            for entry in feed.entries[:limit]:
+            for entry in entries:
                 news_item = self._parse_entry(entry)
                 if news_item:
                     news_items.append(news_item)
             
+            if self.cache:
+                self.cache.put(CachedFeed(
+                    url=url,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                    items=news_items,
+                ))
+                news_items = news_items[:limit]
+            
             logger.info(f"Fetched {len(news_items)} news items from Google News")
             return news_items
             
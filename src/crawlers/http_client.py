@@ -0,0 +1,66 @@
+import asyncio
+import importlib.util
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from urllib.parse import urlsplit
+
+import httpx
+
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+}
+
+
+def http2_available() -> bool:
+    """h2 패키지가 설치되어 있으면 HTTP/2 사용 가능"""
+    return importlib.util.find_spec("h2") is not None
+
+
+def create_http_client(
+    max_connections: int = 20,
+    max_keepalive_connections: int = 10,
+    http2: bool = True,
+    timeout: float = 10.0,
+) -> httpx.AsyncClient:
+    """크롤러들이 공유할 keep-alive 커넥션 풀 클라이언트를 생성합니다.
+    
+    Args:
+        max_connections: 전체 최대 커넥션 수
+        max_keepalive_connections: 유지할 keep-alive 커넥션 수
+        http2: HTTP/2 사용 여부 (h2 미설치 시 HTTP/1.1로 동작)
+        timeout: 기본 요청 타임아웃 (초)
+    
+    Returns:
+        httpx.AsyncClient
+    """
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+    )
+    return httpx.AsyncClient(
+        limits=limits,
+        http2=http2 and http2_available(),
+        timeout=timeout,
+        headers=DEFAULT_HEADERS,
+    )
+
+
+class HostLimiter:
+    """호스트별 동시 요청 수 제한"""
+    
+    def __init__(self, per_host: int = 4):
+        self.per_host = max(1, per_host)
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+    
+    def _semaphore(self, host: str) -> asyncio.Semaphore:
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self.per_host)
+        return self._semaphores[host]
+    
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """URL의 호스트에 대한 요청 슬롯을 확보합니다."""
+        host = urlsplit(url).hostname or ""
+        async with self._semaphore(host):
+            yield
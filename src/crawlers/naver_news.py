@@ -43,13 +43,12 @@ class NaverNewsCrawler(BaseCrawler):
         logger.info("Fetching Naver IT/Science section news")
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    self.SECTION_URL,
-                    headers=self.HEADERS,
-                    timeout=10.0
-                )
-                response.raise_for_status()
+            response = await self._get(
+                self.SECTION_URL,
+                headers=self.HEADERS,
+                timeout=10.0
+            )
+            response.raise_for_status()
             
             soup = BeautifulSoup(response.text, "lxml")
             news_items = []
@@ -86,13 +85,12 @@ class NaverNewsCrawler(BaseCrawler):
         url = f"{self.SEARCH_URL}?{urlencode(params)}"
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    url,
-                    headers=self.HEADERS,
-                    timeout=10.0
-                )
-                response.raise_for_status()
+            response = await self._get(
+                url,
+                headers=self.HEADERS,
+                timeout=10.0
+            )
+            response.raise_for_status()
             
             soup = BeautifulSoup(response.text, "lxml")
             news_items = []
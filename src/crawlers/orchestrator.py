@@ -0,0 +1,134 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import httpx
+
+from config.settings import settings
+from src.crawlers.base import BaseCrawler
+from src.crawlers.http_client import HostLimiter, create_http_client
+from src.crawlers.watermark import WatermarkStore
+from src.models import NewsItem
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CrawlJob:
+    crawler: BaseCrawler
+    query: Optional[str] = None  # None이면 크롤러 기본 검색어
+    limit: int = 10
+
+
+class CrawlOrchestrator:
+    """여러 (크롤러, 검색어) 작업을 공유 커넥션 풀로 동시에 실행
+    
+    워터마크 저장소를 주면 작업마다 fetch_new로 이전 실행 이후의 새 뉴스만 모읍니다.
+    """
+    
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        per_host_concurrency: Optional[int] = None,
+        http2: Optional[bool] = None,
+        watermarks: Optional[WatermarkStore] = None,
+    ):
+        config = settings()
+        self.max_connections = max_connections or config.crawl_max_connections
+        self.per_host_concurrency = per_host_concurrency or config.crawl_per_host_concurrency
+        self.http2 = config.crawl_http2 if http2 is None else http2
+        
+        self.client: Optional[httpx.AsyncClient] = None
+        self.limiter = HostLimiter(self.per_host_concurrency)
+        self.watermarks = watermarks
+    
+    async def __aenter__(self) -> "CrawlOrchestrator":
+        if self.client is None:
+            self.client = create_http_client(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+                http2=self.http2,
+            )
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
+    async def close(self) -> None:
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+    
+    async def run_grouped(self, jobs: list[CrawlJob]) -> list[list[NewsItem]]:
+        """작업별 결과를 입력 순서대로 반환합니다.
+        
+        Args:
+            jobs: 크롤링 작업 리스트
+        
+        Returns:
+            작업별 NewsItem 리스트 (실패한 작업은 빈 리스트)
+        """
+        if not jobs:
+            return []
+        
+        if self.client is None:
+            async with self:
+                return await self.run_grouped(jobs)
+        
+        # 같은 크롤러가 여러 작업에 쓰일 수 있으므로 크롤러별로 한 번만 원래 값을 보관
+        crawlers = {id(job.crawler): job.crawler for job in jobs}
+        saved = {key: (crawler.client, crawler.limiter) for key, crawler in crawlers.items()}
+        for crawler in crawlers.values():
+            crawler.client = self.client
+            crawler.limiter = self.limiter
+        
+        logger.info(
+            f"Crawling {len(jobs)} jobs "
+            f"(per-host={self.per_host_concurrency}, pool={self.max_connections})"
+        )
+        started = time.perf_counter()
+        
+        try:
+            results = await asyncio.gather(
+                *(self._fetch(job) for job in jobs),
+                return_exceptions=True,
+            )
+        finally:
+            # 오케스트레이터가 닫힌 뒤에도 크롤러가 닫힌 클라이언트를 쥐고 있지 않도록 복원
+            for key, crawler in crawlers.items():
+                crawler.client, crawler.limiter = saved[key]
+        
+        grouped = []
+        for job, result in zip(jobs, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    f"Crawl job failed ({job.crawler.get_source_name()}, "
+                    f"{job.query!r}): {result}"
+                )
+                grouped.append([])
+            else:
+                grouped.append(result)
+        
+        elapsed = time.perf_counter() - started
+        total = sum(len(items) for items in grouped)
+        logger.info(f"Crawled {total} news items from {len(jobs)} jobs in {elapsed:.1f}s")
+        return grouped
+    
+    async def _fetch(self, job: CrawlJob) -> list[NewsItem]:
+        if self.watermarks is None:
+            if job.query is None:
+                return await job.crawler.fetch(limit=job.limit)
+            return await job.crawler.fetch(query=job.query, limit=job.limit)
+        
+        return [
+            item
+            async for item in job.crawler.fetch_new(self.watermarks, job.query, job.limit)
+        ]
+    
+    async def run(self, jobs: list[CrawlJob]) -> list[NewsItem]:
+        """모든 작업 결과를 하나의 리스트로 합쳐 반환합니다."""
+        grouped = await self.run_grouped(jobs)
+        return [item for items in grouped for item in items]
@@ -0,0 +1,104 @@
+import hashlib
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from config.settings import settings
+from src.crawlers.dedup import canonical_url, normalize_title
+from src.models import NewsItem, ShortsVideo
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+def _fingerprint(kind: str, value: str) -> int:
+    """64비트 부호 있는 정수 지문 (SQLite INTEGER에 그대로 저장)"""
+    digest = hashlib.blake2b(f"{kind}:{value}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def story_fingerprints(news_item: NewsItem) -> list[int]:
+    """뉴스 하나의 지문 목록 (정규화 URL, 정규화 제목)"""
+    fingerprints = []
+    
+    url = canonical_url(news_item.url)
+    if url:
+        fingerprints.append(_fingerprint("url", url))
+    
+    title = normalize_title(news_item.title)
+    if title:
+        fingerprints.append(_fingerprint("title", title))
+    
+    return fingerprints
+
+
+class StoryIndex:
+    """이미 쇼츠로 만든 뉴스의 영구 인덱스
+    
+    SQLite에 8바이트 지문만 저장하고, 시작 시 메모리 set으로 읽어
+    선별 전 중복 확인을 O(1)로 처리합니다.
+    """
+    
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = db_path or settings().output_path / "story_index.db"
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS stories ("
+            "fingerprint INTEGER PRIMARY KEY, "
+            "title TEXT, "
+            "video_path TEXT, "
+            "created_at TEXT"
+            ") WITHOUT ROWID"
+        )
+        self._conn.commit()
+        
+        self._fingerprints: set[int] = {
+            row[0] for row in self._conn.execute("SELECT fingerprint FROM stories")
+        }
+        logger.debug(f"Story index loaded: {len(self._fingerprints)} fingerprints")
+    
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+    
+    def __enter__(self) -> "StoryIndex":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        self._conn.close()
+    
+    def contains(self, news_item: NewsItem) -> bool:
+        """이미 다룬 뉴스인지 확인"""
+        return any(fp in self._fingerprints for fp in story_fingerprints(news_item))
+    
+    def filter_unseen(self, news_items: list[NewsItem]) -> list[NewsItem]:
+        """아직 다루지 않은 뉴스만 반환합니다."""
+        unseen = [item for item in news_items if not self.contains(item)]
+        
+        skipped = len(news_items) - len(unseen)
+        if skipped:
+            logger.info(f"Skipped {skipped} already covered news items")
+        
+        return unseen
+    
+    def record(self, news_item: NewsItem, video: Optional[ShortsVideo] = None) -> None:
+        """쇼츠로 만든 뉴스를 인덱스에 추가합니다."""
+        created_at = video.created_at if video else datetime.now()
+        rows = [
+            (fp, news_item.title, video.video_path if video else None, created_at.isoformat())
+            for fp in story_fingerprints(news_item)
+        ]
+        
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO stories (fingerprint, title, video_path, created_at) "
+            "VALUES (?, ?, ?, ?)",
+            rows,
+        )
+        self._conn.commit()
+        self._fingerprints.update(fp for fp, *_ in rows)
@@ -0,0 +1,106 @@
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from config.settings import settings
+from src.models import NewsItem
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class Watermark:
+    latest_published_at: Optional[datetime] = None
+    seen_urls: list[str] = field(default_factory=list)
+    
+    def is_new(self, item: NewsItem, seen: set[str]) -> bool:
+        """워터마크 이후의 새 뉴스인지 확인"""
+        if item.url in seen:
+            return False
+        
+        if item.published_at and self.latest_published_at:
+            try:
+                return item.published_at >= self.latest_published_at
+            except TypeError:
+                # naive/aware datetime 혼용 시 URL 기준으로만 판단
+                return True
+        
+        return True
+    
+    def advance(self, item: NewsItem, max_seen: int) -> None:
+        self.seen_urls.append(item.url)
+        if len(self.seen_urls) > max_seen:
+            del self.seen_urls[:-max_seen]
+        
+        if item.published_at:
+            try:
+                if not self.latest_published_at or item.published_at > self.latest_published_at:
+                    self.latest_published_at = item.published_at
+            except TypeError:
+                pass
+    
+    def to_dict(self) -> dict:
+        return {
+            "latest_published_at": (
+                self.latest_published_at.isoformat() if self.latest_published_at else None
+            ),
+            "seen_urls": self.seen_urls,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "Watermark":
+        latest = data.get("latest_published_at")
+        return cls(
+            latest_published_at=datetime.fromisoformat(latest) if latest else None,
+            seen_urls=list(data.get("seen_urls", [])),
+        )
+
+
+class WatermarkStore:
+    """소스/검색어별 크롤링 워터마크 저장소
+    
+    마지막으로 본 published_at과 최근 본 URL 목록을 JSON 파일에 보관합니다.
+    """
+    
+    def __init__(self, path: Optional[Path] = None, max_seen: int = 1000):
+        self.path = path or settings().output_path / "state" / "crawl_watermarks.json"
+        self.max_seen = max_seen
+        self._watermarks: dict[str, Watermark] = {}
+        self._load()
+    
+    @staticmethod
+    def make_key(source_name: str, query: str) -> str:
+        return f"{source_name}:{query}"
+    
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            self._watermarks = {
+                key: Watermark.from_dict(value) for key, value in data.items()
+            }
+        except Exception as e:
+            logger.warning(f"Failed to load crawl watermarks: {e}")
+    
+    def get(self, key: str) -> Watermark:
+        if key not in self._watermarks:
+            self._watermarks[key] = Watermark()
+        return self._watermarks[key]
+    
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {key: value.to_dict() for key, value in self._watermarks.items()},
+                ensure_ascii=False,
+            ),
+            encoding="utf-8",
+        )
+        tmp_path.replace(self.path)
@@ -0,0 +1,22 @@
+from src.media.downloader import DownloadError, MediaDownloader
+from src.media.library import MediaLibrary
+from src.media.pexels import PexelsClient, PexelsError
+from src.media.render_farm import RenderFarm, RenderReport, RenderTask
+from src.media.renderer import FFmpegRenderer, MoviePyRenderer, RenderError, render_short
+from src.media.sourcer import MediaSourcer
+
+__all__ = [
+    "DownloadError",
+    "MediaDownloader",
+    "MediaLibrary",
+    "PexelsClient",
+    "PexelsError",
+    "MediaSourcer",
+    "RenderFarm",
+    "RenderReport",
+    "RenderTask",
+    "FFmpegRenderer",
+    "MoviePyRenderer",
+    "RenderError",
+    "render_short",
+]
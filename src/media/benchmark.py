@@ -0,0 +1,270 @@
+"""렌더 인코더 설정 벤치마크
+
+실행: python -m src.media.benchmark [--presets ...] [--crfs ...] [--threads ...] [--profile PATH]
+
+합성 쇼츠(컬러 바 + 사인파 음성 + 한글 자막)를 x264 프리셋/CRF/스레드 조합별로
+렌더링해 시간, 크기, 화질(SSIM/PSNR)을 재고, 화질/비트레이트 기준을 통과한 가장 빠른 설정을
+output/render_profile.json에 기록합니다. 렌더러는 이 프로필을 기본값으로 사용하고,
+스레드 수가 0보다 크면 렌더 팜도 그 수를 렌더당 스레드 수로 써서 동시 렌더 수를 맞춥니다.
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from src.media.renderer import FFmpegRenderer, find_ffmpeg, render_profile_path
+from src.models import MediaAsset, Script, TTSProvider, TTSResult
+from src.tts.timing import align_chunks
+from src.utils.cache import DiskCache
+from src.utils.file_manager import temp_directory
+from src.utils.logger import get_logger, setup_logger
+
+
+logger = get_logger(__name__)
+
+
+DEFAULT_PRESETS = ["ultrafast", "superfast", "veryfast", "faster", "fast", "medium"]
+DEFAULT_CRFS = [20, 23, 26]
+
+SAMPLE_SENTENCES = [
+    "삼성전자가 새 스마트폰을 공개했습니다.",
+    "이번 제품은 AI 기능이 대폭 강화됐는데요.",
+    "실시간 통역과 사진 자동 편집이 들어갔습니다.",
+    "출시는 다음 달입니다.",
+]
+
+
+@dataclass
+class BenchmarkResult:
+    preset: str
+    crf: int
+    threads: int
+    seconds: float
+    file_size_mb: float
+    ssim: float
+    psnr: float
+    duration: float = 0.0
+    
+    @property
+    def speed(self) -> float:
+        """실시간 대비 배속 (fixture 길이 기준)"""
+        return self.duration / self.seconds if self.seconds else 0.0
+    
+    @property
+    def mbps(self) -> float:
+        """평균 비트레이트 (업로드 시간과 직결)"""
+        return self.file_size_mb * 8 / self.duration if self.duration else 0.0
+
+
+def make_fixture(work_dir: Path, duration: float) -> tuple[Script, TTSResult, list[MediaAsset]]:
+    """컬러 바 영상, 사인파 음성, 한글 자막 타이밍으로 된 합성 쇼츠 입력"""
+    ffmpeg = find_ffmpeg()
+    
+    # 세로 컬러 바와 움직이는 테스트 패턴 (정지 화면만 있으면 인코더 비교가 무의미)
+    sources = {
+        "bars.mp4": "smptehdbars=s=1080x1920:r=30",
+        "pattern.mp4": "testsrc2=s=1080x1920:r=30",
+    }
+    media = []
+    for name, source in sources.items():
+        path = work_dir / name
+        subprocess.run(
+            [ffmpeg, "-y", "-loglevel", "error",
+             "-f", "lavfi", "-i", f"{source}:d={duration / 2:.3f}",
+             "-c:v", "libx264", "-preset", "ultrafast", "-qp", "0", str(path)],
+            check=True,
+        )
+        media.append(MediaAsset(str(path), "video", "", "benchmark", duration / 2, 1080, 1920))
+    
+    audio_path = work_dir / "tone.mp3"
+    subprocess.run(
+        [ffmpeg, "-y", "-loglevel", "error", "-f", "lavfi",
+         "-i", f"sine=f=440:d={duration:.3f}", str(audio_path)],
+        check=True,
+    )
+    
+    # 문장 길이는 글자 수에 비례하게 배분
+    total_chars = sum(len(sentence) for sentence in SAMPLE_SENTENCES)
+    durations = [duration * len(sentence) / total_chars for sentence in SAMPLE_SENTENCES]
+    word_timings, sentence_timings = align_chunks(
+        SAMPLE_SENTENCES, durations, [None] * len(SAMPLE_SENTENCES)
+    )
+    
+    full_script = " ".join(SAMPLE_SENTENCES)
+    script = Script(
+        title="렌더 벤치마크",
+        hook=SAMPLE_SENTENCES[0],
+        body=" ".join(SAMPLE_SENTENCES[1:-1]),
+        outro=SAMPLE_SENTENCES[-1],
+        full_script=full_script,
+        keywords=["benchmark"],
+        hashtags=[],
+        description="",
+    )
+    tts = TTSResult(
+        audio_path=str(audio_path),
+        duration=duration,
+        character_count=len(full_script),
+        provider=TTSProvider.EDGE,
+        word_timings=word_timings,
+        sentence_timings=sentence_timings,
+    )
+    return script, tts, media
+
+
+def measure_quality(ffmpeg: str, distorted: Path, reference: Path) -> tuple[float, float]:
+    """기준 영상 대비 SSIM(All)과 평균 PSNR(dB)"""
+    result = subprocess.run(
+        [ffmpeg, "-hide_banner", "-i", str(distorted), "-i", str(reference),
+         "-lavfi", "[0:v]split[a0][a1];[1:v]split[b0][b1];[a0][b0]ssim;[a1][b1]psnr",
+         "-f", "null", "-"],
+        capture_output=True,
+        text=True,
+        errors="replace",
+    )
+    ssim = re.search(r"SSIM .*All:([\d.]+)", result.stderr)
+    psnr = re.search(r"PSNR .*average:([\d.]+|inf)", result.stderr)
+    if not ssim or not psnr:
+        raise RuntimeError(f"화질 측정 실패: {result.stderr.strip()[-500:]}")
+    
+    return float(ssim.group(1)), float(psnr.group(1))
+
+
+def _renderer(preset: str, crf: int, threads: int, caption_cache: DiskCache) -> FFmpegRenderer:
+    renderer = FFmpegRenderer(preset=preset, crf=crf, threads=threads, caption_cache=caption_cache)
+    # 인코딩 시간을 재야 하므로 세그먼트 캐시는 사용하지 않음
+    renderer.segment_cache = None
+    return renderer
+
+
+def run_benchmark(
+    presets: list[str],
+    crfs: list[int],
+    threads: list[int],
+    duration: float = 15.0,
+) -> list[BenchmarkResult]:
+    """설정 조합별로 fixture를 렌더링하고 측정 결과를 반환합니다."""
+    results = []
+    
+    with temp_directory("benchmark") as work_dir:
+        script, tts, media = make_fixture(work_dir, duration)
+        # 자막 이미지는 fixture 전용이므로 작업 폴더에만 저장
+        caption_cache = DiskCache(work_dir / "captions", suffix=".png")
+        
+        # 화질 기준은 같은 필터 그래프의 무손실 인코딩
+        reference = work_dir / "reference.mp4"
+        reference_renderer = _renderer("ultrafast", 0, 0, caption_cache)
+        reference_renderer.render(script, tts, media, reference)
+        
+        for preset in presets:
+            for crf in crfs:
+                for thread_count in threads:
+                    output = work_dir / f"{preset}_{crf}_{thread_count}.mp4"
+                    renderer = _renderer(preset, crf, thread_count, caption_cache)
+                    
+                    started = time.perf_counter()
+                    video = renderer.render(script, tts, media, output)
+                    seconds = time.perf_counter() - started
+                    
+                    ssim, psnr = measure_quality(renderer.ffmpeg, output, reference)
+                    result = BenchmarkResult(
+                        preset=preset,
+                        crf=crf,
+                        threads=thread_count,
+                        seconds=seconds,
+                        file_size_mb=video.file_size_mb,
+                        ssim=ssim,
+                        psnr=psnr,
+                        duration=duration,
+                    )
+                    results.append(result)
+                    logger.info(
+                        f"{preset:>9} crf={crf} threads={thread_count}: {seconds:.1f}s "
+                        f"({result.speed:.1f}x), {video.file_size_mb:.2f}MB ({result.mbps:.1f} Mbps), "
+                        f"SSIM {ssim:.4f}, PSNR {psnr:.1f}dB"
+                    )
+                    output.unlink(missing_ok=True)
+    
+    return results
+
+
+def pick_profile(
+    results: list[BenchmarkResult],
+    min_ssim: float,
+    max_mbps: Optional[float] = None,
+) -> Optional[BenchmarkResult]:
+    """화질/비트레이트 기준을 통과한 설정 중 가장 빠른 것 (동률이면 작은 파일)"""
+    candidates = [
+        result for result in results
+        if result.ssim >= min_ssim and (max_mbps is None or result.mbps <= max_mbps)
+    ]
+    if not candidates:
+        return None
+    return min(candidates, key=lambda result: (round(result.seconds, 1), result.file_size_mb))
+
+
+def write_profile(result: BenchmarkResult, path: Optional[Path] = None) -> Path:
+    path = path or render_profile_path()
+    profile = {
+        **asdict(result),
+        "cpu_count": os.cpu_count(),
+        "created_at": datetime.now().isoformat(),
+    }
+    
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(profile, ensure_ascii=False, indent=2), encoding="utf-8")
+    tmp_path.replace(path)
+    return path
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="렌더 인코더 설정 벤치마크")
+    parser.add_argument("--presets", nargs="+", default=DEFAULT_PRESETS)
+    parser.add_argument("--crfs", nargs="+", type=int, default=DEFAULT_CRFS)
+    parser.add_argument(
+        "--threads", nargs="+", type=int, default=[0], help="인코더 스레드 수 (0 = 자동)"
+    )
+    parser.add_argument("--duration", type=float, default=15.0, help="fixture 길이 (초)")
+    parser.add_argument("--min-ssim", type=float, default=0.97, help="통과 기준 SSIM")
+    parser.add_argument(
+        "--max-mbps", type=float, default=12.0, help="최대 평균 비트레이트 (1080p30 권장 상한)"
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        default=None,
+        help="프로필 저장 경로 (기본: output/render_profile.json)",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="프로필 파일을 쓰지 않음")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    setup_logger(log_level="INFO")
+    
+    results = run_benchmark(args.presets, args.crfs, args.threads, args.duration)
+    best = pick_profile(results, args.min_ssim, args.max_mbps)
+    if best is None:
+        logger.error(f"No setting met SSIM >= {args.min_ssim} at <= {args.max_mbps} Mbps")
+        return 1
+    
+    logger.info(
+        f"Best profile: preset={best.preset} crf={best.crf} threads={best.threads} "
+        f"({best.speed:.1f}x realtime, {best.mbps:.1f} Mbps, SSIM {best.ssim:.4f})"
+    )
+    if not args.dry_run:
+        logger.info(f"Render profile written: {write_profile(best, args.profile)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+import io
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+from config.settings import settings
+from src.media.segments import content_hash
+from src.models import TextTiming
+from src.utils.cache import DiskCache, make_cache_key
+
+
+SENTENCE_ENDINGS = (".", "?", "!", "…")
+
+
+def group_captions(words: list[TextTiming], max_chars: int = 14) -> list[TextTiming]:
+    """단어 타이밍을 화면에 한 번에 띄울 자막 줄로 묶습니다.
+    
+    공백 제외 max_chars를 넘거나 문장이 끝나면 줄을 나눕니다. 줄 사이 깜빡임이
+    없도록 각 줄은 다음 줄이 시작할 때까지 유지합니다 (문장 끝 줄은 제외).
+    
+    Args:
+        words: TTSResult.word_timings
+        max_chars: 한 줄 최대 글자 수 (공백 제외)
+    
+    Returns:
+        자막 줄 타이밍 리스트
+    """
+    lines: list[list[TextTiming]] = []
+    current: list[TextTiming] = []
+    
+    for word in words:
+        length = sum(len(w.text) for w in current) + len(word.text)
+        if current and length > max_chars:
+            lines.append(current)
+            current = []
+        
+        current.append(word)
+        if word.text.endswith(SENTENCE_ENDINGS):
+            lines.append(current)
+            current = []
+    
+    if current:
+        lines.append(current)
+    
+    captions = [
+        TextTiming(
+            text=" ".join(w.text for w in line),
+            start=line[0].start,
+            end=line[-1].end,
+        )
+        for line in lines
+    ]
+    
+    for caption, following in zip(captions, captions[1:]):
+        if not caption.text.endswith(SENTENCE_ENDINGS):
+            caption.end = max(caption.end, following.start)
+    
+    return captions
+
+
+class CaptionAtlas:
+    """자막 줄 이미지 캐시 (한 줄은 한 번만 래스터화)
+    
+    (글꼴, 크기, 외곽선, 텍스트)를 키로 RGBA NumPy 배열을 메모리에 두고,
+    FFmpeg overlay 입력용 PNG는 디스크 캐시에 저장해 다른 렌더 프로세스와
+    재렌더링에서도 재사용합니다. 프레임마다 글자를 다시 그리지 않습니다.
+    """
+    
+    def __init__(
+        self,
+        font_file: Path,
+        font_size: int,
+        stroke_width: int = 5,
+        max_width: int = 960,
+        cache: Optional[DiskCache] = None,
+        memory_limit: int = 512,
+    ):
+        self.font_file = Path(font_file)
+        self.font_size = font_size
+        self.stroke_width = stroke_width
+        self.max_width = max_width
+        self.cache = cache if cache is not None else DiskCache(
+            cache_dir=settings().output_path / "cache" / "captions",
+            max_size_mb=200.0,
+            suffix=".png",
+        )
+        self.memory_limit = memory_limit
+        self._lines: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._font: Optional[ImageFont.FreeTypeFont] = None
+        self._font_hash: Optional[str] = None
+    
+    @property
+    def font(self) -> ImageFont.FreeTypeFont:
+        if self._font is None:
+            self._font = ImageFont.truetype(str(self.font_file), self.font_size)
+        return self._font
+    
+    def key(self, text: str) -> str:
+        if self._font_hash is None:
+            self._font_hash = content_hash(str(self.font_file))
+        return make_cache_key(
+            "caption", self._font_hash, self.font_size, self.stroke_width, self.max_width, text
+        )
+    
+    def rasterize(self, text: str) -> np.ndarray:
+        """자막 한 줄을 RGBA 배열로 그립니다 (메모리 LRU 캐시)."""
+        key = self.key(text)
+        if key in self._lines:
+            self._lines.move_to_end(key)
+            return self._lines[key]
+        
+        left, top, right, bottom = self.font.getbbox(text, stroke_width=self.stroke_width)
+        pad = self.stroke_width
+        image = Image.new("RGBA", (right - left + pad * 2, bottom - top + pad * 2))
+        ImageDraw.Draw(image).text(
+            (pad - left, pad - top),
+            text,
+            font=self.font,
+            fill=(255, 255, 255, 255),
+            stroke_width=self.stroke_width,
+            stroke_fill=(0, 0, 0, 255),
+        )
+        
+        if image.width > self.max_width:
+            height = round(image.height * self.max_width / image.width)
+            image = image.resize((self.max_width, height), Image.LANCZOS)
+        
+        line = np.asarray(image)
+        self._lines[key] = line
+        if len(self._lines) > self.memory_limit:
+            self._lines.popitem(last=False)
+        return line
+    
+    def image_path(self, text: str) -> Path:
+        """FFmpeg overlay에 넣을 자막 줄 PNG 경로"""
+        key = self.key(text)
+        path = self.cache.get_path(key)
+        if path is not None:
+            return path
+        
+        buffer = io.BytesIO()
+        # 매번 다시 읽는 파일이므로 압축보다 속도 우선
+        Image.fromarray(self.rasterize(text)).save(buffer, format="PNG", compress_level=1)
+        return self.cache.put_bytes(key, buffer.getvalue())
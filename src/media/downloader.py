@@ -0,0 +1,153 @@
+import asyncio
+import hashlib
+import os
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import httpx
+
+from config.settings import settings
+from src.utils.file_manager import temp_file
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class DownloadError(Exception):
+    """다운로드 실패 (재시도 초과 또는 검증 실패)"""
+
+
+@dataclass
+class DownloadResult:
+    path: Path
+    size: int
+    sha256: str
+
+
+class MediaDownloader:
+    """스트리밍 청크 다운로더
+    
+    파일 전체를 메모리에 올리지 않고 청크 단위로 임시 파일에 쓰며, 연결이
+    끊기면 Range 요청으로 받은 위치부터 이어 받습니다. 크기/해시를 검증한 뒤
+    원자적으로 최종 경로로 옮기므로 실패해도 반쯤 쓰인 파일이 남지 않습니다.
+    """
+    
+    RETRY_BACKOFF = 1.0
+    
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        max_retries: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ):
+        config = settings()
+        self.client = client
+        self.max_retries = config.media_download_retries if max_retries is None else max_retries
+        self.chunk_size = chunk_size or config.media_download_chunk_kb * 1024
+    
+    async def download(
+        self,
+        url: str,
+        dest: Path,
+        expected_size: Optional[int] = None,
+        expected_sha256: Optional[str] = None,
+    ) -> DownloadResult:
+        """URL을 dest로 내려받습니다.
+        
+        Args:
+            url: 다운로드 URL
+            dest: 최종 저장 경로
+            expected_size: 기대 크기 (없으면 Content-Length로 검증)
+            expected_sha256: 기대 sha256 해시 (선택)
+        
+        Returns:
+            DownloadResult (내려받으며 계산한 크기/해시 포함)
+        """
+        if self.client is not None:
+            return await self._download(self.client, url, dest, expected_size, expected_sha256)
+        
+        async with httpx.AsyncClient(timeout=60.0, follow_redirects=True) as client:
+            return await self._download(client, url, dest, expected_size, expected_sha256)
+    
+    async def _download(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        dest: Path,
+        expected_size: Optional[int],
+        expected_sha256: Optional[str],
+    ) -> DownloadResult:
+        extension = dest.suffix.lstrip(".") or "part"
+        
+        with temp_file(f"download_{uuid.uuid4().hex[:8]}", extension) as part_path:
+            part_path.parent.mkdir(parents=True, exist_ok=True)
+            digest = hashlib.sha256()
+            written = 0
+            total = expected_size
+            
+            for attempt in range(self.max_retries + 1):
+                try:
+                    # 이어 받기 오프셋이 압축 해제 전 바이트 기준이 되도록 인코딩 비활성화
+                    headers = {"Accept-Encoding": "identity"}
+                    if written:
+                        headers["Range"] = f"bytes={written}-"
+                    async with client.stream("GET", url, headers=headers) as response:
+                        if written and response.status_code != 206:
+                            # 서버가 Range를 무시하면 처음부터 다시 받음
+                            logger.warning(f"Range not honoured, restarting download: {url}")
+                            digest = hashlib.sha256()
+                            written = 0
+                        
+                        response.raise_for_status()
+                        if total is None:
+                            total = self._total_size(response, written)
+                        
+                        with open(part_path, "ab" if written else "wb") as f:
+                            async for chunk in response.aiter_bytes(self.chunk_size):
+                                f.write(chunk)
+                                digest.update(chunk)
+                                written += len(chunk)
+                    
+                    if total is None or written >= total:
+                        break
+                    raise httpx.ReadError(f"connection closed at {written}/{total} bytes")
+                    
+                except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                    if isinstance(e, httpx.HTTPStatusError) and e.response.status_code < 500:
+                        raise DownloadError(f"{url}: HTTP {e.response.status_code}") from e
+                    if attempt >= self.max_retries:
+                        raise DownloadError(f"{url}: {e}") from e
+                    
+                    logger.warning(
+                        f"Download interrupted at {written} bytes "
+                        f"(attempt {attempt + 1}/{self.max_retries}): {e}"
+                    )
+                    await asyncio.sleep(self.RETRY_BACKOFF * (attempt + 1))
+            
+            sha256 = digest.hexdigest()
+            if total is not None and written != total:
+                raise DownloadError(f"{url}: size mismatch ({written} != {total})")
+            if expected_sha256 and sha256 != expected_sha256:
+                raise DownloadError(f"{url}: sha256 mismatch")
+            
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(part_path, dest)
+        
+        return DownloadResult(path=dest, size=written, sha256=sha256)
+    
+    @staticmethod
+    def _total_size(response: httpx.Response, offset: int) -> Optional[int]:
+        """Content-Range 또는 Content-Length로 전체 크기를 구합니다."""
+        content_range = response.headers.get("content-range", "")
+        if "/" in content_range:
+            total = content_range.rsplit("/", 1)[1]
+            if total.isdigit():
+                return int(total)
+        
+        length = response.headers.get("content-length")
+        if length and length.isdigit() and "content-encoding" not in response.headers:
+            return offset + int(length)
+        return None
@@ -0,0 +1,160 @@
+import hashlib
+import json
+import shutil
+import threading
+from pathlib import Path
+from typing import Optional
+
+from config.settings import settings
+from src.models import MediaAsset
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+def normalize_keyword(keyword: str) -> str:
+    return " ".join(keyword.lower().split())
+
+
+def file_sha256(path: Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+class MediaLibrary:
+    """내용 주소 기반 로컬 미디어 라이브러리
+    
+    파일은 sha256 해시 경로(files/ab/<hash>.mp4)에 한 번만 저장하고,
+    키워드와 원본 URL 인덱스(index.json)로 찾습니다. 쇼츠가 쓰는 시각 소재는
+    반복되므로 대부분의 요청을 네트워크 없이 처리할 수 있습니다.
+    """
+    
+    def __init__(self, root: Optional[Path] = None):
+        self.root = root or settings().output_path / "media_library"
+        self.index_path = self.root / "index.json"
+        self._assets: dict[str, dict] = {}
+        self._keywords: dict[str, list[str]] = {}
+        self._sources: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._load()
+    
+    def _load(self) -> None:
+        if not self.index_path.exists():
+            return
+        
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to load media library index: {e}")
+            return
+        
+        self._assets = data.get("assets", {})
+        self._keywords = data.get("keywords", {})
+        self._sources = {
+            entry["source_url"]: digest
+            for digest, entry in self._assets.items()
+            if entry.get("source_url")
+        }
+    
+    def _to_asset(self, digest: str, keyword: str) -> Optional[MediaAsset]:
+        entry = self._assets[digest]
+        path = self.root / entry["file"]
+        if not path.exists():
+            return None
+        
+        return MediaAsset(
+            file_path=str(path),
+            media_type=entry["media_type"],
+            source_url=entry["source_url"],
+            keyword=keyword,
+            duration=entry.get("duration"),
+            width=entry.get("width"),
+            height=entry.get("height"),
+        )
+    
+    def find(self, keyword: str, min_duration: float = 0.0) -> list[MediaAsset]:
+        """키워드로 보관된 소재를 찾습니다 (구간 길이를 채우는 소재 우선)."""
+        keyword = normalize_keyword(keyword)
+        with self._lock:
+            assets = [
+                asset for digest in self._keywords.get(keyword, [])
+                if digest in self._assets and (asset := self._to_asset(digest, keyword))
+            ]
+        
+        return sorted(assets, key=lambda a: (a.duration or 0.0) < min_duration)
+    
+    def get_by_source(self, source_url: str, keyword: str) -> Optional[MediaAsset]:
+        """이미 내려받은 원본이면 키워드를 추가 등록하고 반환합니다."""
+        with self._lock:
+            digest = self._sources.get(source_url)
+            if digest is None:
+                return None
+            
+            asset = self._to_asset(digest, normalize_keyword(keyword))
+            if asset is not None:
+                self._tag(digest, keyword)
+        
+        if asset is not None:
+            self.save()
+        return asset
+    
+    def add(
+        self,
+        path: Path,
+        keyword: str,
+        source_url: str,
+        media_type: str = "video",
+        duration: Optional[float] = None,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        digest: Optional[str] = None,
+    ) -> MediaAsset:
+        """파일을 라이브러리로 옮기고 키워드에 등록합니다.
+        
+        같은 내용의 파일이 이미 있으면 새 파일은 버리고 기존 항목을 사용합니다.
+        digest를 주면 (다운로드 중 계산한 해시) 파일을 다시 읽지 않습니다.
+        """
+        digest = digest or file_sha256(path)
+        relative = Path("files") / digest[:2] / f"{digest}{path.suffix}"
+        target = self.root / relative
+        
+        if target.exists():
+            path.unlink(missing_ok=True)
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(str(path), str(target))
+        
+        with self._lock:
+            self._assets.setdefault(digest, {
+                "file": relative.as_posix(),
+                "media_type": media_type,
+                "source_url": source_url,
+                "duration": duration,
+                "width": width,
+                "height": height,
+            })
+            if source_url:
+                self._sources[source_url] = digest
+            self._tag(digest, keyword)
+            asset = self._to_asset(digest, normalize_keyword(keyword))
+        
+        self.save()
+        return asset
+    
+    def _tag(self, digest: str, keyword: str) -> None:
+        digests = self._keywords.setdefault(normalize_keyword(keyword), [])
+        if digest not in digests:
+            digests.append(digest)
+    
+    def save(self) -> None:
+        with self._lock:
+            data = json.dumps(
+                {"assets": self._assets, "keywords": self._keywords},
+                ensure_ascii=False,
+            )
+        
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp_path.write_text(data, encoding="utf-8")
+        tmp_path.replace(self.index_path)
@@ -0,0 +1,105 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+import httpx
+
+from config.settings import settings
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class PexelsError(Exception):
+    """Pexels API 오류"""
+
+
+@dataclass
+class PexelsVideoFile:
+    link: str
+    width: int
+    height: int
+    quality: str = ""
+    file_type: str = ""
+    
+    @property
+    def pixels(self) -> int:
+        return self.width * self.height
+
+
+@dataclass
+class PexelsVideo:
+    id: int
+    url: str
+    duration: float
+    width: int
+    height: int
+    files: list[PexelsVideoFile] = field(default_factory=list)
+    
+    @classmethod
+    def from_api(cls, data: dict) -> "PexelsVideo":
+        return cls(
+            id=data["id"],
+            url=data.get("url", ""),
+            duration=float(data.get("duration") or 0.0),
+            width=data.get("width") or 0,
+            height=data.get("height") or 0,
+            files=[
+                PexelsVideoFile(
+                    link=f["link"],
+                    width=f.get("width") or 0,
+                    height=f.get("height") or 0,
+                    quality=f.get("quality") or "",
+                    file_type=f.get("file_type") or "",
+                )
+                for f in data.get("video_files", [])
+                if f.get("link")
+            ],
+        )
+
+
+class PexelsClient:
+    """Pexels 동영상 검색 API 클라이언트"""
+    
+    SEARCH_URL = "https://api.pexels.com/videos/search"
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
+        self.api_key = api_key or settings().pexels_api_key
+        self.client = client
+    
+    async def search_videos(
+        self,
+        query: str,
+        per_page: int = 15,
+        orientation: str = "portrait",
+    ) -> list[PexelsVideo]:
+        """키워드로 동영상을 검색합니다.
+        
+        Args:
+            query: 검색어 (영어 키워드 권장)
+            per_page: 가져올 후보 수 (최대 80)
+            orientation: portrait / landscape / square
+        
+        Returns:
+            PexelsVideo 리스트 (Pexels 관련도 순)
+        """
+        if not self.api_key:
+            raise PexelsError("PEXELS_API_KEY가 설정되지 않았습니다")
+        
+        params = {"query": query, "per_page": per_page, "orientation": orientation}
+        headers = {"Authorization": self.api_key}
+        
+        if self.client is not None:
+            response = await self.client.get(self.SEARCH_URL, params=params, headers=headers)
+        else:
+            async with httpx.AsyncClient(timeout=15.0) as client:
+                response = await client.get(self.SEARCH_URL, params=params, headers=headers)
+        
+        response.raise_for_status()
+        videos = [PexelsVideo.from_api(v) for v in response.json().get("videos", [])]
+        logger.info(f"Pexels: {len(videos)} videos for '{query}'")
+        return videos
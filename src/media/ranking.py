@@ -0,0 +1,66 @@
+import math
+from typing import Optional
+
+from src.media.pexels import PexelsVideo, PexelsVideoFile
+
+
+TARGET_WIDTH = 1080
+TARGET_HEIGHT = 1920
+
+
+def pick_file(
+    video: PexelsVideo,
+    target_width: int = TARGET_WIDTH,
+    target_height: int = TARGET_HEIGHT,
+) -> Optional[PexelsVideoFile]:
+    """목표 해상도에 가장 가까운 파일을 고릅니다.
+    
+    목표 이상인 파일 중 가장 작은 것을, 없으면 가장 큰 것을 선택해
+    어차피 축소할 4K 원본을 내려받지 않도록 합니다.
+    """
+    files = [
+        f for f in video.files
+        if f.width and f.height and f.file_type in ("", "video/mp4")
+    ]
+    if not files:
+        return None
+    
+    enough = [
+        f for f in files
+        if min(f.width, f.height) >= min(target_width, target_height)
+        and max(f.width, f.height) >= max(target_width, target_height)
+    ]
+    if enough:
+        return min(enough, key=lambda f: f.pixels)
+    return max(files, key=lambda f: f.pixels)
+
+
+def score_video(
+    video: PexelsVideo,
+    min_duration: float,
+    target_width: int = TARGET_WIDTH,
+    target_height: int = TARGET_HEIGHT,
+) -> float:
+    """9:16 쇼츠 B-roll로서의 적합도 (0~1)
+    
+    세로 비율, 구간 길이 충족도, 목표 해상도와의 근접도를 가중 합산합니다.
+    """
+    best = pick_file(video, target_width, target_height)
+    if best is None or not video.width or not video.height:
+        return 0.0
+    
+    target_ratio = target_width / target_height
+    ratio_score = max(0.0, 1.0 - abs(video.width / video.height - target_ratio) / target_ratio)
+    
+    coverage = min(video.duration / min_duration, 1.0) if min_duration > 0 else 1.0
+    
+    # 해상도는 높이 비율의 로그 거리로 평가 (절반/두 배면 0점)
+    resolution_score = max(0.0, 1.0 - abs(math.log2(max(best.height, 1) / target_height)))
+    
+    return 0.4 * coverage + 0.35 * ratio_score + 0.25 * resolution_score
+
+
+def rank_videos(videos: list[PexelsVideo], min_duration: float) -> list[PexelsVideo]:
+    """적합도 높은 순으로 정렬 (다운로드할 파일이 없는 영상 제외)"""
+    scored = [(score_video(video, min_duration), video) for video in videos]
+    return [video for score, video in sorted(scored, key=lambda x: -x[0]) if score > 0]
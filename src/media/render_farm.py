@@ -0,0 +1,212 @@
+import asyncio
+import heapq
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from config.settings import settings
+from src.media.renderer import load_render_profile, render_short
+from src.models import MediaAsset, Script, ShortsVideo, TTSResult
+from src.utils.cache import DiskCache
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class RenderTask:
+    index: int
+    script: Script
+    tts: TTSResult
+    media: list[MediaAsset] = field(default_factory=list)
+    output_path: Optional[Path] = None
+    fragmented: bool = False
+    # 비우면 output/cache 아래의 기본 캐시 (테스트에서는 임시 디렉토리를 넣음)
+    segment_cache: Optional[DiskCache] = None
+    caption_cache: Optional[DiskCache] = None
+    
+    @property
+    def cost(self) -> float:
+        """예상 렌더링 비용 (영상 길이, 음성 합성 전이면 스크립트 추정 길이)"""
+        return self.tts.duration if self.tts else self.script.estimated_duration
+
+
+@dataclass
+class RenderReport:
+    index: int
+    video: Optional[ShortsVideo]
+    error: Optional[str]
+    seconds: float
+    threads: int
+    pid: int
+
+
+def fixed_threads() -> int:
+    """렌더당 인코더 스레드 수 (RENDER_THREADS 또는 벤치마크 프로필, 0이면 자동)"""
+    return load_render_profile().get("threads", settings().render_threads) or 0
+
+
+def plan_capacity(
+    job_count: int,
+    cpu_count: Optional[int] = None,
+    load: Optional[float] = None,
+    min_threads: Optional[int] = None,
+    threads: Optional[int] = None,
+) -> tuple[int, int]:
+    """동시 렌더 수와 렌더당 인코더 스레드 수를 정합니다.
+    
+    현재 부하를 뺀 여유 코어를 작업 수만큼 나누되, 렌더당 최소 스레드 수를
+    보장할 수 없으면 동시 렌더 수를 줄입니다. 렌더당 스레드 수가 정해져 있으면
+    (threads, 기본: fixed_threads()) 그 수를 그대로 쓰고 동시 렌더 수만 맞춥니다.
+    
+    Returns:
+        (workers, threads_per_job)
+    """
+    cpus = cpu_count or os.cpu_count() or 1
+    if load is None:
+        load = os.getloadavg()[0] if hasattr(os, "getloadavg") else 0.0
+    min_threads = min_threads or settings().render_min_threads
+    threads = fixed_threads() if threads is None else threads
+    
+    available = max(1, cpus - int(load))
+    workers = max(1, min(job_count, available // (threads or min_threads)))
+    configured = settings().render_workers
+    if configured:
+        workers = min(workers, configured)
+    
+    return workers, threads or max(1, available // workers)
+
+
+def render_task(task: RenderTask, threads: int) -> RenderReport:
+    """프로세스 풀 워커에서 실행되는 렌더링 함수"""
+    started = time.perf_counter()
+    video, error = None, None
+    try:
+        video = render_short(
+            task.script,
+            task.tts,
+            task.media,
+            task.output_path,
+            threads=threads,
+            fragmented=task.fragmented,
+            segment_cache=task.segment_cache,
+            caption_cache=task.caption_cache,
+        )
+    except Exception as e:
+        error = str(e)
+    
+    return RenderReport(
+        index=task.index,
+        video=video,
+        error=error,
+        seconds=time.perf_counter() - started,
+        threads=threads,
+        pid=os.getpid(),
+    )
+
+
+class RenderFarm:
+    """CPU 여유에 맞춘 프로세스 풀 렌더 스케줄러
+    
+    대기 중인 작업은 예상 비용이 큰 것부터 (longest job first) 워커에 배정해
+    하루치 배치가 가장 긴 렌더 하나의 시간 안팎에 끝나도록 합니다.
+    작업은 한꺼번에(run) 또는 준비되는 대로(submit) 넣을 수 있습니다.
+    """
+    
+    def __init__(self, job_count: int, workers: Optional[int] = None):
+        planned_workers, self.threads = plan_capacity(job_count)
+        self.workers = workers or planned_workers
+        if workers and not fixed_threads():
+            self.threads = max(1, planned_workers * self.threads // workers)
+        
+        self.reports: list[RenderReport] = []
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pending: list = []
+        self._running = 0
+        self._counter = itertools.count()
+        self._started = 0.0
+    
+    async def __aenter__(self) -> "RenderFarm":
+        self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        self._started = time.perf_counter()
+        logger.info(
+            f"Render farm: {self.workers} workers x {self.threads} threads "
+            f"(cpus={os.cpu_count()})"
+        )
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+        
+        if self.reports:
+            longest = max(report.seconds for report in self.reports)
+            logger.info(
+                f"Render batch: {len(self.reports)} jobs in "
+                f"{time.perf_counter() - self._started:.1f}s (longest {longest:.1f}s)"
+            )
+    
+    async def submit(self, task: RenderTask) -> RenderReport:
+        """작업을 대기열에 넣고 렌더링이 끝날 때까지 기다립니다."""
+        if self._pool is None:
+            raise RuntimeError("RenderFarm은 async with 블록 안에서 사용해야 합니다")
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        heapq.heappush(self._pending, (-task.cost, next(self._counter), task, future))
+        # 같은 시점에 들어온 작업끼리 비용 순으로 정렬되도록 배정은 다음 틱에
+        loop.call_soon(self._dispatch)
+        return await future
+    
+    async def run(self, tasks: list[RenderTask]) -> list[RenderReport]:
+        """작업 전체를 렌더링하고 입력 순서대로 보고서를 반환합니다."""
+        return list(await asyncio.gather(*(self.submit(task) for task in tasks)))
+    
+    def _dispatch(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._pending and self._running < self.workers:
+            _, _, task, future = heapq.heappop(self._pending)
+            # 기다리던 쪽이 이미 포기한 작업은 워커를 차지하지 않도록 버림
+            if future.cancelled():
+                logger.debug(f"Render #{task.index} dropped, waiter cancelled")
+                continue
+            self._running += 1
+            
+            running = loop.run_in_executor(self._pool, render_task, task, self.threads)
+            running.add_done_callback(
+                lambda done, task=task, future=future: self._on_done(done, task, future)
+            )
+    
+    def _on_done(self, done: asyncio.Future, task: RenderTask, future: asyncio.Future) -> None:
+        self._running -= 1
+        self._resolve(done, task, future)
+        self._dispatch()
+    
+    def _resolve(self, done: asyncio.Future, task: RenderTask, future: asyncio.Future) -> None:
+        if done.cancelled():
+            future.cancel()
+            return
+        
+        if done.exception() is None:
+            report = done.result()
+            self.reports.append(report)
+            status = "failed" if report.error else "done"
+            logger.info(
+                f"Render #{task.index} {status} in {report.seconds:.1f}s "
+                f"(cost {task.cost:.0f}s, {report.threads} threads, pid {report.pid})"
+            )
+        
+        # submit()을 기다리던 쪽이 취소됐으면 결과를 넣을 곳이 없음
+        if future.done():
+            return
+        
+        if done.exception() is not None:
+            future.set_exception(done.exception())
+        else:
+            future.set_result(done.result())
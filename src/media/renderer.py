@@ -0,0 +1,659 @@
+import json
+import os
+import shutil
+import subprocess
+import time
+import uuid
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from config.settings import ASSETS_DIR, settings
+from src.media.captions import CaptionAtlas, group_captions
+from src.media.segments import ClipSlice, RenderSegment, layout_clips, plan_segments, segment_key
+from src.models import MediaAsset, Script, ShortsVideo, TextTiming, TTSResult
+from src.utils.cache import DiskCache
+from src.utils.file_manager import generate_output_path, temp_directory
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+WIDTH = 1080
+HEIGHT = 1920
+
+# 자막 줄 위쪽 위치 (화면 높이 비율)
+CAPTION_Y = 0.68
+
+# 한글 글꼴 후보 (RENDER_FONT_FILE이 없을 때 assets/fonts 다음으로 탐색)
+FONT_CANDIDATES = [
+    "C:/Windows/Fonts/malgunbd.ttf",
+    "C:/Windows/Fonts/malgun.ttf",
+    "/System/Library/Fonts/AppleSDGothicNeo.ttc",
+    "/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf",
+    "/usr/share/fonts/opentype/noto/NotoSansCJK-Bold.ttc",
+    "/usr/share/fonts/noto-cjk/NotoSansCJK-Bold.ttc",
+]
+
+
+class RenderError(Exception):
+    """영상 렌더링 실패"""
+
+
+def find_ffmpeg() -> str:
+    """ffmpeg 실행 파일 경로 (설정 → PATH → moviepy 번들 순)"""
+    configured = settings().ffmpeg_path
+    if configured:
+        return configured
+    
+    found = shutil.which("ffmpeg")
+    if found:
+        return found
+    
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except (ImportError, RuntimeError) as e:
+        raise RenderError("ffmpeg를 찾을 수 없습니다") from e
+
+
+def find_font() -> Optional[Path]:
+    """자막용 한글 글꼴 경로"""
+    configured = settings().render_font_file
+    if configured:
+        return Path(configured)
+    
+    bundled = sorted(ASSETS_DIR.glob("fonts/*.[ot]t[fc]"))
+    if bundled:
+        return bundled[0]
+    
+    for candidate in FONT_CANDIDATES:
+        if Path(candidate).exists():
+            return Path(candidate)
+    
+    return None
+
+
+@lru_cache(maxsize=None)
+def has_filter(ffmpeg: str, name: str) -> bool:
+    """ffmpeg 빌드에 해당 필터가 있는지 확인"""
+    result = subprocess.run(
+        [ffmpeg, "-hide_banner", "-filters"],
+        capture_output=True,
+        text=True,
+    )
+    return any(
+        len(parts) > 1 and parts[1] == name
+        for parts in (line.split() for line in result.stdout.splitlines())
+    )
+
+
+def render_profile_path() -> Path:
+    return settings().output_path / "render_profile.json"
+
+
+def load_render_profile() -> dict:
+    """벤치마크가 고른 인코더 프로필 (없거나 비활성화면 빈 dict)
+    
+    환경 변수로 직접 지정한 설정은 프로필보다 우선합니다.
+    """
+    config = settings()
+    path = render_profile_path()
+    if not config.render_profile_enabled or not path.exists():
+        return {}
+    
+    try:
+        profile = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Failed to load render profile: {e}")
+        return {}
+    
+    return {
+        key: profile[key]
+        for key in ("preset", "crf", "threads")
+        if key in profile and f"render_{key}" not in config.model_fields_set
+    }
+
+
+def escape_filter_value(value: str) -> str:
+    """필터 그래프 옵션 값 이스케이프 (경로의 드라이브 콜론 등)"""
+    value = value.replace("\\", "/").replace(":", "\\:")
+    return f"'{value}'"
+
+
+def concat_escape(path: Path) -> str:
+    """concat demuxer 목록 파일용 경로 이스케이프"""
+    return str(path).replace("\\", "/").replace("'", "'\\''")
+
+
+class FFmpegRenderer:
+    """단일 FFmpeg 필터 그래프 기반 세로 영상 렌더러
+    
+    B-roll 9:16 스케일/크롭, 이어 붙이기, 자막 오버레이, TTS 오디오를 하나의
+    필터 그래프로 만들어 ffmpeg 프로세스 하나로 인코딩합니다. 프레임 단위
+    Python 처리가 없어 MoviePy보다 훨씬 빠릅니다.
+    
+    세그먼트 캐시를 쓰면 훅/본문 문장/아웃트로 구간을 입력 해시로 캐시해 두고,
+    훅만 고쳤을 때는 훅 구간만 다시 인코딩해 스트림 복사로 이어 붙입니다.
+    
+    fragmented를 켜면 출력 파일을 fragmented MP4로 앞에서부터 써 나가므로
+    (이미 쓴 바이트를 다시 고치지 않음) 렌더링 중에 업로드를 시작할 수 있습니다.
+    세그먼트 방식은 마지막 이어 붙이기에서야 출력이 생기므로 이때는 쓰지 않습니다.
+    """
+    
+    def __init__(
+        self,
+        ffmpeg: Optional[str] = None,
+        fps: Optional[int] = None,
+        preset: Optional[str] = None,
+        crf: Optional[int] = None,
+        threads: Optional[int] = None,
+        font_file: Optional[Path] = None,
+        segment_cache: Optional[DiskCache] = None,
+        fragmented: bool = False,
+        caption_cache: Optional[DiskCache] = None,
+    ):
+        config = settings()
+        profile = load_render_profile()
+        self.ffmpeg = ffmpeg or find_ffmpeg()
+        self.fps = fps or config.render_fps
+        self.preset = preset or profile.get("preset", config.render_preset)
+        self.crf = crf if crf is not None else profile.get("crf", config.render_crf)
+        self.threads = threads if threads is not None else profile.get("threads", config.render_threads)
+        self.font_file = font_file or find_font()
+        self.font_size = config.render_font_size
+        self.caption_max_chars = config.caption_max_chars
+        self.caption_mode: Optional[str] = None
+        self.atlas = (
+            CaptionAtlas(self.font_file, self.font_size, cache=caption_cache)
+            if self.font_file else None
+        )
+        
+        if segment_cache is None and config.render_cache_enabled:
+            segment_cache = DiskCache(
+                cache_dir=config.output_path / "cache" / "render",
+                max_size_mb=config.render_cache_max_mb,
+                suffix=".mp4",
+            )
+        self.segment_cache = segment_cache
+        self.fragmented = fragmented
+    
+    def render(
+        self,
+        script: Script,
+        tts: TTSResult,
+        media: list[MediaAsset],
+        output_path: Optional[Path] = None,
+    ) -> ShortsVideo:
+        """쇼츠 영상을 렌더링합니다.
+        
+        세그먼트 캐시가 켜져 있으면 문장 단위 세그먼트로 나눠 바뀐 구간만 다시
+        인코딩하고, 아니면 영상 전체를 필터 그래프 하나로 인코딩합니다.
+        
+        Args:
+            script: 스크립트
+            tts: 음성 합성 결과 (오디오 길이와 단어/문장 타이밍 사용)
+            media: B-roll 소재 (키워드 순서대로 같은 길이로 배치)
+            output_path: 저장 경로 (기본: 날짜별 출력 폴더)
+        
+        Returns:
+            ShortsVideo
+        """
+        job_id = uuid.uuid4().hex[:8]
+        output_path = output_path or generate_output_path(f"shorts_{job_id}", "mp4")
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        captions = self._captions(tts)
+        
+        started = time.perf_counter()
+        with temp_directory(f"render_{job_id}") as work_dir:
+            if self.segment_cache is not None and not self.fragmented:
+                self._render_segmented(script, tts, media, captions, work_dir, output_path)
+            else:
+                self._run(self.build_command(tts, media, captions, work_dir, output_path))
+        
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"Rendered {output_path.name}: {tts.duration:.1f}s video in {elapsed:.1f}s "
+            f"({tts.duration / max(elapsed, 1e-6):.1f}x realtime)"
+        )
+        
+        return ShortsVideo(
+            script=script,
+            audio_path=tts.audio_path,
+            video_path=str(output_path),
+            duration=tts.duration,
+            file_size_mb=output_path.stat().st_size / 1024 / 1024,
+        )
+    
+    def _run(self, command: list[str]) -> None:
+        result = subprocess.run(command, capture_output=True, text=True, errors="replace")
+        if result.returncode != 0:
+            raise RenderError(f"ffmpeg failed: {result.stderr.strip()[-1000:]}")
+    
+    def _captions(self, tts: TTSResult) -> list[TextTiming]:
+        """자막 줄과 그리는 방식을 정합니다.
+        
+        기본은 자막 줄 PNG를 overlay로 얹는 방식이고, Pillow가 글꼴을 못 읽으면
+        drawtext로 대체합니다.
+        """
+        self.caption_mode = None
+        if not tts.word_timings:
+            return []
+        if self.font_file is None:
+            logger.warning("No Korean font found, rendering without captions")
+            return []
+        
+        try:
+            self.atlas.font
+            self.caption_mode = "overlay"
+        except OSError as e:
+            if not has_filter(self.ffmpeg, "drawtext"):
+                logger.warning(f"Cannot load caption font ({e}) and no drawtext filter")
+                return []
+            logger.warning(f"Cannot load caption font with Pillow, using drawtext: {e}")
+            self.caption_mode = "drawtext"
+        
+        return group_captions(tts.word_timings, self.caption_max_chars)
+    
+    @property
+    def render_settings(self) -> dict:
+        """인코딩 결과에 영향을 주는 설정 (세그먼트 캐시 키에 포함)"""
+        return {
+            "size": [WIDTH, HEIGHT],
+            "fps": self.fps,
+            "preset": self.preset,
+            "crf": self.crf,
+            "font": str(self.font_file) if self.font_file else None,
+            "font_size": self.font_size,
+            "captions": self.caption_mode,
+        }
+    
+    def _render_segmented(
+        self,
+        script: Script,
+        tts: TTSResult,
+        media: list[MediaAsset],
+        captions: list[TextTiming],
+        work_dir: Path,
+        output_path: Path,
+    ) -> None:
+        """세그먼트별로 캐시를 찾거나 인코딩한 뒤 스트림 복사로 이어 붙입니다.
+        
+        오디오는 세그먼트에 넣지 않고 마지막에 TTS 전체를 한 번 인코딩합니다
+        (AAC 세그먼트를 그대로 이으면 경계마다 priming 무음이 끼어듭니다).
+        """
+        segments = plan_segments(script, tts, media, captions, self.fps)
+        render_settings = self.render_settings
+        
+        segment_paths = []
+        encoded = 0
+        for i, segment in enumerate(segments):
+            key = segment_key(segment, render_settings)
+            cached = self.segment_cache.get_path(key)
+            
+            if cached is None:
+                segment_path = work_dir / f"segment_{i:03d}.mp4"
+                segment_dir = work_dir / f"segment_{i:03d}"
+                segment_dir.mkdir()
+                self._run(self.build_segment_command(segment, segment_dir, segment_path))
+                cached = self.segment_cache.put_file(key, segment_path, move=True)
+                encoded += 1
+            
+            # 이어 붙이기 전에 다른 렌더가 캐시 항목을 지워도 되도록 작업 폴더에 고정
+            segment_paths.append(self._pin(cached, work_dir / f"pinned_{i:03d}.mp4"))
+        
+        logger.info(
+            f"Segments: {encoded} encoded, {len(segments) - encoded} from cache "
+            f"({', '.join(segment.name for segment in segments)})"
+        )
+        
+        list_path = work_dir / "segments.txt"
+        list_path.write_text(
+            "".join(f"file '{concat_escape(path)}'\n" for path in segment_paths),
+            encoding="utf-8",
+        )
+        self._run([
+            self.ffmpeg, "-hide_banner", "-y", "-loglevel", "error",
+            "-f", "concat", "-safe", "0", "-i", str(list_path),
+            "-i", tts.audio_path,
+            "-map", "0:v", "-map", "1:a",
+            "-c:v", "copy",
+            "-c:a", "aac", "-b:a", "192k",
+            "-t", f"{tts.duration:.3f}",
+            "-movflags", "+faststart",
+            str(output_path),
+        ])
+    
+    @staticmethod
+    def _pin(path: Path, target: Path) -> Path:
+        try:
+            os.link(path, target)
+        except OSError:
+            shutil.copyfile(path, target)
+        return target
+    
+    def build_command(
+        self,
+        tts: TTSResult,
+        media: list[MediaAsset],
+        captions: list[TextTiming],
+        work_dir: Path,
+        output_path: Path,
+    ) -> list[str]:
+        """영상 전체를 한 번에 인코딩하는 ffmpeg 명령 (필터 그래프는 스크립트 파일로 기록)"""
+        duration = tts.duration
+        slices = layout_clips(media, 0.0, duration, duration)
+        audio_index = max(len(slices), 1)
+        
+        graph_path = work_dir / "filtergraph.txt"
+        graph_path.write_text(
+            self.build_filtergraph(slices, duration, captions, work_dir, audio_index + 1),
+            encoding="utf-8",
+        )
+        
+        return [
+            self.ffmpeg, "-hide_banner", "-y", "-loglevel", "error",
+            *self._video_inputs(slices, duration),
+            "-i", tts.audio_path,
+            *self._caption_inputs(captions, work_dir),
+            "-filter_complex_script", str(graph_path),
+            "-map", "[vout]", "-map", f"{audio_index}:a",
+            *self._video_codec_args(),
+            "-c:a", "aac", "-b:a", "192k",
+            "-t", f"{duration:.3f}",
+            *self._container_args(),
+            str(output_path),
+        ]
+    
+    def build_segment_command(
+        self,
+        segment: RenderSegment,
+        work_dir: Path,
+        output_path: Path,
+    ) -> list[str]:
+        """세그먼트 하나를 (오디오 없이) 정확한 프레임 수로 인코딩하는 ffmpeg 명령"""
+        graph_path = work_dir / "filtergraph.txt"
+        graph_path.write_text(
+            self.build_filtergraph(
+                segment.slices,
+                segment.duration,
+                segment.captions,
+                work_dir,
+                max(len(segment.slices), 1),
+            ),
+            encoding="utf-8",
+        )
+        
+        return [
+            self.ffmpeg, "-hide_banner", "-y", "-loglevel", "error",
+            *self._video_inputs(segment.slices, segment.duration),
+            *self._caption_inputs(segment.captions, work_dir),
+            "-filter_complex_script", str(graph_path),
+            "-map", "[vout]", "-an",
+            *self._video_codec_args(),
+            "-frames:v", str(segment.frames),
+            str(output_path),
+        ]
+    
+    def _container_args(self) -> list[str]:
+        if self.fragmented:
+            # 2초마다 키프레임 → 2초 단위 조각이 파일 끝에 이어서 기록됨
+            return [
+                "-g", str(self.fps * 2),
+                "-movflags", "+frag_keyframe+empty_moov+default_base_moof",
+            ]
+        return ["-movflags", "+faststart"]
+    
+    def _video_codec_args(self) -> list[str]:
+        return [
+            "-c:v", "libx264", "-preset", self.preset, "-crf", str(self.crf),
+            "-pix_fmt", "yuv420p", "-r", str(self.fps),
+            "-threads", str(self.threads),
+        ]
+    
+    def _video_inputs(self, slices: list[ClipSlice], duration: float) -> list[str]:
+        inputs: list[str] = []
+        for piece in slices:
+            # 구간보다 짧은 소재는 반복, 입력 단계에서 구간 길이로 잘라 디코딩량 최소화
+            if piece.asset.media_type == "image":
+                inputs += ["-loop", "1"]
+            else:
+                inputs += ["-stream_loop", "-1", "-ss", f"{piece.offset:.3f}"]
+            inputs += ["-t", f"{piece.duration:.3f}", "-i", piece.asset.file_path]
+        
+        if not slices:
+            inputs += [
+                "-f", "lavfi",
+                "-i", f"color=c=0x111111:s={WIDTH}x{HEIGHT}:r={self.fps}:d={duration:.3f}",
+            ]
+        return inputs
+    
+    def _caption_inputs(self, captions: list[TextTiming], work_dir: Path) -> list[str]:
+        """overlay 방식일 때 자막 줄 PNG 입력 (한 줄당 한 장, 작업 폴더에 고정)"""
+        if self.caption_mode != "overlay":
+            return []
+        
+        inputs = []
+        for i, caption in enumerate(captions):
+            pinned = self._pin(self.atlas.image_path(caption.text), work_dir / f"caption_{i:03d}.png")
+            inputs += ["-i", str(pinned)]
+        return inputs
+    
+    def build_filtergraph(
+        self,
+        slices: list[ClipSlice],
+        duration: float,
+        captions: list[TextTiming],
+        work_dir: Path,
+        caption_input: int = 0,
+    ) -> str:
+        """B-roll 체인, 이어 붙이기, 자막까지의 필터 그래프
+        
+        caption_input은 overlay 방식에서 첫 자막 PNG의 입력 번호입니다.
+        """
+        durations = [piece.duration for piece in slices] or [duration]
+        
+        chains = []
+        for i, clip_duration in enumerate(durations):
+            chains.append(
+                f"[{i}:v]scale={WIDTH}:{HEIGHT}:force_original_aspect_ratio=increase,"
+                f"crop={WIDTH}:{HEIGHT},setsar=1,fps={self.fps},format=yuv420p,"
+                f"trim=duration={clip_duration:.3f},setpts=PTS-STARTPTS[v{i}]"
+            )
+        
+        labels = "".join(f"[v{i}]" for i in range(len(durations)))
+        if len(durations) > 1:
+            chains.append(f"{labels}concat=n={len(durations)}:v=1:a=0[base]")
+        else:
+            chains.append(f"{labels}null[base]")
+        
+        if self.caption_mode == "overlay" and captions:
+            # 자막 줄 PNG는 한 프레임짜리 입력이라 overlay가 마지막 프레임을 계속 사용
+            label = "base"
+            for i, caption in enumerate(captions):
+                output = "vout" if i == len(captions) - 1 else f"c{i}"
+                chains.append(
+                    f"[{label}][{caption_input + i}:v]overlay=x=(W-w)/2:y=H*{CAPTION_Y}"
+                    f":enable='between(t,{caption.start:.3f},{caption.end:.3f})'[{output}]"
+                )
+                label = output
+        elif self.caption_mode == "drawtext" and captions:
+            overlays = [
+                self._drawtext(caption, work_dir / f"caption_{i:03d}.txt")
+                for i, caption in enumerate(captions)
+            ]
+            chains.append(f"[base]{','.join(overlays)}[vout]")
+        else:
+            chains.append("[base]null[vout]")
+        
+        return ";\n".join(chains)
+    
+    def _drawtext(self, caption: TextTiming, text_path: Path) -> str:
+        # 한글/특수문자 이스케이프를 피하려고 자막 텍스트는 파일로 전달
+        text_path.write_text(caption.text, encoding="utf-8")
+        return (
+            f"drawtext=fontfile={escape_filter_value(str(self.font_file))}"
+            f":textfile={escape_filter_value(str(text_path))}"
+            f":fontsize={self.font_size}:fontcolor=white:borderw=5:bordercolor=black"
+            f":x=(w-text_w)/2:y=h*{CAPTION_Y}"
+            f":enable='between(t,{caption.start:.3f},{caption.end:.3f})'"
+        )
+
+
+class MoviePyRenderer:
+    """MoviePy 기반 대체 렌더러 (ffmpeg 필터 그래프 렌더링 실패 시 사용)
+    
+    프레임을 Python에서 합성하므로 느립니다. 자막은 글꼴을 Pillow로 읽을 수 있을 때만
+    FFmpeg 경로와 같은 자막 줄 이미지로 얹습니다.
+    """
+    
+    def __init__(
+        self,
+        threads: Optional[int] = None,
+        font_file: Optional[str] = None,
+        caption_cache: Optional[DiskCache] = None,
+    ):
+        config = settings()
+        self.threads = threads or config.render_threads or None
+        self.font_file = font_file or find_font()
+        self.caption_max_chars = config.caption_max_chars
+        self.atlas = (
+            CaptionAtlas(self.font_file, config.render_font_size, cache=caption_cache)
+            if self.font_file else None
+        )
+    
+    def render(
+        self,
+        script: Script,
+        tts: TTSResult,
+        media: list[MediaAsset],
+        output_path: Optional[Path] = None,
+    ) -> ShortsVideo:
+        from moviepy.editor import (
+            AudioFileClip,
+            ColorClip,
+            CompositeVideoClip,
+            ImageClip,
+            VideoFileClip,
+            concatenate_videoclips,
+            vfx,
+        )
+        
+        config = settings()
+        output_path = output_path or generate_output_path(
+            f"shorts_{uuid.uuid4().hex[:8]}", "mp4"
+        )
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        segment = tts.duration / max(len(media), 1)
+        
+        clips = []
+        for asset in media:
+            if asset.media_type == "image":
+                clip = ImageClip(asset.file_path, duration=segment)
+            else:
+                clip = VideoFileClip(asset.file_path, audio=False)
+                clip = clip.fx(vfx.loop, duration=segment)
+            
+            clips.append(self._cover(clip).set_duration(segment))
+        
+        if not clips:
+            clips.append(ColorClip((WIDTH, HEIGHT), color=(17, 17, 17), duration=tts.duration))
+        
+        audio = AudioFileClip(tts.audio_path)
+        video = concatenate_videoclips(clips)
+        overlays = [
+            ImageClip(self.atlas.rasterize(caption.text))
+            .set_start(caption.start)
+            .set_duration(caption.end - caption.start)
+            .set_position(("center", int(HEIGHT * CAPTION_Y)))
+            for caption in self._captions(tts)
+        ]
+        if overlays:
+            video = CompositeVideoClip([video, *overlays], size=(WIDTH, HEIGHT))
+        video = video.set_audio(audio).set_duration(tts.duration)
+        try:
+            video.write_videofile(
+                str(output_path),
+                fps=config.render_fps,
+                codec="libx264",
+                audio_codec="aac",
+                preset=config.render_preset,
+                threads=self.threads,
+                logger=None,
+            )
+        finally:
+            video.close()
+            audio.close()
+            for clip in clips:
+                clip.close()
+        
+        return ShortsVideo(
+            script=script,
+            audio_path=tts.audio_path,
+            video_path=str(output_path),
+            duration=tts.duration,
+            file_size_mb=output_path.stat().st_size / 1024 / 1024,
+        )
+    
+    def _captions(self, tts: TTSResult) -> list[TextTiming]:
+        if not tts.word_timings or self.atlas is None:
+            return []
+        try:
+            self.atlas.font
+        except OSError as e:
+            logger.warning(f"Cannot load caption font, rendering without captions: {e}")
+            return []
+        return group_captions(tts.word_timings, self.caption_max_chars)
+    
+    @staticmethod
+    def _cover(clip):
+        """9:16 화면을 꽉 채우도록 확대 후 가운데를 잘라냅니다.
+        
+        moviepy 1.0.3의 resize는 Pillow 10에서 제거된 ANTIALIAS를 쓰므로 직접 변환합니다.
+        """
+        import numpy as np
+        from PIL import Image
+        
+        scale = max(WIDTH / clip.w, HEIGHT / clip.h)
+        size = (round(clip.w * scale), round(clip.h * scale))
+        left = (size[0] - WIDTH) // 2
+        top = (size[1] - HEIGHT) // 2
+        
+        def transform(frame):
+            image = Image.fromarray(frame).resize(size, Image.LANCZOS)
+            return np.asarray(image.crop((left, top, left + WIDTH, top + HEIGHT)))
+        
+        return clip.fl_image(transform)
+
+
+def render_short(
+    script: Script,
+    tts: TTSResult,
+    media: list[MediaAsset],
+    output_path: Optional[Path] = None,
+    threads: Optional[int] = None,
+    fragmented: bool = False,
+    segment_cache: Optional[DiskCache] = None,
+    caption_cache: Optional[DiskCache] = None,
+) -> ShortsVideo:
+    """FFmpeg로 렌더링하고, 실패하면 MoviePy로 다시 시도합니다.
+    
+    fragmented 렌더링이 실패하면 output_path를 따라가며 업로드하던 쪽이 이미
+    일부를 보냈을 수 있으므로, MoviePy 결과는 다른 경로에 저장합니다.
+    캐시를 주지 않으면 output/cache 아래의 기본 캐시를 씁니다.
+    """
+    try:
+        renderer = FFmpegRenderer(
+            threads=threads,
+            segment_cache=segment_cache,
+            fragmented=fragmented,
+            caption_cache=caption_cache,
+        )
+        return renderer.render(script, tts, media, output_path)
+    except (RenderError, OSError) as e:
+        logger.warning(f"FFmpeg render failed, falling back to MoviePy: {e}")
+        if fragmented and output_path is not None:
+            output_path = output_path.with_name(f"{output_path.stem}_moviepy.mp4")
+        renderer = MoviePyRenderer(threads=threads, caption_cache=caption_cache)
+        return renderer.render(script, tts, media, output_path)
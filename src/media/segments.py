@@ -0,0 +1,159 @@
+import math
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+from src.media.library import file_sha256
+from src.models import MediaAsset, Script, TextTiming, TTSResult
+from src.utils.cache import make_cache_key
+
+
+# 세그먼트 인코딩 방식이 바뀌면 올려서 기존 캐시를 무효화
+SEGMENT_FORMAT_VERSION = 1
+
+
+@dataclass
+class ClipSlice:
+    """B-roll 소재에서 잘라 쓸 구간"""
+    asset: MediaAsset
+    offset: float
+    duration: float
+
+
+@dataclass
+class RenderSegment:
+    """따로 인코딩해 캐시하는 영상 구간 (훅, 본문 문장, 아웃트로)"""
+    name: str
+    start_frame: int
+    end_frame: int
+    fps: int
+    slices: list[ClipSlice] = field(default_factory=list)
+    captions: list[TextTiming] = field(default_factory=list)
+    
+    @property
+    def start(self) -> float:
+        return self.start_frame / self.fps
+    
+    @property
+    def frames(self) -> int:
+        return self.end_frame - self.start_frame
+    
+    @property
+    def duration(self) -> float:
+        return self.frames / self.fps
+
+
+@lru_cache(maxsize=1024)
+def _cached_sha256(path: str, mtime_ns: int, size: int) -> str:
+    return file_sha256(Path(path))
+
+
+def content_hash(path: str) -> str:
+    """파일 내용 해시 (경로/수정 시각/크기가 같으면 다시 읽지 않음)"""
+    stat = os.stat(path)
+    return _cached_sha256(path, stat.st_mtime_ns, stat.st_size)
+
+
+def layout_clips(
+    media: list[MediaAsset],
+    start: float,
+    end: float,
+    total: float,
+) -> list[ClipSlice]:
+    """전체 길이를 소재 수로 균등 분할한 배치에서 [start, end) 구간에 해당하는 조각들"""
+    if not media:
+        return []
+    
+    share = total / len(media)
+    slices = []
+    for i, asset in enumerate(media):
+        lo = max(start, i * share)
+        hi = min(end, (i + 1) * share)
+        if hi - lo <= 1e-3:
+            continue
+        
+        offset = lo - i * share
+        if asset.media_type != "image" and asset.duration:
+            # 짧은 소재는 반복 재생되므로 반복 주기 안의 위치로 환산
+            offset %= asset.duration
+        slices.append(ClipSlice(asset=asset, offset=offset, duration=hi - lo))
+    
+    return slices
+
+
+def _segment_name(sentence: str, script: Script, body_index: int) -> str:
+    compact = sentence.replace(" ", "")
+    if compact and compact in script.hook.replace(" ", ""):
+        return "hook"
+    if compact and compact in script.outro.replace(" ", ""):
+        return "outro"
+    return f"body_{body_index}"
+
+
+def plan_segments(
+    script: Script,
+    tts: TTSResult,
+    media: list[MediaAsset],
+    captions: list[TextTiming],
+    fps: int,
+) -> list[RenderSegment]:
+    """문장 타이밍을 프레임 경계에 맞춰 세그먼트로 나눕니다.
+    
+    경계를 프레임 단위로 맞춰야 세그먼트를 그대로 이어 붙여도 오디오와 어긋나지 않습니다.
+    """
+    total_frames = math.ceil(tts.duration * fps)
+    timings = tts.sentence_timings or [TextTiming(script.full_script, 0.0, tts.duration)]
+    
+    segments = []
+    body_index = 0
+    start_frame = 0
+    for i, timing in enumerate(timings):
+        is_last = i == len(timings) - 1
+        end_frame = total_frames if is_last else min(round(timing.end * fps), total_frames)
+        if end_frame <= start_frame:
+            continue
+        
+        name = _segment_name(timing.text, script, body_index)
+        if name.startswith("body"):
+            body_index += 1
+        
+        start, end = start_frame / fps, end_frame / fps
+        segments.append(RenderSegment(
+            name=name,
+            start_frame=start_frame,
+            end_frame=end_frame,
+            fps=fps,
+            slices=layout_clips(media, start, end, tts.duration),
+            captions=[
+                TextTiming(
+                    text=caption.text,
+                    start=max(caption.start, start) - start,
+                    end=min(caption.end, end) - start,
+                )
+                for caption in captions
+                if caption.end > start and caption.start < end
+            ],
+        ))
+        start_frame = end_frame
+    
+    return segments
+
+
+def segment_key(segment: RenderSegment, render_settings: dict) -> str:
+    """세그먼트 입력(소재 내용, 구간, 자막, 렌더 설정)으로 캐시 키를 만듭니다."""
+    return make_cache_key(
+        SEGMENT_FORMAT_VERSION,
+        render_settings,
+        segment.frames,
+        [
+            (
+                content_hash(piece.asset.file_path),
+                piece.asset.media_type,
+                round(piece.offset, 3),
+                round(piece.duration, 3),
+            )
+            for piece in segment.slices
+        ],
+        [(c.text, round(c.start, 3), round(c.end, 3)) for c in segment.captions],
+    )
@@ -0,0 +1,144 @@
+import asyncio
+import uuid
+from typing import Optional
+
+import httpx
+
+from config.settings import settings
+from src.media.downloader import DownloadError, MediaDownloader
+from src.media.library import MediaLibrary, normalize_keyword
+from src.media.pexels import PexelsClient, PexelsVideo
+from src.media.ranking import pick_file, rank_videos
+from src.models import MediaAsset, Script
+from src.utils.file_manager import temp_file
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class MediaSourcer:
+    """스크립트 키워드별 B-roll 소재 수집기
+    
+    키워드마다 라이브러리를 먼저 찾고, 없을 때만 Pexels를 검색해 9:16 적합도
+    순으로 골라 내려받습니다. 키워드들은 동시에 처리합니다.
+    """
+    
+    def __init__(
+        self,
+        library: Optional[MediaLibrary] = None,
+        api_key: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        concurrency: Optional[int] = None,
+    ):
+        self.config = settings()
+        self.library = library or MediaLibrary()
+        self.api_key = api_key or self.config.pexels_api_key
+        self.client = client
+        self._semaphore = asyncio.Semaphore(concurrency or self.config.media_concurrency)
+    
+    async def source(self, script: Script) -> list[MediaAsset]:
+        """스크립트 키워드 순서대로 소재를 하나씩 모읍니다.
+        
+        Returns:
+            MediaAsset 리스트 (소재를 찾지 못한 키워드는 제외)
+        """
+        keywords = list(dict.fromkeys(
+            normalize_keyword(k) for k in script.keywords if k.strip()
+        ))
+        if not keywords:
+            logger.warning(f"No keywords for media sourcing: {script.title}")
+            return []
+        
+        # 키워드별로 같은 길이의 구간을 맡는다고 보고 필요한 클립 길이 계산
+        min_duration = script.estimated_duration / len(keywords)
+        
+        if self.client is not None:
+            assets = await self._source_all(self.client, keywords, min_duration)
+        else:
+            timeout = httpx.Timeout(30.0, read=60.0)
+            async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
+                assets = await self._source_all(client, keywords, min_duration)
+        
+        # 여러 키워드가 같은 파일로 모이면 한 번만 사용
+        unique = list({asset.file_path: asset for asset in assets if asset}.values())
+        logger.info(f"Media sourced: {len(unique)} assets for {len(keywords)} keywords")
+        return unique
+    
+    async def _source_all(
+        self,
+        client: httpx.AsyncClient,
+        keywords: list[str],
+        min_duration: float,
+    ) -> list[Optional[MediaAsset]]:
+        pexels = PexelsClient(api_key=self.api_key, client=client)
+        return await asyncio.gather(*(
+            self._source_keyword(client, pexels, keyword, min_duration)
+            for keyword in keywords
+        ))
+    
+    async def _source_keyword(
+        self,
+        client: httpx.AsyncClient,
+        pexels: PexelsClient,
+        keyword: str,
+        min_duration: float,
+    ) -> Optional[MediaAsset]:
+        hits = self.library.find(keyword, min_duration)
+        if hits:
+            logger.debug(f"Media library hit: {keyword}")
+            return hits[0]
+        
+        if not self.api_key:
+            logger.warning(f"PEXELS_API_KEY not set, no media for '{keyword}'")
+            return None
+        
+        try:
+            async with self._semaphore:
+                videos = await pexels.search_videos(
+                    keyword,
+                    per_page=self.config.pexels_per_page,
+                    orientation="portrait",
+                )
+            
+            for video in rank_videos(videos, min_duration):
+                asset = self.library.get_by_source(video.url, keyword)
+                if asset is None:
+                    asset = await self._download(client, video, keyword)
+                if asset is not None:
+                    return asset
+        except (httpx.HTTPError, DownloadError) as e:
+            logger.warning(f"Media sourcing failed for '{keyword}': {e}")
+        
+        return None
+    
+    async def _download(
+        self,
+        client: httpx.AsyncClient,
+        video: PexelsVideo,
+        keyword: str,
+    ) -> Optional[MediaAsset]:
+        video_file = pick_file(video)
+        if video_file is None:
+            return None
+        
+        with temp_file(f"pexels_{video.id}_{uuid.uuid4().hex[:8]}", "mp4") as path:
+            async with self._semaphore:
+                result = await MediaDownloader(client).download(video_file.link, path)
+            
+            logger.info(
+                f"Downloaded Pexels video {video.id} "
+                f"({video_file.width}x{video_file.height}, {video.duration:.0f}s, "
+                f"{result.size / 1024 / 1024:.1f} MB)"
+            )
+            return await asyncio.to_thread(
+                self.library.add,
+                path,
+                keyword,
+                video.url,
+                "video",
+                video.duration,
+                video_file.width,
+                video_file.height,
+                result.sha256,
+            )
@@ -40,6 +40,19 @@ class NewsItem:
             "published_at": self.published_at.isoformat() if self.published_at else None,
             "image_url": self.image_url,
         }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "NewsItem":
+        published_at = data.get("published_at")
+        return cls(
+            title=data["title"],
+            summary=data.get("summary", ""),
+            url=data["url"],
+            source=NewsSource(data["source"]),
+            source_name=data.get("source_name", ""),
+            published_at=datetime.fromisoformat(published_at) if published_at else None,
+            image_url=data.get("image_url"),
+        )
 
 
 @dataclass
@@ -54,6 +67,14 @@ class SelectedNews:
             "selection_reason": self.selection_reason,
             "hook_idea": self.hook_idea,
         }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "SelectedNews":
+        return cls(
+            news_item=NewsItem.from_dict(data["news"]),
+            selection_reason=data.get("selection_reason", ""),
+            hook_idea=data.get("hook_idea", ""),
+        )
 
 
 @dataclass
@@ -88,6 +109,26 @@ class Script:
             "character_count": self.character_count,
             "estimated_duration": self.estimated_duration,
         }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "Script":
+        return cls(
+            title=data["title"],
+            hook=data.get("hook", ""),
+            body=data.get("body", ""),
+            outro=data.get("outro", ""),
+            full_script=data.get("full_script", ""),
+            keywords=list(data.get("keywords", [])),
+            hashtags=list(data.get("hashtags", [])),
+            description=data.get("description", ""),
+        )
+
+
+@dataclass
+class ScriptSegment:
+    name: str
+    text: str
+    script: Optional[Script] = None
 
 
 @dataclass
@@ -99,12 +140,52 @@ class TTSConfig:
     pitch: float = 0.0
 
 
+@dataclass
+class TextTiming:
+    """오디오 안에서 단어/문장이 발화되는 구간 (초)"""
+    text: str
+    start: float
+    end: float
+    
+    def to_dict(self) -> dict:
+        return {"text": self.text, "start": self.start, "end": self.end}
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "TextTiming":
+        return cls(text=data["text"], start=data["start"], end=data["end"])
+
+
 @dataclass
 class TTSResult:
     audio_path: str
     duration: float
     character_count: int
     provider: TTSProvider
+    word_timings: list[TextTiming] = field(default_factory=list)
+    sentence_timings: list[TextTiming] = field(default_factory=list)
+    
+    def to_dict(self) -> dict:
+        return {
+            "audio_path": self.audio_path,
+            "duration": self.duration,
+            "character_count": self.character_count,
+            "provider": self.provider.value,
+            "word_timings": [timing.to_dict() for timing in self.word_timings],
+            "sentence_timings": [timing.to_dict() for timing in self.sentence_timings],
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "TTSResult":
+        return cls(
+            audio_path=data["audio_path"],
+            duration=data["duration"],
+            character_count=data["character_count"],
+            provider=TTSProvider(data["provider"]),
+            word_timings=[TextTiming.from_dict(t) for t in data.get("word_timings", [])],
+            sentence_timings=[
+                TextTiming.from_dict(t) for t in data.get("sentence_timings", [])
+            ],
+        )
 
 
 @dataclass
@@ -116,6 +197,29 @@ class MediaAsset:
     duration: Optional[float] = None
     width: Optional[int] = None
     height: Optional[int] = None
+    
+    def to_dict(self) -> dict:
+        return {
+            "file_path": self.file_path,
+            "media_type": self.media_type,
+            "source_url": self.source_url,
+            "keyword": self.keyword,
+            "duration": self.duration,
+            "width": self.width,
+            "height": self.height,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "MediaAsset":
+        return cls(
+            file_path=data["file_path"],
+            media_type=data["media_type"],
+            source_url=data["source_url"],
+            keyword=data["keyword"],
+            duration=data.get("duration"),
+            width=data.get("width"),
+            height=data.get("height"),
+        )
 
 
 @dataclass
@@ -138,6 +242,18 @@ class ShortsVideo:
             "file_size_mb": self.file_size_mb,
             "created_at": self.created_at.isoformat(),
         }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "ShortsVideo":
+        return cls(
+            script=Script.from_dict(data["script"]),
+            audio_path=data["audio_path"],
+            video_path=data["video_path"],
+            thumbnail_path=data.get("thumbnail_path"),
+            duration=data.get("duration", 0.0),
+            file_size_mb=data.get("file_size_mb", 0.0),
+            created_at=datetime.fromisoformat(data["created_at"]),
+        )
 
 
 @dataclass
@@ -160,6 +276,18 @@ class UploadResult:
             "success": self.success,
             "error_message": self.error_message,
         }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "UploadResult":
+        return cls(
+            video_id=data["video_id"],
+            video_url=data["video_url"],
+            title=data["title"],
+            privacy=UploadPrivacy(data["privacy"]),
+            uploaded_at=datetime.fromisoformat(data["uploaded_at"]),
+            success=data.get("success", True),
+            error_message=data.get("error_message"),
+        )
 
 
 @dataclass
@@ -0,0 +1,5 @@
+from src.pipeline.journal import RunJournal
+from src.pipeline.runner import ShortsJob, Stage, StageRunner
+from src.pipeline.shorts import ShortsPipeline
+
+__all__ = ["RunJournal", "ShortsJob", "Stage", "StageRunner", "ShortsPipeline"]
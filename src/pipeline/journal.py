@@ -0,0 +1,107 @@
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from config.settings import settings
+from src.crawlers.dedup import canonical_url
+from src.models import SelectedNews
+from src.pipeline.runner import ShortsJob
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+# run_id는 그대로 디렉토리 이름이 되므로 경로 구분자나 ".."가 들어갈 수 없게 제한
+RUN_ID_PATTERN = re.compile(r"[A-Za-z0-9_-]+")
+
+
+class RunJournal:
+    """재개 가능한 파이프라인 실행 기록
+    
+    output/runs/<run_id>/journal.json에 선별 결과와 쇼츠(뉴스)별 단계 출력을
+    to_dict 형태로 저장합니다. 단계가 끝날 때마다 기록하므로, 중간에 실패해도
+    --resume <run_id>로 완료된 단계를 건너뛰고 이어서 실행할 수 있습니다.
+    
+    Raises:
+        ValueError: run_id에 영문/숫자/_/- 외의 문자가 있는 경우
+    """
+    
+    def __init__(self, run_id: Optional[str] = None, runs_dir: Optional[Path] = None):
+        self.run_id = datetime.now().strftime("%Y%m%d_%H%M%S") if run_id is None else run_id
+        if not RUN_ID_PATTERN.fullmatch(self.run_id):
+            raise ValueError(f"잘못된 실행 ID입니다 (영문, 숫자, _, -만 사용): {self.run_id!r}")
+        self.runs_dir = runs_dir or settings().output_path / "runs"
+        self.path = self.runs_dir / self.run_id / "journal.json"
+        
+        self.created_at = datetime.now()
+        self.selected: Optional[list[SelectedNews]] = None
+        self.stories: dict[str, dict] = {}
+    
+    @classmethod
+    def load(cls, run_id: str, runs_dir: Optional[Path] = None) -> "RunJournal":
+        """저장된 실행 기록을 불러옵니다.
+        
+        Raises:
+            ValueError: run_id 형식이 잘못된 경우
+            FileNotFoundError: 해당 run_id의 기록이 없는 경우
+        """
+        journal = cls(run_id=run_id, runs_dir=runs_dir)
+        if not journal.path.exists():
+            raise FileNotFoundError(f"실행 기록을 찾을 수 없습니다: {journal.path}")
+        
+        data = json.loads(journal.path.read_text(encoding="utf-8"))
+        journal.created_at = datetime.fromisoformat(data["created_at"])
+        if data.get("selected") is not None:
+            journal.selected = [SelectedNews.from_dict(item) for item in data["selected"]]
+        journal.stories = data.get("stories", {})
+        
+        logger.info(f"Loaded run journal {run_id}: {len(journal.stories)} stories")
+        return journal
+    
+    @staticmethod
+    def story_key(selected: SelectedNews) -> str:
+        return canonical_url(selected.news_item.url) or selected.news_item.title
+    
+    def record_selection(self, selected: list[SelectedNews]) -> None:
+        self.selected = selected
+        self.save()
+    
+    def record_job(self, job: ShortsJob, stage_name: Optional[str] = None) -> None:
+        """작업의 현재 상태를 기록합니다 (StageRunner의 on_stage_done 콜백)."""
+        self.stories[self.story_key(job.selected)] = job.to_dict()
+        self.save()
+    
+    def restore_jobs(self) -> list[ShortsJob]:
+        """선별 결과와 기록된 단계 출력으로 작업 목록을 복원합니다.
+        
+        실패했던 작업은 오류를 지우고, 실패한 단계부터 다시 실행되게 합니다.
+        """
+        jobs = []
+        for i, selected in enumerate(self.selected or []):
+            data = self.stories.get(self.story_key(selected))
+            if data is None:
+                jobs.append(ShortsJob(index=i, selected=selected))
+                continue
+            
+            job = ShortsJob.from_dict(data)
+            job.index = i
+            job.error = None
+            jobs.append(job)
+        
+        return jobs
+    
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "run_id": self.run_id,
+            "created_at": self.created_at.isoformat(),
+            "selected": [item.to_dict() for item in self.selected] if self.selected is not None else None,
+            "stories": self.stories,
+        }
+        
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        tmp_path.replace(self.path)
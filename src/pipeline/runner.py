@@ -0,0 +1,199 @@
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Literal, Optional
+
+from src.models import MediaAsset, Script, SelectedNews, ShortsVideo, TTSResult, UploadResult
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class ShortsJob:
+    """쇼츠 한 편이 파이프라인 단계를 지나며 채워지는 작업 단위"""
+    index: int
+    selected: SelectedNews
+    script: Optional[Script] = None
+    tts: Optional[TTSResult] = None
+    media: list[MediaAsset] = field(default_factory=list)
+    video: Optional[ShortsVideo] = None
+    upload: Optional[UploadResult] = None
+    error: Optional[str] = None
+    completed_stages: list[str] = field(default_factory=list)
+    stage_seconds: dict[str, float] = field(default_factory=dict)
+    
+    @property
+    def failed(self) -> bool:
+        return self.error is not None
+    
+    def to_dict(self) -> dict:
+        return {
+            "index": self.index,
+            "selected": self.selected.to_dict(),
+            "script": self.script.to_dict() if self.script else None,
+            "tts": self.tts.to_dict() if self.tts else None,
+            "media": [asset.to_dict() for asset in self.media],
+            "video": self.video.to_dict() if self.video else None,
+            "upload": self.upload.to_dict() if self.upload else None,
+            "error": self.error,
+            "completed_stages": self.completed_stages,
+            "stage_seconds": self.stage_seconds,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "ShortsJob":
+        return cls(
+            index=data["index"],
+            selected=SelectedNews.from_dict(data["selected"]),
+            script=Script.from_dict(data["script"]) if data.get("script") else None,
+            tts=TTSResult.from_dict(data["tts"]) if data.get("tts") else None,
+            media=[MediaAsset.from_dict(asset) for asset in data.get("media", [])],
+            video=ShortsVideo.from_dict(data["video"]) if data.get("video") else None,
+            upload=UploadResult.from_dict(data["upload"]) if data.get("upload") else None,
+            error=data.get("error"),
+            completed_stages=list(data.get("completed_stages", [])),
+            stage_seconds=dict(data.get("stage_seconds", {})),
+        )
+
+
+@dataclass
+class Stage:
+    """파이프라인 단계
+    
+    executor가 "async"면 func는 코루틴 함수, "process"면 프로세스 풀에서 실행할
+    최상위(피클 가능) 동기 함수여야 합니다. 둘 다 ShortsJob을 받아 ShortsJob을 반환합니다.
+    """
+    name: str
+    func: Callable[[ShortsJob], Any]
+    workers: int = 1
+    executor: Literal["async", "process"] = "async"
+    queue_size: int = 2
+    
+    @property
+    def worker_count(self) -> int:
+        """실제로 띄우는 워커 수 (설정값이 0 이하여도 최소 1)"""
+        return max(1, self.workers)
+
+
+_DONE = object()
+
+
+class StageRunner:
+    """단계들을 bounded queue로 연결해 쇼츠 여러 편을 겹쳐 실행
+    
+    각 단계는 자기 워커 수만큼 동시에 작업을 처리하므로, 1번 쇼츠가 렌더링되는
+    동안 2번은 음성 합성, 3번은 스크립트 생성을 진행합니다. 실패한 작업은
+    이후 단계를 건너뛰고 그대로 결과로 전달됩니다.
+    """
+    
+    def __init__(
+        self,
+        stages: list[Stage],
+        process_workers: Optional[int] = None,
+        on_stage_done: Optional[Callable[[ShortsJob, str], None]] = None,
+    ):
+        if not stages:
+            raise ValueError("최소 한 개의 단계가 필요합니다")
+        self.stages = stages
+        self.process_workers = process_workers
+        self.on_stage_done = on_stage_done
+    
+    async def run(self, jobs: list[ShortsJob]) -> list[ShortsJob]:
+        """모든 작업을 단계 순서대로 처리하고 입력 순서대로 반환합니다."""
+        
+        queues = [asyncio.Queue() for _ in self.stages]
+        # 단계 사이 큐만 bounded (앞 단계가 너무 앞서 나가지 않도록)
+        for i, stage in enumerate(self.stages[1:], start=1):
+            queues[i] = asyncio.Queue(maxsize=max(1, self.stages[i - 1].queue_size))
+        output: asyncio.Queue = asyncio.Queue()
+        
+        needs_pool = any(stage.executor == "process" for stage in self.stages)
+        pool = ProcessPoolExecutor(max_workers=self.process_workers) if needs_pool else None
+        
+        started = time.perf_counter()
+        try:
+            stage_tasks = []
+            for i, stage in enumerate(self.stages):
+                next_queue = queues[i + 1] if i + 1 < len(self.stages) else output
+                stage_tasks.append(asyncio.create_task(
+                    self._run_stage(stage, queues[i], next_queue, pool)
+                ))
+            
+            for job in jobs:
+                await queues[0].put(job)
+            for _ in range(self.stages[0].worker_count):
+                await queues[0].put(_DONE)
+            
+            await asyncio.gather(*stage_tasks)
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        
+        results = []
+        while not output.empty():
+            item = output.get_nowait()
+            if item is not _DONE:
+                results.append(item)
+        
+        logger.info(
+            f"Pipeline stages finished: {len(results)} jobs in "
+            f"{time.perf_counter() - started:.1f}s"
+        )
+        return sorted(results, key=lambda job: job.index)
+    
+    async def _run_stage(
+        self,
+        stage: Stage,
+        inbox: asyncio.Queue,
+        outbox: asyncio.Queue,
+        pool: Optional[ProcessPoolExecutor],
+    ) -> None:
+        await asyncio.gather(*(
+            self._worker(stage, inbox, outbox, pool) for _ in range(stage.worker_count)
+        ))
+        
+        # 다음 단계의 워커 수만큼 종료 신호 전달
+        next_index = self.stages.index(stage) + 1
+        next_workers = self.stages[next_index].worker_count if next_index < len(self.stages) else 1
+        for _ in range(next_workers):
+            await outbox.put(_DONE)
+    
+    async def _worker(
+        self,
+        stage: Stage,
+        inbox: asyncio.Queue,
+        outbox: asyncio.Queue,
+        pool: Optional[ProcessPoolExecutor],
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            job = await inbox.get()
+            if job is _DONE:
+                return
+            
+            if not job.failed and stage.name not in job.completed_stages:
+                started = time.perf_counter()
+                try:
+                    if stage.executor == "process":
+                        job = await loop.run_in_executor(pool, stage.func, job)
+                    else:
+                        job = await stage.func(job)
+                    job.completed_stages.append(stage.name)
+                except Exception as e:
+                    logger.error(f"[{stage.name}] job #{job.index} failed: {e}")
+                    job.error = f"{stage.name}: {e}"
+                
+                job.stage_seconds[stage.name] = time.perf_counter() - started
+                
+                if self.on_stage_done is not None:
+                    # 진행 기록 실패로 이미 끝난 작업이나 단계 전체를 실패시키지 않음
+                    try:
+                        self.on_stage_done(job, stage.name)
+                    except Exception as e:
+                        logger.error(f"[{stage.name}] job #{job.index} progress not recorded: {e}")
+            
+            await outbox.put(job)
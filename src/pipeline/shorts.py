@@ -0,0 +1,234 @@
+import asyncio
+from datetime import datetime
+from typing import AsyncIterator, Optional
+
+from config.settings import settings
+from src.ai import NewsSelector, ScriptStreamError, ScriptWriter
+from src.crawlers import (
+    CrawlJob,
+    CrawlOrchestrator,
+    FeedCache,
+    GoogleNewsCrawler,
+    NaverNewsCrawler,
+    StoryIndex,
+    WatermarkStore,
+)
+from src.media import MediaSourcer, RenderFarm, RenderTask
+from src.models import NewsItem, PipelineResult, ScriptSegment, SelectedNews, ShortsVideo
+from src.pipeline.journal import RunJournal
+from src.pipeline.runner import ShortsJob, Stage, StageRunner
+from src.tts import TTSEngine
+from src.upload import QuotaExceededError, UploadError, YouTubeUploader
+from src.utils.file_manager import generate_output_path
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class ShortsPipeline:
+    """뉴스 수집부터 업로드까지의 쇼츠 생성 파이프라인
+    
+    수집/선별은 실행당 한 번, 이후 단계는 쇼츠별 작업으로 StageRunner에서
+    겹쳐 실행합니다. 스크립트는 스트리밍으로 생성해 훅이 완성되는 즉시 음성
+    합성을 시작합니다.
+    """
+    
+    def __init__(
+        self,
+        story_index: Optional[StoryIndex] = None,
+        incremental: Optional[bool] = None,
+        upload: Optional[bool] = None,
+    ):
+        self.config = settings()
+        self.story_index = story_index if story_index is not None else StoryIndex()
+        self.selector = NewsSelector(story_index=self.story_index)
+        self.writer = ScriptWriter()
+        self.tts = TTSEngine()
+        self.media = MediaSourcer()
+        self.farm: Optional[RenderFarm] = None
+        # 스크립트 단계에서 시작해 TTS 단계가 이어받는 합성 작업 (작업 index별)
+        self._pending_tts: dict[int, asyncio.Future] = {}
+        self.feed_cache = FeedCache() if self.config.crawl_feed_cache_enabled else None
+        
+        if incremental is None:
+            incremental = self.config.crawl_incremental
+        self.watermarks = WatermarkStore() if incremental else None
+        
+        if upload is None:
+            upload = self.config.upload_enabled
+        self.uploader = YouTubeUploader() if upload else None
+    
+    async def crawl(self) -> list[NewsItem]:
+        """설정된 검색어들을 두 소스에서 동시에 수집합니다."""
+        google = GoogleNewsCrawler(cache=self.feed_cache)
+        naver = NaverNewsCrawler()
+        
+        jobs = [CrawlJob(naver, limit=self.config.crawl_limit)]
+        for query in self.config.crawl_queries:
+            jobs.append(CrawlJob(google, query, self.config.crawl_limit))
+            jobs.append(CrawlJob(naver, query, self.config.crawl_limit))
+        
+        async with CrawlOrchestrator(watermarks=self.watermarks) as orchestrator:
+            return await orchestrator.run(jobs)
+    
+    async def select(self, news_items: list[NewsItem]) -> list[SelectedNews]:
+        return await self.selector.select(news_items, count=self.config.daily_shorts_count)
+    
+    def build_stages(self) -> list[Stage]:
+        """쇼츠별 단계 구성"""
+        stages = [
+            Stage("script", self._script_stage, workers=self.config.script_concurrency),
+            Stage("tts", self._tts_stage, workers=self.config.pipeline_tts_workers),
+            Stage("media", self._media_stage, workers=self.config.pipeline_media_workers),
+            # 렌더 동시성은 RenderFarm이 정하므로 단계 워커는 대기열을 채우는 용도
+            Stage("render", self._render_stage, workers=max(1, self.config.daily_shorts_count)),
+        ]
+        if self.uploader is not None:
+            stages.append(
+                Stage("upload", self._upload_stage, workers=self.config.upload_concurrency)
+            )
+        return stages
+    
+    async def _script_stage(self, job: ShortsJob) -> ShortsJob:
+        # 구간이 완성되는 대로 합성을 시작해 나머지 스크립트 생성과 음성 합성을 겹침
+        segments: asyncio.Queue[ScriptSegment] = asyncio.Queue()
+        tts = asyncio.ensure_future(self.tts.synthesize_stream(self._drain(segments)))
+        try:
+            async for segment in self.writer.write_stream(job.selected):
+                segments.put_nowait(segment)
+                if segment.script is not None:
+                    job.script = segment.script
+        except ScriptStreamError as e:
+            logger.warning(f"Short #{job.index} script stream invalid, regenerating: {e}")
+        finally:
+            if job.script is None:
+                tts.cancel()
+                await asyncio.gather(tts, return_exceptions=True)
+        
+        if job.script is None:
+            # 스트리밍으로 받은 구간은 버리고 새로 생성 (TTS 단계에서 처음부터 합성)
+            job.script = await self.writer.write(job.selected)
+        else:
+            self._pending_tts[job.index] = tts
+        return job
+    
+    @staticmethod
+    async def _drain(segments: asyncio.Queue) -> AsyncIterator[ScriptSegment]:
+        while True:
+            segment = await segments.get()
+            yield segment
+            if segment.script is not None:
+                return
+    
+    async def _tts_stage(self, job: ShortsJob) -> ShortsJob:
+        # 스크립트 단계에서 시작한 합성을 이어받음 (이어서 실행하는 경우 등에는 처음부터)
+        pending = self._pending_tts.pop(job.index, None)
+        if pending is not None:
+            job.tts = await pending
+        else:
+            job.tts = await self.tts.synthesize(job.script)
+        return job
+    
+    async def _media_stage(self, job: ShortsJob) -> ShortsJob:
+        job.media = await self.media.source(job.script)
+        return job
+    
+    async def _render_stage(self, job: ShortsJob) -> ShortsJob:
+        if self.uploader is None or not self.config.upload_while_rendering:
+            job.video = await self._render(RenderTask(job.index, job.script, job.tts, job.media))
+            return job
+        
+        # 렌더러가 쓰는 fragmented MP4를 따라가며 업로드해 렌더링과 업로드를 겹침
+        output_path = generate_output_path(f"shorts_{job.index}", "mp4")
+        task = RenderTask(job.index, job.script, job.tts, job.media, output_path, fragmented=True)
+        rendering = asyncio.ensure_future(self._render(task))
+        try:
+            try:
+                job.upload = await self.uploader.upload_while_rendering(
+                    output_path, job.script, rendering
+                )
+            except (UploadError, QuotaExceededError) as e:
+                # 업로드 단계에서 다시 올림 (같은 영상이므로 할당량은 다시 차감하지 않음)
+                logger.warning(
+                    f"Short #{job.index} streaming upload failed, uploading after render: {e}"
+                )
+            
+            job.video = await rendering
+        finally:
+            # 업로드 쪽에서 예상하지 못한 예외가 나도 렌더 작업을 남겨 두지 않음
+            if not rendering.done():
+                rendering.cancel()
+            await asyncio.gather(rendering, return_exceptions=True)
+        return job
+    
+    async def _render(self, task: RenderTask) -> ShortsVideo:
+        report = await self.farm.submit(task)
+        if report.error:
+            raise RuntimeError(report.error)
+        return report.video
+    
+    async def _upload_stage(self, job: ShortsJob) -> ShortsJob:
+        # 렌더링 중 스트리밍 업로드가 끝났으면 건너뜀
+        if job.upload is None:
+            job.upload = await self.uploader.upload(job.video)
+        return job
+    
+    async def run(self, resume_run_id: Optional[str] = None) -> PipelineResult:
+        """파이프라인 전체를 실행합니다.
+        
+        Args:
+            resume_run_id: 이어서 실행할 이전 실행 ID (완료된 단계는 건너뜀)
+        """
+        result = PipelineResult()
+        
+        if resume_run_id:
+            journal = RunJournal.load(resume_run_id)
+        else:
+            journal = RunJournal()
+        logger.info(f"Run ID: {journal.run_id}")
+        
+        if journal.selected is None:
+            try:
+                news_items = await self.crawl()
+                journal.record_selection(await self.select(news_items))
+            except Exception as e:
+                logger.exception(f"Crawl/selection failed: {e}")
+                result.errors.append(f"select: {e}")
+                result.success = False
+                result.finished_at = datetime.now()
+                return result
+        else:
+            logger.info(f"Resuming with {len(journal.selected)} selected news")
+        
+        jobs = journal.restore_jobs()
+        async with RenderFarm(job_count=len(jobs)) as farm:
+            self.farm = farm
+            runner = StageRunner(self.build_stages(), on_stage_done=journal.record_job)
+            try:
+                jobs = await runner.run(jobs)
+            finally:
+                # TTS 단계까지 가지 못한 작업의 합성은 정리
+                for pending in self._pending_tts.values():
+                    pending.cancel()
+                await asyncio.gather(*self._pending_tts.values(), return_exceptions=True)
+                self._pending_tts.clear()
+        
+        return self._collect(jobs, result)
+    
+    def _collect(self, jobs: list[ShortsJob], result: PipelineResult) -> PipelineResult:
+        for job in jobs:
+            if job.video:
+                result.shorts_videos.append(job.video)
+                self.story_index.record(job.selected.news_item, job.video)
+            if job.upload:
+                result.upload_results.append(job.upload)
+            if job.error:
+                result.errors.append(f"#{job.index} {job.error}")
+            
+            timings = ", ".join(f"{name}={sec:.1f}s" for name, sec in job.stage_seconds.items())
+            logger.info(f"Short #{job.index} {'failed' if job.failed else 'done'} ({timings})")
+        
+        result.success = not result.errors
+        result.finished_at = datetime.now()
+        return result
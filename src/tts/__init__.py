@@ -0,0 +1,14 @@
+from src.tts.base import BaseTTSProvider
+from src.tts.cache import TTSCache
+from src.tts.edge import EdgeTTSProvider
+from src.tts.engine import TTSEngine, create_provider
+from src.tts.typecast import TypecastTTSProvider
+
+__all__ = [
+    "BaseTTSProvider",
+    "TTSCache",
+    "EdgeTTSProvider",
+    "TypecastTTSProvider",
+    "TTSEngine",
+    "create_provider",
+]
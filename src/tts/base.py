@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional
+
+from src.models import TextTiming, TTSConfig, TTSProvider
+
+
+class BaseTTSProvider(ABC):
+    """TTS 제공자 베이스 클래스"""
+    
+    provider: TTSProvider
+    audio_format: str = "mp3"
+    
+    def __init__(self, max_concurrency: int = 4):
+        self.max_concurrency = max(1, max_concurrency)
+    
+    @abstractmethod
+    async def synthesize(
+        self,
+        text: str,
+        config: TTSConfig,
+        output_path: Path,
+    ) -> Optional[list[TextTiming]]:
+        """텍스트 한 조각을 음성 파일로 합성합니다.
+        
+        Args:
+            text: 합성할 텍스트 (문장 단위)
+            config: 음성 설정
+            output_path: 저장할 파일 경로 (확장자는 audio_format)
+        
+        Returns:
+            조각 시작 기준 단어 타이밍 (제공자가 지원하지 않으면 None)
+        """
+        pass
+    
+    def default_config(self) -> TTSConfig:
+        """제공자 기본 음성 설정"""
+        return TTSConfig(voice_id="")
@@ -0,0 +1,106 @@
+import json
+import unicodedata
+from pathlib import Path
+from typing import Optional
+
+from config.settings import settings
+from src.models import TextTiming, TTSConfig, TTSProvider
+from src.utils.cache import CacheStats, DiskCache, evict_lru, make_cache_key
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화 (유니코드 NFC, 공백 정리)"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class TTSCache:
+    """문장 단위 TTS 오디오 캐시
+    
+    (제공자, 음성, 스타일, 감정, 속도, 피치, 정규화된 텍스트) 해시를 키로
+    합성된 오디오를 저장합니다. 반복되는 아웃트로 문장이나 재렌더링 시
+    같은 문장을 다시 합성하지 않아 Typecast 과금 글자 수를 줄입니다.
+    단어 타이밍은 메타데이터로 함께 저장해 캐시 적중 시에도 자막 정렬이 유지됩니다.
+    포맷별 오디오와 메타데이터는 디렉토리만 나누고 용량 한도(max_size_mb)는 함께 씁니다.
+    """
+    
+    def __init__(self, cache_dir: Optional[Path] = None, max_size_mb: Optional[float] = None):
+        config = settings()
+        self.cache_dir = cache_dir or config.output_path / "cache" / "tts"
+        self.max_size_mb = max_size_mb or config.tts_cache_max_mb
+        self._stores: dict[str, DiskCache] = {}
+        self.meta = DiskCache(
+            cache_dir=self.cache_dir / "meta",
+            max_size_mb=self.max_size_mb,
+            suffix=".json",
+        )
+    
+    @property
+    def stats(self) -> CacheStats:
+        stats = CacheStats()
+        for store in self._stores.values():
+            stats.hits += store.stats.hits
+            stats.misses += store.stats.misses
+            stats.writes += store.stats.writes
+            stats.evictions += store.stats.evictions
+        return stats
+    
+    @property
+    def size_mb(self) -> float:
+        return sum(store.size_mb for store in self._caches())
+    
+    def _caches(self) -> list[DiskCache]:
+        return [*self._stores.values(), self.meta]
+    
+    def _store(self, audio_format: str) -> DiskCache:
+        # pydub이 확장자로 포맷을 판단하므로 포맷별로 디렉토리와 확장자를 나눔
+        if audio_format not in self._stores:
+            self._stores[audio_format] = DiskCache(
+                cache_dir=self.cache_dir / audio_format,
+                max_size_mb=self.max_size_mb,
+                suffix=f".{audio_format}",
+            )
+        return self._stores[audio_format]
+    
+    @staticmethod
+    def make_key(provider: TTSProvider, config: TTSConfig, text: str) -> str:
+        return make_cache_key(
+            provider.value,
+            config.voice_id,
+            config.style,
+            config.emotion,
+            config.speed,
+            config.pitch,
+            normalize_text(text),
+        )
+    
+    def get(
+        self,
+        key: str,
+        audio_format: str,
+    ) -> Optional[tuple[Path, Optional[list[TextTiming]]]]:
+        """캐시된 (오디오 경로, 단어 타이밍)을 반환합니다. 없으면 None."""
+        path = self._store(audio_format).get_path(key)
+        if path is None:
+            return None
+        
+        data = self.meta.get_bytes(key)
+        if data is None:
+            return path, None
+        
+        words = json.loads(data).get("words")
+        return path, [TextTiming.from_dict(w) for w in words] if words else None
+    
+    def put(
+        self,
+        key: str,
+        audio_path: Path,
+        words: Optional[list[TextTiming]] = None,
+    ) -> Path:
+        if words:
+            meta = {"words": [word.to_dict() for word in words]}
+            self.meta.put_bytes(key, json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+        path = self._store(audio_path.suffix.lstrip(".")).put_file(key, audio_path)
+        
+        if self.size_mb > self.max_size_mb:
+            evict_lru(self._caches(), int(self.max_size_mb * 1024 * 1024))
+        return path
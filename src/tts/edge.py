@@ -0,0 +1,50 @@
+from pathlib import Path
+from typing import Optional
+
+import edge_tts
+
+from config.settings import settings
+from src.models import TextTiming, TTSConfig, TTSProvider
+from src.tts.base import BaseTTSProvider
+
+
+# WordBoundary 이벤트의 offset/duration 단위 (100ns)
+TICKS_PER_SECOND = 10_000_000
+
+
+class EdgeTTSProvider(BaseTTSProvider):
+    """Microsoft Edge TTS (무료)
+    
+    오디오와 함께 스트리밍되는 WordBoundary 이벤트로 단어 타이밍을 반환합니다.
+    """
+    
+    provider = TTSProvider.EDGE
+    audio_format = "mp3"
+    
+    def default_config(self) -> TTSConfig:
+        return TTSConfig(voice_id=settings().edge_voice)
+    
+    async def synthesize(
+        self,
+        text: str,
+        config: TTSConfig,
+        output_path: Path,
+    ) -> Optional[list[TextTiming]]:
+        communicate = edge_tts.Communicate(
+            text,
+            config.voice_id or settings().edge_voice,
+            rate=f"{round((config.speed - 1.0) * 100):+d}%",
+            pitch=f"{round(config.pitch):+d}Hz",
+        )
+        
+        words: list[TextTiming] = []
+        with open(output_path, "wb") as f:
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    f.write(chunk["data"])
+                elif chunk["type"] == "WordBoundary":
+                    start = chunk["offset"] / TICKS_PER_SECOND
+                    end = start + chunk["duration"] / TICKS_PER_SECOND
+                    words.append(TextTiming(text=chunk["text"], start=start, end=end))
+        
+        return words
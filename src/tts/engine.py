@@ -0,0 +1,243 @@
+import asyncio
+import os
+import shutil
+import time
+import uuid
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+from pydub import AudioSegment
+
+from config.settings import settings
+from src.models import Script, ScriptSegment, TextTiming, TTSConfig, TTSProvider, TTSResult
+from src.tts.base import BaseTTSProvider
+from src.tts.cache import TTSCache
+from src.tts.edge import EdgeTTSProvider
+from src.tts.splitter import split_sentences
+from src.tts.timing import align_chunks
+from src.tts.typecast import TypecastTTSProvider
+from src.utils.file_manager import generate_output_path, temp_directory
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+def create_provider(provider: Optional[TTSProvider] = None) -> BaseTTSProvider:
+    """설정에 맞는 TTS 제공자 생성 (Typecast 키가 없으면 Edge TTS 사용)"""
+    config = settings()
+    provider = provider or TTSProvider(config.tts_provider)
+    
+    if provider == TTSProvider.TYPECAST and config.typecast_api_key:
+        return TypecastTTSProvider(max_concurrency=config.tts_typecast_concurrency)
+    
+    if provider == TTSProvider.TYPECAST:
+        logger.warning("TYPECAST_API_KEY not set, falling back to Edge TTS")
+    return EdgeTTSProvider(max_concurrency=config.tts_edge_concurrency)
+
+
+class TTSEngine:
+    """문장 단위 병렬 합성 TTS 엔진
+    
+    스크립트를 문장으로 나눠 제공자별 동시 요청 한도 안에서 동시에 합성하고,
+    순서대로 이어 붙여 하나의 오디오 파일로 만듭니다. 자막용 단어/문장
+    타이밍도 함께 계산해 음성 인식 같은 추가 분석이 필요 없습니다.
+    """
+    
+    def __init__(
+        self,
+        provider: Optional[BaseTTSProvider] = None,
+        cache: Optional[TTSCache] = None,
+    ):
+        self.provider = provider or create_provider()
+        self._semaphore = asyncio.Semaphore(self.provider.max_concurrency)
+        
+        if cache is None and settings().tts_cache_enabled:
+            cache = TTSCache()
+        self.cache = cache
+    
+    async def synthesize(
+        self,
+        script: Script,
+        config: Optional[TTSConfig] = None,
+        output_path: Optional[Path] = None,
+    ) -> TTSResult:
+        """스크립트 전체를 음성으로 합성합니다.
+        
+        Args:
+            script: 합성할 스크립트 (full_script 사용)
+            config: 음성 설정 (기본: 제공자 기본값)
+            output_path: 저장 경로 (기본: 날짜별 출력 폴더)
+        
+        Returns:
+            TTSResult (duration은 이어 붙인 실제 오디오 길이, 타이밍 포함)
+        """
+        config = config or self.provider.default_config()
+        # 같은 초에 여러 쇼츠를 합성해도 경로가 겹치지 않도록 고유 접두어 사용
+        job_id = uuid.uuid4().hex[:8]
+        
+        sentences = split_sentences(script.full_script)
+        
+        with temp_directory(f"tts_{job_id}") as work_dir:
+            return await self._assemble(
+                script, sentences, config, output_path, job_id, work_dir, {}
+            )
+    
+    async def synthesize_stream(
+        self,
+        segments: AsyncIterator[ScriptSegment],
+        config: Optional[TTSConfig] = None,
+        output_path: Optional[Path] = None,
+    ) -> TTSResult:
+        """스크립트 구간이 생성되는 대로 문장 합성을 시작합니다.
+        
+        hook이 도착하면 body 생성을 기다리지 않고 바로 합성을 시작합니다. full_script가
+        구간을 이어 붙인 것과 같으면 구간별로 나눈 문장을 그대로 쓰고, 다르면
+        full_script를 다시 나눠 이미 합성 중인 문장만 재사용합니다. 스트림이 예외로
+        끝나면 시작한 합성을 취소하고 예외를 그대로 올립니다.
+        
+        Args:
+            segments: ScriptWriter.write_stream()이 내보내는 구간
+            config: 음성 설정 (기본: 제공자 기본값)
+            output_path: 저장 경로 (기본: 날짜별 출력 폴더)
+        """
+        config = config or self.provider.default_config()
+        job_id = uuid.uuid4().hex[:8]
+        started: dict[str, asyncio.Future] = {}
+        streamed: list[str] = []
+        
+        with temp_directory(f"tts_{job_id}") as work_dir:
+            try:
+                script = None
+                async for segment in segments:
+                    if segment.script is not None:
+                        script = segment.script
+                        break
+                    # 짧은 문장 합치기가 구간 경계를 넘지 않도록 구간별로 나눔
+                    for sentence in split_sentences(segment.text):
+                        streamed.append(sentence)
+                        if sentence not in started:
+                            started[sentence] = asyncio.ensure_future(self._synthesize_chunk(
+                                len(started), sentence, config, work_dir
+                            ))
+                
+                if script is None:
+                    raise ValueError("스크립트 스트림이 complete 구간 없이 끝났습니다")
+                
+                sentences = streamed
+                if " ".join(streamed) != " ".join(script.full_script.split()):
+                    sentences = split_sentences(script.full_script)
+                return await self._assemble(
+                    script, sentences, config, output_path, job_id, work_dir, started
+                )
+            finally:
+                for task in started.values():
+                    task.cancel()
+                await asyncio.gather(*started.values(), return_exceptions=True)
+    
+    async def _assemble(
+        self,
+        script: Script,
+        sentences: list[str],
+        config: TTSConfig,
+        output_path: Optional[Path],
+        job_id: str,
+        work_dir: Path,
+        started: dict[str, asyncio.Future],
+    ) -> TTSResult:
+        """문장들을 (이미 시작한 합성은 재사용해) 합성하고 이어 붙입니다."""
+        if not sentences:
+            raise ValueError("합성할 스크립트가 비어 있습니다")
+        
+        output_path = output_path or generate_output_path(f"tts_{job_id}", "mp3")
+        reused = sum(sentence in started for sentence in set(sentences))
+        logger.info(
+            f"Synthesizing {len(sentences)} sentences with {self.provider.provider.value} "
+            f"(concurrency={self.provider.max_concurrency}, already started={reused})"
+        )
+        started_at = time.perf_counter()
+        
+        # 스트리밍 중 시작한 조각과 파일 이름이 겹치지 않도록 뒤 번호부터 사용
+        offset = len(started)
+        chunks = await asyncio.gather(*(
+            started.get(sentence) or self._synthesize_chunk(offset + i, sentence, config, work_dir)
+            for i, sentence in enumerate(sentences)
+        ))
+        durations = await asyncio.to_thread(
+            self._stitch, [path for path, _ in chunks], output_path
+        )
+        
+        duration = sum(durations)
+        word_timings, sentence_timings = align_chunks(
+            sentences, durations, [words for _, words in chunks]
+        )
+        
+        logger.info(
+            f"TTS done: {duration:.1f}s audio in {time.perf_counter() - started_at:.1f}s"
+        )
+        if self.cache is not None:
+            stats = self.cache.stats
+            logger.debug(
+                f"TTS cache: {stats.hits} hits / {stats.misses} misses "
+                f"({self.cache.size_mb:.1f} MB)"
+            )
+        
+        return TTSResult(
+            audio_path=str(output_path),
+            duration=duration,
+            character_count=len(script.full_script),
+            provider=self.provider.provider,
+            word_timings=word_timings,
+            sentence_timings=sentence_timings,
+        )
+    
+    async def _synthesize_chunk(
+        self,
+        index: int,
+        text: str,
+        config: TTSConfig,
+        work_dir: Path,
+    ) -> tuple[Path, Optional[list[TextTiming]]]:
+        cache_key = None
+        path = work_dir / f"chunk_{index:03d}.{self.provider.audio_format}"
+        if self.cache is not None:
+            cache_key = self.cache.make_key(self.provider.provider, config, text)
+            cached = self.cache.get(cache_key, self.provider.audio_format)
+            if cached is not None:
+                # 이어 붙이기 전에 다른 작업이 캐시 항목을 지울 수 있으므로 작업 폴더로 고정
+                cached_path, words = cached
+                try:
+                    await asyncio.to_thread(self._pin, cached_path, path)
+                    return path, words
+                except FileNotFoundError:
+                    logger.debug(f"TTS cache entry evicted before use: {cache_key[:12]}")
+        
+        async with self._semaphore:
+            words = await self.provider.synthesize(text, config, path)
+        
+        if cache_key is not None:
+            # 이어 붙이기 전에 다른 작업이 캐시 항목을 지울 수 있으므로 원본 경로를 사용
+            self.cache.put(cache_key, path, words)
+        return path, words
+    
+    @staticmethod
+    def _pin(path: Path, target: Path) -> None:
+        try:
+            os.link(path, target)
+        except FileNotFoundError:
+            raise
+        except OSError:
+            shutil.copyfile(path, target)
+    
+    def _stitch(self, chunk_paths: list[Path], output_path: Path) -> list[float]:
+        """문장 오디오를 순서대로 이어 붙이고 문장별 실제 길이(초)를 반환합니다."""
+        combined = AudioSegment.empty()
+        durations = []
+        for path in chunk_paths:
+            segment = AudioSegment.from_file(path)
+            durations.append(len(segment) / 1000.0)
+            combined += segment
+        
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        combined.export(output_path, format=output_path.suffix.lstrip(".") or "mp3")
+        return durations
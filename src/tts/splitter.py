@@ -0,0 +1,55 @@
+import re
+
+
+# 문장 끝 (마침표/물음표/느낌표/말줄임표 뒤 공백)
+SENTENCE_END = re.compile(r"(?<=[.!?。…])\s+")
+CLAUSE_END = re.compile(r"(?<=[,，、])\s+")
+
+
+def split_sentences(text: str, min_chars: int = 15, max_chars: int = 120) -> list[str]:
+    """한국어 스크립트를 문장 단위로 나눕니다.
+    
+    너무 짧은 문장은 다음 문장과 합쳐 요청 수를 줄이고,
+    너무 긴 문장은 쉼표 기준으로 다시 나눕니다.
+    
+    Args:
+        text: 전체 스크립트
+        min_chars: 이보다 짧은 문장은 이웃 문장과 합침
+        max_chars: 이보다 긴 문장은 쉼표에서 나눔
+    
+    Returns:
+        문장 리스트 (순서 유지)
+    """
+    text = " ".join(text.split())
+    if not text:
+        return []
+    
+    sentences = []
+    for sentence in SENTENCE_END.split(text):
+        if len(sentence) <= max_chars:
+            sentences.append(sentence)
+            continue
+        
+        # 긴 문장은 쉼표 단위로 max_chars 이하가 되게 묶음
+        current = ""
+        for clause in CLAUSE_END.split(sentence):
+            if current and len(current) + len(clause) + 1 > max_chars:
+                sentences.append(current)
+                current = clause
+            else:
+                current = f"{current} {clause}".strip()
+        if current:
+            sentences.append(current)
+    
+    merged: list[str] = []
+    for sentence in sentences:
+        if merged and len(merged[-1]) < min_chars:
+            merged[-1] = f"{merged[-1]} {sentence}"
+        else:
+            merged.append(sentence)
+    
+    if len(merged) > 1 and len(merged[-1]) < min_chars:
+        tail = merged.pop()
+        merged[-1] = f"{merged[-1]} {tail}"
+    
+    return merged
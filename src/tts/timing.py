@@ -0,0 +1,64 @@
+from typing import Optional
+
+from src.models import TextTiming
+
+
+def estimate_word_timings(text: str, start: float, end: float) -> list[TextTiming]:
+    """구간 길이를 글자 수에 비례해 어절별로 나눠 단어 타이밍을 추정합니다.
+    
+    WordBoundary 같은 정렬 정보를 주지 않는 제공자용입니다.
+    """
+    words = text.split()
+    total_chars = sum(len(word) for word in words)
+    if not words or end <= start:
+        return []
+    
+    timings = []
+    cursor = start
+    for word in words:
+        word_end = cursor + (end - start) * len(word) / total_chars
+        timings.append(TextTiming(text=word, start=cursor, end=word_end))
+        cursor = word_end
+    
+    timings[-1].end = end
+    return timings
+
+
+def align_chunks(
+    sentences: list[str],
+    durations: list[float],
+    chunk_words: list[Optional[list[TextTiming]]],
+) -> tuple[list[TextTiming], list[TextTiming]]:
+    """문장별 합성 결과를 이어 붙인 오디오 기준 타이밍으로 변환합니다.
+    
+    Args:
+        sentences: 문장 텍스트 (이어 붙인 순서)
+        durations: 문장 오디오 길이 (초)
+        chunk_words: 문장 시작 기준 단어 타이밍 (없으면 None → 추정)
+    
+    Returns:
+        (단어 타이밍, 문장 타이밍)
+    """
+    word_timings: list[TextTiming] = []
+    sentence_timings: list[TextTiming] = []
+    offset = 0.0
+    
+    for sentence, duration, words in zip(sentences, durations, chunk_words):
+        end = offset + duration
+        sentence_timings.append(TextTiming(text=sentence, start=offset, end=end))
+        
+        if words:
+            word_timings.extend(
+                TextTiming(
+                    text=word.text,
+                    start=offset + word.start,
+                    end=min(offset + word.end, end),
+                )
+                for word in words
+            )
+        else:
+            word_timings.extend(estimate_word_timings(sentence, offset, end))
+        
+        offset = end
+    
+    return word_timings, sentence_timings
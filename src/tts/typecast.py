@@ -0,0 +1,94 @@
+import asyncio
+from pathlib import Path
+from typing import Optional
+
+import httpx
+
+from config.settings import settings
+from src.models import TTSConfig, TTSProvider
+from src.tts.base import BaseTTSProvider
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class TypecastError(Exception):
+    """Typecast API 오류"""
+
+
+class TypecastTTSProvider(BaseTTSProvider):
+    """Typecast API (한국어 자연스러움, 글자 수 과금)"""
+    
+    provider = TTSProvider.TYPECAST
+    audio_format = "wav"
+    
+    SPEAK_URL = "https://typecast.ai/api/speak"
+    POLL_INTERVAL = 0.5
+    POLL_TIMEOUT = 60.0
+    
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        api_key: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
+        super().__init__(max_concurrency)
+        self.api_key = api_key or settings().typecast_api_key
+        self.client = client
+    
+    def default_config(self) -> TTSConfig:
+        return TTSConfig(voice_id=settings().typecast_voice_id)
+    
+    async def synthesize(self, text: str, config: TTSConfig, output_path: Path) -> None:
+        if self.client is not None:
+            await self._synthesize(self.client, text, config, output_path)
+        else:
+            async with httpx.AsyncClient(timeout=30.0) as client:
+                await self._synthesize(client, text, config, output_path)
+    
+    async def _synthesize(
+        self,
+        client: httpx.AsyncClient,
+        text: str,
+        config: TTSConfig,
+        output_path: Path,
+    ) -> None:
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+        payload = {
+            "actor_id": config.voice_id,
+            "text": text,
+            "lang": "auto",
+            "tempo": config.speed,
+            "pitch": config.pitch,
+            "volume": 100,
+            "emotion_tone_preset": config.emotion,
+            "xapi_hd": True,
+            "xapi_audio_format": self.audio_format,
+            "model_version": "latest",
+        }
+        
+        response = await client.post(self.SPEAK_URL, json=payload, headers=headers)
+        response.raise_for_status()
+        poll_url = response.json()["result"]["speak_v2_url"]
+        
+        # 합성 완료까지 폴링
+        elapsed = 0.0
+        while True:
+            status_response = await client.get(poll_url, headers=headers)
+            status_response.raise_for_status()
+            result = status_response.json()["result"]
+            
+            if result["status"] == "done":
+                break
+            if result["status"] == "failed":
+                raise TypecastError(f"Typecast 합성 실패: {text[:30]}")
+            if elapsed > self.POLL_TIMEOUT:
+                raise TypecastError(f"Typecast 합성 시간 초과: {text[:30]}")
+            
+            await asyncio.sleep(self.POLL_INTERVAL)
+            elapsed += self.POLL_INTERVAL
+        
+        audio = await client.get(result["audio_download_url"])
+        audio.raise_for_status()
+        output_path.write_bytes(audio.content)
@@ -0,0 +1,10 @@
+from src.upload.quota import QuotaExceededError, QuotaLedger
+from src.upload.youtube import UploadError, UploadSessionStore, YouTubeUploader
+
+__all__ = [
+    "QuotaExceededError",
+    "QuotaLedger",
+    "UploadError",
+    "UploadSessionStore",
+    "YouTubeUploader",
+]
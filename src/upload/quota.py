@@ -0,0 +1,113 @@
+import json
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+from config.settings import settings
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+# YouTube Data API 할당량은 태평양 시간 자정에 초기화됨
+QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+
+# 작업별 할당량 단위 (https://developers.google.com/youtube/v3/determine_quota_cost)
+QUOTA_COSTS = {
+    "videos.insert": 1600,
+    "videos.update": 50,
+    "videos.list": 1,
+    "thumbnails.set": 50,
+}
+
+# 장부에 남겨 둘 날짜 수
+HISTORY_DAYS = 30
+
+
+class QuotaExceededError(Exception):
+    """오늘 남은 할당량으로 작업을 끝낼 수 없음"""
+
+
+def quota_day(now: Optional[datetime] = None) -> str:
+    """할당량 기준 날짜 (태평양 시간)"""
+    now = now or datetime.now(QUOTA_TIMEZONE)
+    if now.tzinfo is None:
+        now = now.astimezone()
+    return now.astimezone(QUOTA_TIMEZONE).date().isoformat()
+
+
+class QuotaLedger:
+    """일별 YouTube API 할당량 사용 장부
+    
+    작업을 시작하기 전에 비용을 먼저 차감(charge)하므로, 동시에 여러 업로드가
+    돌아도 남은 할당량으로 끝낼 수 없는 업로드는 시작하지 않습니다. 장부는
+    JSON 파일로 남겨 실행이 바뀌어도 같은 날의 사용량이 이어집니다.
+    """
+    
+    def __init__(self, path: Optional[Path] = None, daily_limit: Optional[int] = None):
+        config = settings()
+        self.path = path or config.output_path / "state" / "youtube_quota.json"
+        self.daily_limit = daily_limit or config.youtube_daily_quota
+        self._days: dict[str, dict[str, int]] = {}
+        self._lock = threading.Lock()
+        self._load()
+    
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        
+        try:
+            self._days = json.loads(self.path.read_text(encoding="utf-8"))
+        except Exception as e:
+            logger.warning(f"Failed to load quota ledger: {e}")
+    
+    def used(self, day: Optional[str] = None) -> int:
+        return sum(self._days.get(day or quota_day(), {}).values())
+    
+    def remaining(self, day: Optional[str] = None) -> int:
+        return max(0, self.daily_limit - self.used(day))
+    
+    def can_afford(self, operation: str, count: int = 1) -> bool:
+        return QUOTA_COSTS[operation] * count <= self.remaining()
+    
+    def charge(self, operation: str) -> int:
+        """작업 비용을 오늘 사용량에 기록합니다.
+        
+        Raises:
+            QuotaExceededError: 남은 할당량이 비용보다 적을 때 (기록하지 않음)
+        """
+        cost = QUOTA_COSTS[operation]
+        with self._lock:
+            day = quota_day()
+            if cost > self.remaining(day):
+                raise QuotaExceededError(
+                    f"{operation} needs {cost} units, {self.remaining(day)} left for {day}"
+                )
+            
+            usage = self._days.setdefault(day, {})
+            usage[operation] = usage.get(operation, 0) + cost
+            self._save()
+        
+        logger.debug(f"Quota: {operation} -{cost} ({self.remaining(day)} left for {day})")
+        return cost
+    
+    def refund(self, operation: str) -> None:
+        """요청이 서버에 닿지 않은 작업의 비용을 되돌립니다."""
+        cost = QUOTA_COSTS[operation]
+        with self._lock:
+            usage = self._days.get(quota_day(), {})
+            if usage.get(operation, 0) >= cost:
+                usage[operation] -= cost
+                self._save()
+    
+    def _save(self) -> None:
+        cutoff = (date.fromisoformat(quota_day()) - timedelta(days=HISTORY_DAYS)).isoformat()
+        self._days = {day: usage for day, usage in self._days.items() if day >= cutoff}
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self._days, indent=2), encoding="utf-8")
+        tmp_path.replace(self.path)
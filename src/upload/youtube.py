@@ -0,0 +1,533 @@
+import asyncio
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import httpx
+
+from config.settings import PROJECT_ROOT, settings
+from src.models import Script, ShortsVideo, UploadPrivacy, UploadResult
+from src.upload.quota import QuotaExceededError, QuotaLedger
+from src.utils.cache import make_cache_key
+from src.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+UPLOAD_URL = "https://www.googleapis.com/upload/youtube/v3/videos"
+SCOPES = ["https://www.googleapis.com/auth/youtube.upload"]
+
+# 재개 가능 업로드의 청크는 마지막 청크를 빼고 256KB 배수여야 함
+CHUNK_ALIGN = 256 * 1024
+
+# 308 Resume Incomplete
+RESUME_INCOMPLETE = 308
+
+
+class UploadError(Exception):
+    """업로드 실패 (재시도 초과 또는 서버 거부)"""
+
+
+def load_credentials():
+    """저장된 OAuth 토큰을 읽고, 만료됐으면 갱신, 없으면 브라우저 인증을 진행합니다."""
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+    from google_auth_oauthlib.flow import InstalledAppFlow
+    
+    config = settings()
+    token_path = PROJECT_ROOT / config.youtube_token_file
+    
+    credentials = None
+    if token_path.exists():
+        credentials = Credentials.from_authorized_user_file(str(token_path), SCOPES)
+    
+    if credentials and credentials.expired and credentials.refresh_token:
+        credentials.refresh(Request())
+    elif not credentials or not credentials.valid:
+        flow = InstalledAppFlow.from_client_secrets_file(
+            str(PROJECT_ROOT / config.youtube_client_secret_file), SCOPES
+        )
+        credentials = flow.run_local_server(port=0)
+    
+    token_path.parent.mkdir(parents=True, exist_ok=True)
+    token_path.write_text(credentials.to_json(), encoding="utf-8")
+    return credentials
+
+
+@dataclass
+class UploadSession:
+    """서버에 열어 둔 재개 가능 업로드 세션 (size가 None이면 전체 크기 미정)"""
+    session_uri: str
+    size: Optional[int]
+    offset: int = 0
+    
+    @property
+    def total(self) -> str:
+        """Content-Range의 전체 크기 부분"""
+        return "*" if self.size is None else str(self.size)
+    
+    def to_dict(self) -> dict:
+        return {"session_uri": self.session_uri, "size": self.size, "offset": self.offset}
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "UploadSession":
+        return cls(
+            session_uri=data["session_uri"],
+            size=data["size"],
+            offset=data.get("offset", 0),
+        )
+
+
+class UploadSessionStore:
+    """영상 파일별 업로드 세션 URI 저장소
+    
+    네트워크가 끊기거나 프로세스가 죽어도 다음 시도에서 같은 세션으로 받은
+    위치부터 이어 올리도록 JSON 파일에 보관합니다.
+    """
+    
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or settings().output_path / "state" / "upload_sessions.json"
+        self._sessions: dict[str, UploadSession] = {}
+        self._load()
+    
+    @staticmethod
+    def make_key(path: Path) -> str:
+        """파일이 바뀌면 (다시 렌더링되면) 세션을 재사용하지 않도록 크기/mtime 포함"""
+        stat = path.stat()
+        return f"{path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+    
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            self._sessions = {
+                key: UploadSession.from_dict(value) for key, value in data.items()
+            }
+        except Exception as e:
+            logger.warning(f"Failed to load upload sessions: {e}")
+    
+    def get(self, key: str) -> Optional[UploadSession]:
+        return self._sessions.get(key)
+    
+    def put(self, key: str, session: UploadSession) -> None:
+        self._sessions[key] = session
+        self.save()
+    
+    def remove(self, key: str) -> None:
+        if self._sessions.pop(key, None) is not None:
+            self.save()
+    
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps({key: value.to_dict() for key, value in self._sessions.items()}),
+            encoding="utf-8",
+        )
+        tmp_path.replace(self.path)
+
+
+class YouTubeUploader:
+    """YouTube 재개 가능(resumable) 업로드
+    
+    파일을 청크 단위로 PUT 하고, 연결이 끊기면 `bytes */total` 조회로 서버가
+    받은 위치를 확인해 거기서부터 이어 올립니다. 세션 URI는 저장해 두므로
+    프로세스가 다시 시작돼도 처음부터 올리지 않습니다. 업로드 시작 전에
+    할당량을 차감해 오늘 끝낼 수 없는 업로드는 시작하지 않습니다. 같은 영상의
+    세션을 다시 열 때(스트리밍 업로드 실패 후 전체 업로드 등)는 다시 차감하지 않습니다.
+    """
+    
+    RETRY_BACKOFF = 1.0
+    # 렌더링 중인 파일이 자랐는지 확인하는 간격 (초)
+    STREAM_POLL_INTERVAL = 0.5
+    
+    def __init__(
+        self,
+        credentials=None,
+        client: Optional[httpx.AsyncClient] = None,
+        chunk_size: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        sessions: Optional[UploadSessionStore] = None,
+        ledger: Optional[QuotaLedger] = None,
+        upload_url: str = UPLOAD_URL,
+    ):
+        config = settings()
+        self.credentials = credentials
+        self.client = client
+        chunk_size = chunk_size or config.upload_chunk_mb * 1024 * 1024
+        self.chunk_size = max(CHUNK_ALIGN, chunk_size // CHUNK_ALIGN * CHUNK_ALIGN)
+        self.max_retries = config.upload_max_retries if max_retries is None else max_retries
+        self.sessions = sessions if sessions is not None else UploadSessionStore()
+        self.ledger = ledger if ledger is not None else QuotaLedger()
+        self.upload_url = upload_url
+        self._slots = asyncio.Semaphore(concurrency or config.upload_concurrency)
+        # 할당량을 차감했지만 아직 업로드가 끝나지 않은 영상
+        self._charged: set[str] = set()
+    
+    async def upload(
+        self,
+        video: ShortsVideo,
+        privacy: Optional[UploadPrivacy] = None,
+    ) -> UploadResult:
+        """쇼츠 한 편을 업로드합니다 (동시 업로드 수는 concurrency로 제한).
+        
+        Raises:
+            QuotaExceededError: 오늘 남은 할당량으로 업로드를 시작할 수 없을 때
+            UploadError: 재시도 초과 또는 서버가 업로드를 거부했을 때
+        """
+        privacy = privacy or UploadPrivacy(settings().upload_privacy)
+        
+        async with self._slots:
+            if self.client is not None:
+                return await self._upload(self.client, video, privacy)
+            
+            async with httpx.AsyncClient(timeout=120.0) as client:
+                return await self._upload(client, video, privacy)
+    
+    async def upload_many(
+        self,
+        videos: list[ShortsVideo],
+        privacy: Optional[UploadPrivacy] = None,
+    ) -> list[UploadResult]:
+        """여러 편을 동시에 업로드하고, 실패한 편은 success=False 결과로 돌려줍니다."""
+        
+        async def upload_one(video: ShortsVideo) -> UploadResult:
+            try:
+                return await self.upload(video, privacy)
+            except (UploadError, QuotaExceededError, OSError) as e:
+                logger.error(f"Upload failed for {video.video_path}: {e}")
+                return UploadResult(
+                    video_id="",
+                    video_url="",
+                    title=video.script.title,
+                    privacy=privacy or UploadPrivacy(settings().upload_privacy),
+                    success=False,
+                    error_message=str(e),
+                )
+        
+        return list(await asyncio.gather(*(upload_one(video) for video in videos)))
+    
+    async def upload_while_rendering(
+        self,
+        path: Path,
+        script: Script,
+        rendering: asyncio.Future,
+        privacy: Optional[UploadPrivacy] = None,
+    ) -> UploadResult:
+        """렌더링 중인 파일을 따라가며 업로드합니다.
+        
+        렌더러가 fragmented MP4로 앞에서부터 써 나가는 동안 완성된 바이트를
+        256KB 단위로 전체 크기 미정(`bytes a-b/*`) 세션에 올리고, 렌더링이
+        끝나면 남은 꼬리와 전체 크기를 보내 마무리합니다.
+        
+        Args:
+            path: 렌더러가 쓰고 있는 출력 경로
+            script: 제목/설명에 쓸 스크립트
+            rendering: 렌더링이 끝나면 ShortsVideo로 완료되는 future
+            privacy: 공개 범위 (기본: 설정값)
+        
+        Raises:
+            QuotaExceededError: 오늘 남은 할당량으로 업로드를 시작할 수 없을 때
+            UploadError: 렌더링 실패, 출력 파일 교체(대체 렌더러), 재시도 초과 등으로
+                스트리밍을 끝낼 수 없을 때 (완료되지 않은 세션은 서버에서 버려짐)
+        """
+        privacy = privacy or UploadPrivacy(settings().upload_privacy)
+        
+        async with self._slots:
+            if self.client is not None:
+                return await self._stream(self.client, path, script, rendering, privacy)
+            
+            async with httpx.AsyncClient(timeout=120.0) as client:
+                return await self._stream(client, path, script, rendering, privacy)
+    
+    async def _upload(
+        self,
+        client: httpx.AsyncClient,
+        video: ShortsVideo,
+        privacy: UploadPrivacy,
+    ) -> UploadResult:
+        path = Path(video.video_path)
+        key = self.sessions.make_key(path)
+        size = path.stat().st_size
+        
+        session = self.sessions.get(key)
+        resource = None
+        if session is not None:
+            try:
+                session.offset, resource = await self._query_offset(client, session)
+                logger.info(f"Resuming upload of {path.name} at {session.offset}/{size} bytes")
+            except UploadError as e:
+                logger.warning(f"Saved upload session unusable, starting over: {e}")
+                self.sessions.remove(key)
+                session = None
+            except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                # 저장된 오프셋부터 시도하고, 어긋나면 청크 전송 중 다시 조회
+                logger.warning(f"Cannot query upload session, resuming from saved offset: {e!r}")
+        
+        if session is None:
+            session = await self._create_session(client, video.script, privacy, size)
+            self.sessions.put(key, session)
+        
+        if resource is None:
+            resource = await self._finish(client, path, session, key)
+        self.sessions.remove(key)
+        
+        return self._result(path, resource, video.script, privacy)
+    
+    async def _stream(
+        self,
+        client: httpx.AsyncClient,
+        path: Path,
+        script: Script,
+        rendering: asyncio.Future,
+        privacy: UploadPrivacy,
+    ) -> UploadResult:
+        session = await self._create_session(client, script, privacy, None)
+        identity = None
+        
+        while True:
+            # 파일 크기보다 먼저 확인해야 렌더링 종료 직전에 쓰인 꼬리를 놓치지 않음
+            finished = rendering.done()
+            
+            if path.exists():
+                stat = path.stat()
+                identity = identity or (stat.st_dev, stat.st_ino)
+                if (stat.st_dev, stat.st_ino) != identity or stat.st_size < session.offset:
+                    raise UploadError(f"{path.name} was rewritten while streaming")
+                
+                ready = (stat.st_size - session.offset) // CHUNK_ALIGN * CHUNK_ALIGN
+                if ready and not finished:
+                    await self._send_chunks(client, path, session, session.offset + ready)
+                    continue
+            
+            if finished:
+                break
+            await asyncio.sleep(self.STREAM_POLL_INTERVAL)
+        
+        if rendering.cancelled() or rendering.exception() is not None:
+            raise UploadError(f"Render failed, abandoning streamed upload of {path.name}")
+        video = rendering.result()
+        if Path(video.video_path).resolve() != path.resolve():
+            raise UploadError(f"Render fell back to {video.video_path}, streamed bytes discarded")
+        
+        streamed = session.offset
+        session.size = path.stat().st_size
+        resource = await self._finish(client, path, session)
+        
+        logger.info(
+            f"Streamed {streamed / 1024 / 1024:.1f}MB of {path.name} while rendering, "
+            f"{(session.size - streamed) / 1024 / 1024:.1f}MB after"
+        )
+        return self._result(path, resource, script, privacy)
+    
+    def _result(
+        self,
+        path: Path,
+        resource: dict,
+        script: Script,
+        privacy: UploadPrivacy,
+    ) -> UploadResult:
+        self._charged.discard(self._video_key(script))
+        video_id = resource["id"]
+        size_mb = path.stat().st_size / 1024 / 1024
+        logger.info(f"Uploaded {path.name} as {video_id} ({size_mb:.1f}MB)")
+        return UploadResult(
+            video_id=video_id,
+            video_url=f"https://youtube.com/shorts/{video_id}",
+            title=script.title,
+            privacy=privacy,
+        )
+    
+    async def _headers(self) -> dict[str, str]:
+        if self.credentials is None:
+            self.credentials = await asyncio.to_thread(load_credentials)
+        elif not self.credentials.valid:
+            from google.auth.transport.requests import Request
+            
+            await asyncio.to_thread(self.credentials.refresh, Request())
+        
+        return {"Authorization": f"Bearer {self.credentials.token}"}
+    
+    @staticmethod
+    def _video_key(script: Script) -> str:
+        return make_cache_key(script.title, script.full_script, script.description)
+    
+    @staticmethod
+    def _metadata(script: Script, privacy: UploadPrivacy) -> dict:
+        description = script.description
+        hashtags = " ".join(tag for tag in script.hashtags if tag not in description)
+        if hashtags:
+            description = f"{description}\n\n{hashtags}".strip()
+        
+        return {
+            "snippet": {
+                "title": script.title[:100],
+                "description": description[:5000],
+                "tags": script.keywords,
+                "categoryId": settings().youtube_category_id,
+            },
+            "status": {
+                "privacyStatus": privacy.value,
+                "selfDeclaredMadeForKids": False,
+            },
+        }
+    
+    async def _create_session(
+        self,
+        client: httpx.AsyncClient,
+        script: Script,
+        privacy: UploadPrivacy,
+        size: Optional[int],
+    ) -> UploadSession:
+        """할당량을 차감하고 메타데이터를 보내 업로드 세션 URI를 받습니다.
+        
+        size가 None이면 전체 크기를 마지막 청크에서 알려주는 세션을 엽니다.
+        이미 차감한 영상이면 할당량을 다시 차감하지 않습니다.
+        """
+        video_key = self._video_key(script)
+        charged = video_key not in self._charged
+        if charged:
+            self.ledger.charge("videos.insert")
+            self._charged.add(video_key)
+        
+        headers = await self._headers()
+        headers["X-Upload-Content-Type"] = "video/mp4"
+        if size is not None:
+            headers["X-Upload-Content-Length"] = str(size)
+        
+        try:
+            response = await client.post(
+                self.upload_url,
+                params={"uploadType": "resumable", "part": "snippet,status"},
+                headers=headers,
+                json=self._metadata(script, privacy),
+            )
+        except httpx.ConnectError as e:
+            # 요청이 서버에 닿지 않았으면 할당량도 쓰이지 않음
+            if charged:
+                self.ledger.refund("videos.insert")
+                self._charged.discard(video_key)
+            raise UploadError(f"Cannot start upload: {e!r}") from e
+        except httpx.HTTPError as e:
+            raise UploadError(f"Cannot start upload: {e!r}") from e
+        
+        if response.status_code != 200 or "location" not in response.headers:
+            raise UploadError(
+                f"Cannot start upload: HTTP {response.status_code} {response.text[:200]}"
+            )
+        
+        return UploadSession(session_uri=response.headers["location"], size=size)
+    
+    async def _query_offset(
+        self,
+        client: httpx.AsyncClient,
+        session: UploadSession,
+    ) -> tuple[int, Optional[dict]]:
+        """서버가 받은 바이트 수를 조회합니다 (이미 끝났으면 영상 리소스도 반환)."""
+        headers = await self._headers()
+        headers.update({"Content-Range": f"bytes */{session.total}", "Content-Length": "0"})
+        
+        response = await client.put(session.session_uri, headers=headers)
+        return self._handle_response(response, session)
+    
+    def _handle_response(
+        self,
+        response: httpx.Response,
+        session: UploadSession,
+    ) -> tuple[int, Optional[dict]]:
+        """청크/조회 응답을 (다음 오프셋, 완료 시 영상 리소스)로 바꿉니다."""
+        if response.status_code in (200, 201):
+            return session.size, response.json()
+        
+        if response.status_code == RESUME_INCOMPLETE:
+            # Range: bytes=0-1048575 → 다음은 1048576부터 (헤더가 없으면 받은 게 없음)
+            received = response.headers.get("range", "")
+            if received.startswith("bytes=0-"):
+                return int(received.rsplit("-", 1)[1]) + 1, None
+            return 0, None
+        
+        if response.status_code >= 500:
+            raise httpx.HTTPStatusError(
+                f"HTTP {response.status_code}", request=response.request, response=response
+            )
+        raise UploadError(f"HTTP {response.status_code}: {response.text[:200]}")
+    
+    async def _finish(
+        self,
+        client: httpx.AsyncClient,
+        path: Path,
+        session: UploadSession,
+        key: Optional[str] = None,
+    ) -> dict:
+        """남은 바이트를 모두 올리고 완성된 영상 리소스를 받습니다."""
+        resource = await self._send_chunks(client, path, session, session.size, key)
+        if resource is None:
+            # 마지막 바이트까지 받았다는 308 뒤라면 전체 크기 조회로 마무리
+            session.offset, resource = await self._query_offset(client, session)
+        if resource is None:
+            raise UploadError(f"{path.name}: server has {session.offset}/{session.size} bytes")
+        return resource
+    
+    async def _send_chunks(
+        self,
+        client: httpx.AsyncClient,
+        path: Path,
+        session: UploadSession,
+        end: int,
+        key: Optional[str] = None,
+    ) -> Optional[dict]:
+        """세션 오프셋부터 end 직전까지 청크를 올리고, 끊기면 오프셋을 조회해 이어 올립니다.
+        
+        Returns:
+            서버가 업로드를 완료했으면 영상 리소스, 아직이면 None
+        """
+        attempt = 0
+        with open(path, "rb") as f:
+            while session.offset < end:
+                try:
+                    f.seek(session.offset)
+                    chunk = f.read(min(self.chunk_size, end - session.offset))
+                    last = session.offset + len(chunk) - 1
+                    
+                    headers = await self._headers()
+                    headers["Content-Range"] = f"bytes {session.offset}-{last}/{session.total}"
+                    response = await client.put(session.session_uri, headers=headers, content=chunk)
+                    
+                    offset, resource = self._handle_response(response, session)
+                    if resource is not None:
+                        return resource
+                    
+                    session.offset = offset
+                    if key:
+                        self.sessions.put(key, session)
+                    attempt = 0
+                    
+                except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                    attempt += 1
+                    if attempt > self.max_retries:
+                        raise UploadError(
+                            f"{path.name}: gave up at {session.offset}/{session.total} bytes: {e}"
+                        ) from e
+                    
+                    logger.warning(
+                        f"Upload interrupted at {session.offset}/{session.total} bytes "
+                        f"(attempt {attempt}/{self.max_retries}): {e!r}"
+                    )
+                    await asyncio.sleep(self.RETRY_BACKOFF * attempt)
+                    
+                    try:
+                        offset, resource = await self._query_offset(client, session)
+                    except (httpx.TransportError, httpx.HTTPStatusError):
+                        continue
+                    if resource is not None:
+                        return resource
+                    session.offset = offset
+                    if key:
+                        self.sessions.put(key, session)
+        
+        return None
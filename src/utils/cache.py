@@ -0,0 +1,198 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from .logger import get_logger
+
+logger = get_logger("cache")
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+    
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+    
+    def to_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+
+def make_cache_key(*parts: Any) -> str:
+    """입력값들로 콘텐츠 주소(SHA-256) 키를 만듭니다."""
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class DiskCache:
+    """TTL과 용량 기반 LRU 삭제를 지원하는 디스크 캐시
+    
+    파일 mtime은 저장 시각(TTL 기준), atime은 마지막 사용 시각(LRU 기준)으로 씁니다.
+    """
+    
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_size_mb: float = 500.0,
+        ttl_seconds: Optional[float] = None,
+        suffix: str = ".bin",
+    ):
+        self.cache_dir = cache_dir
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.ttl_seconds = ttl_seconds
+        self.suffix = suffix
+        self.stats = CacheStats()
+        
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._size = sum(path.stat().st_size for path in self._entries())
+    
+    def _entries(self) -> list[Path]:
+        return [path for path in self.cache_dir.glob(f"*/*{self.suffix}") if path.is_file()]
+    
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{self.suffix}"
+    
+    def _is_expired(self, path: Path) -> bool:
+        if self.ttl_seconds is None:
+            return False
+        return time.time() - path.stat().st_mtime > self.ttl_seconds
+    
+    def _remove(self, path: Path) -> None:
+        try:
+            size = path.stat().st_size
+            path.unlink()
+            self._size -= size
+        except FileNotFoundError:
+            pass
+    
+    def get_path(self, key: str) -> Optional[Path]:
+        """캐시된 파일 경로를 반환합니다 (없거나 만료되면 None)."""
+        path = self._path(key)
+        
+        try:
+            if not path.exists():
+                self.stats.misses += 1
+                return None
+            
+            if self._is_expired(path):
+                self._remove(path)
+                self.stats.misses += 1
+                return None
+            
+            # LRU: 사용 시각(atime)만 갱신하고 저장 시각(mtime)은 유지
+            os.utime(path, (time.time(), path.stat().st_mtime))
+        except FileNotFoundError:
+            # 다른 프로세스가 동시에 삭제한 경우
+            self.stats.misses += 1
+            return None
+        
+        self.stats.hits += 1
+        return path
+    
+    def get_bytes(self, key: str) -> Optional[bytes]:
+        path = self.get_path(key)
+        if path is None:
+            return None
+        
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+    
+    def put_bytes(self, key: str, data: bytes) -> Path:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        return self._commit(tmp_path, path)
+    
+    def put_file(self, key: str, source: Path, move: bool = False) -> Path:
+        """파일을 캐시에 저장합니다 (move=True면 원본을 이동)."""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        if move:
+            shutil.move(str(source), tmp_path)
+        else:
+            shutil.copyfile(source, tmp_path)
+        return self._commit(tmp_path, path)
+    
+    def _commit(self, tmp_path: Path, path: Path) -> Path:
+        if path.exists():
+            self._size -= path.stat().st_size
+        
+        tmp_path.replace(path)
+        self._size += path.stat().st_size
+        self.stats.writes += 1
+        
+        if self._size > self.max_size_bytes:
+            self.evict()
+        
+        return path
+    
+    def evict(self) -> int:
+        """용량 한도의 90%가 될 때까지 가장 오래 사용하지 않은 항목을 삭제합니다."""
+        return evict_lru([self], self.max_size_bytes)
+    
+    @property
+    def size_mb(self) -> float:
+        return self._size / (1024 * 1024)
+
+
+def evict_lru(caches: list[DiskCache], max_size_bytes: int) -> int:
+    """여러 캐시를 하나의 용량 한도로 묶어 LRU 순서로 삭제합니다.
+    
+    합계가 한도의 90%가 될 때까지 모든 캐시를 통틀어 가장 오래 사용하지 않은
+    항목부터 지웁니다. 디렉토리를 나눈 캐시들이 각자 한도를 가지면 실제 디스크
+    사용량이 캐시 수만큼 늘어나므로 이 함수로 한도를 공유합니다.
+    """
+    entries = []
+    for cache in caches:
+        cache_entries = []
+        for path in cache._entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            cache_entries.append((stat.st_atime, path, cache))
+        
+        # 다른 프로세스가 쓴 항목까지 반영해 실제 용량으로 다시 계산
+        cache._size = sum(path.stat().st_size for _, path, _ in cache_entries if path.exists())
+        entries.extend(cache_entries)
+    
+    target = int(max_size_bytes * 0.9)
+    total = sum(cache._size for cache in caches)
+    
+    removed = 0
+    for _, path, cache in sorted(entries, key=lambda entry: entry[0]):
+        if total <= target:
+            break
+        before = cache._size
+        cache._remove(path)
+        total -= before - cache._size
+        cache.stats.evictions += 1
+        removed += 1
+    
+    if removed:
+        directories = ", ".join(str(cache.cache_dir) for cache in caches)
+        logger.debug(f"Evicted {removed} cache entries from {directories}")
+    
+    return removed
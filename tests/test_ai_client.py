@@ -0,0 +1,311 @@
+"""OpenAI 클라이언트 테스트 (응답 캐시, 분당 한도 리미터, API 호출 없음)
+
+실행: python -m tests.test_ai_client
+
+OpenAI 대신 httpx MockTransport가 chat/completions 응답을 돌려줍니다.
+"""
+import asyncio
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Windows 콘솔 UTF-8 설정
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+
+import httpx
+from openai import AsyncOpenAI
+
+from src.ai.client import OpenAIClient, ResponseCache
+from src.ai.rate_limit import RateLimiter, TokenBucket
+from src.utils.logger import setup_logger
+
+
+def completion(content: str) -> dict:
+    """chat/completions 응답 본문"""
+    return {
+        "id": "chatcmpl-test",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-4o-mini",
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content},
+            "finish_reason": "stop",
+        }],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+    }
+
+
+def make_client(handler, cache: ResponseCache = None) -> OpenAIClient:
+    """MockTransport로 요청을 보내는 OpenAIClient (리미터는 넉넉하게)"""
+    client = OpenAIClient(cache=cache, limiter=RateLimiter(10000, 10_000_000))
+    client.client = AsyncOpenAI(
+        api_key="sk-test",
+        max_retries=0,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    return client
+
+
+async def test_cache_key():
+    """응답 캐시 키 테스트 (모델/메시지/temperature가 모두 키에 포함)"""
+    print("\n" + "=" * 50)
+    print("[TEST] 응답 캐시 키 테스트")
+    print("=" * 50)
+    
+    base = dict(
+        model="gpt-4o-mini",
+        system_prompt="시스템",
+        user_prompt="사용자",
+        temperature=0.7,
+        max_tokens=2000,
+    )
+    variants = [
+        {"model": "gpt-4o"},
+        {"system_prompt": "다른 시스템"},
+        {"user_prompt": "다른 사용자"},
+        {"temperature": 0.0},
+        {"max_tokens": 1000},
+        {"response_format": {"type": "json_object"}},
+    ]
+    
+    key = ResponseCache.make_key(**base)
+    keys = {ResponseCache.make_key(**{**base, **variant}) for variant in variants}
+    
+    print(f"\n[OK] 기본 키 {key[:12]}, 변형 {len(keys)}개 모두 다른 키")
+    
+    assert ResponseCache.make_key(**base) == key
+    assert key not in keys and len(keys) == len(variants)
+    return key
+
+
+async def test_response_cache():
+    """응답 캐시 적중/실패 테스트 (같은 요청은 API를 다시 호출하지 않음)"""
+    print("\n" + "=" * 50)
+    print("[TEST] 응답 캐시 적중 테스트")
+    print("=" * 50)
+    
+    requests = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        requests.append(body)
+        return httpx.Response(200, json=completion(f"응답 {len(requests)}"))
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ResponseCache(cache_dir=Path(tmp), ttl_hours=1)
+        client = make_client(handler, cache)
+        
+        first = await client.chat("시스템", "사용자", temperature=0.7)
+        second = await client.chat("시스템", "사용자", temperature=0.7)
+        other = await client.chat("시스템", "사용자", temperature=0.2)
+        
+        # 디스크에 남은 캐시는 새 인스턴스에서도 적중
+        reopened = make_client(handler, ResponseCache(cache_dir=Path(tmp), ttl_hours=1))
+        third = await reopened.chat("시스템", "사용자", temperature=0.7)
+    
+    stats = cache.stats
+    print(f"\n[OK] 요청 {len(requests)}회, 캐시 {stats.hits} hits / {stats.misses} misses")
+    
+    assert first == second == third == "응답 1"
+    assert other == "응답 2"
+    assert len(requests) == 2 and requests[1]["temperature"] == 0.2
+    assert (stats.hits, stats.misses) == (1, 2)
+    return stats
+
+
+async def test_invalid_response_not_cached():
+    """검증에 실패한 응답은 캐시하지 않는지 테스트 (다음 실행에서 다시 요청)"""
+    print("\n" + "=" * 50)
+    print("[TEST] 잘못된 응답 캐시 제외 테스트")
+    print("=" * 50)
+    
+    schema = {"type": "object", "required": ["title"], "properties": {"title": {"type": "string"}}}
+    responses = ['{"name": "제목 없음"}', '{"title": 3', '{"title": "제목"}']
+    requests = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        return httpx.Response(200, json=completion(responses[min(len(requests), 3) - 1]))
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        # 첫 실행: 처음 요청과 재요청이 모두 스키마에 맞지 않아 실패
+        client = make_client(handler, ResponseCache(cache_dir=Path(tmp), ttl_hours=1))
+        try:
+            await client.chat_structured("시스템", "사용자", "test", schema)
+            raise AssertionError("ValueError가 발생해야 합니다")
+        except ValueError as e:
+            print(f"\n첫 실행 실패: {e}")
+        assert len(requests) == 2
+        assert client.cache.store.stats.misses == 2
+        
+        # 같은 날 다시 실행: 캐시가 아니라 API에서 새 응답을 받음
+        client = make_client(handler, ResponseCache(cache_dir=Path(tmp), ttl_hours=1))
+        data = await client.chat_structured("시스템", "사용자", "test", schema)
+        assert data == {"title": "제목"} and len(requests) == 3
+        
+        # 유효한 응답은 캐시되어 세 번째 실행은 API를 호출하지 않음
+        client = make_client(handler, ResponseCache(cache_dir=Path(tmp), ttl_hours=1))
+        assert await client.chat_structured("시스템", "사용자", "test", schema) == data
+        
+        # 검증 없이 저장된 잘못된 항목도 검증 함수가 있으면 무시
+        key = ResponseCache.make_key(
+            "gpt-4o-mini", "시스템", "다른 요청", 0.7, 2000, {"type": "json_object"}
+        )
+        client.cache.set(key, "죄송합니다")
+        await client.chat_json("시스템", "다른 요청")
+    
+    print(f"[OK] 요청 {len(requests)}회, 잘못된 응답은 다시 요청")
+    assert len(requests) == 4
+    return len(requests)
+
+
+class FakeClock:
+    """sleep이 실제로 기다리지 않고 시각만 앞으로 옮기는 가짜 시계"""
+    
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+    
+    def __call__(self) -> float:
+        return self.now
+    
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+async def test_rate_limiter():
+    """분당 한도 리미터 테스트 (가짜 시계로 대기 시간을 정확히 확인)"""
+    print("\n" + "=" * 50)
+    print("[TEST] 분당 한도 리미터 테스트")
+    print("=" * 50)
+    
+    clock = FakeClock()
+    
+    # 분당 60 -> 초당 1 보충, 최대 60
+    bucket = TokenBucket(60, clock)
+    bucket.tokens = 0.0
+    clock.now = 30.0
+    bucket.refill()
+    assert bucket.tokens == 30.0
+    assert bucket.wait_time(40) == 10.0
+    assert bucket.wait_time(1000) == 30.0  # 버킷보다 큰 요청은 가득 찬 버킷 기준
+    clock.now = 1000.0
+    bucket.refill()
+    assert bucket.tokens == 60.0
+    
+    # 요청 수 한도: 분당 2회 -> 세 번째 요청은 30초 대기
+    clock = FakeClock()
+    limiter = RateLimiter(2, 10_000, clock=clock, sleep=clock.sleep)
+    for _ in range(3):
+        await limiter.acquire(100)
+    assert clock.now == 30.0 and clock.sleeps == [30.0]
+    
+    # 토큰 한도: 분당 600 토큰(초당 10) -> 400 + 400 이면 두 번째는 20초 대기
+    clock = FakeClock()
+    limiter = RateLimiter(1000, 600, clock=clock, sleep=clock.sleep)
+    await limiter.acquire(400)
+    await limiter.acquire(400)
+    assert clock.now == 20.0
+    
+    # 실제 사용량이 적으면 차이를 돌려받음
+    limiter.reconcile(400, 100)
+    assert limiter.tokens.tokens == 300.0
+    
+    # 응답 헤더로 한도/잔량 보정
+    limiter.update_from_headers({
+        "x-ratelimit-limit-tokens": "1200",
+        "x-ratelimit-remaining-tokens": "50",
+    })
+    assert limiter.tokens.capacity == 1200.0 and limiter.tokens.tokens == 50.0
+    
+    # 429 후에는 retry-after 동안 모든 요청을 멈춤
+    delay = limiter.pause({"retry-after": "5"})
+    started = clock.now
+    await limiter.acquire(10)
+    assert delay == 5.0 and clock.now - started >= 5.0
+    assert limiter.pause({"x-ratelimit-reset-requests": "1s", "x-ratelimit-reset-tokens": "6m0s"}) == 360.0
+    
+    print(f"\n[OK] 가짜 시계 {clock.now:.1f}s, 대기 {clock.sleeps}")
+    return clock.sleeps
+
+
+async def test_rate_limit_retry():
+    """429 응답 재시도 테스트 (rate limit 헤더로 리미터를 멈췄다가 다시 요청)"""
+    print("\n" + "=" * 50)
+    print("[TEST] 429 재시도 테스트")
+    print("=" * 50)
+    
+    statuses = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        if not statuses:
+            statuses.append(429)
+            return httpx.Response(
+                429,
+                json={"error": {"message": "Rate limit reached", "type": "requests"}},
+                headers={
+                    "retry-after": "0.2",
+                    "x-ratelimit-limit-requests": "60",
+                    "x-ratelimit-remaining-requests": "0",
+                    "x-ratelimit-reset-requests": "1s",
+                },
+            )
+        statuses.append(200)
+        return httpx.Response(
+            200,
+            json=completion("재시도 성공"),
+            headers={
+                "x-ratelimit-limit-requests": "60",
+                "x-ratelimit-remaining-requests": "59",
+                "x-ratelimit-limit-tokens": "150000",
+                "x-ratelimit-remaining-tokens": "149000",
+            },
+        )
+    
+    client = make_client(handler)
+    limiter = client.limiter
+    content = await client.chat("시스템", "사용자")
+    
+    print(f"\n[OK] 응답 상태 {statuses} -> {content!r}")
+    
+    assert statuses == [429, 200]
+    assert content == "재시도 성공"
+    assert limiter._paused_until > 0
+    assert limiter.requests.capacity == 60.0
+    assert limiter.tokens.capacity == 150000.0 and limiter.tokens.tokens <= 149000.0
+    return statuses
+
+
+async def main():
+    setup_logger(log_level="INFO")
+    
+    print("\n[START] OpenAI 클라이언트 테스트 시작\n")
+    
+    await test_cache_key()
+    stats = await test_response_cache()
+    uncached = await test_invalid_response_not_cached()
+    sleeps = await test_rate_limiter()
+    statuses = await test_rate_limit_retry()
+    
+    print("\n" + "=" * 50)
+    print("[SUMMARY] 테스트 결과 요약")
+    print("=" * 50)
+    print(f"응답 캐시: {stats.hits} hits / {stats.misses} misses")
+    print(f"잘못된 응답 재요청 후 총 요청: {uncached}회")
+    print(f"리미터 대기: {sleeps}")
+    print(f"429 재시도: {statuses}")
+    print("\n[DONE] 테스트 완료!")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
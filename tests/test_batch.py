@@ -0,0 +1,295 @@
+"""Batch API 스크립트 생성 테스트 (로컬 대체 서버 사용)
+
+실행: python -m tests.test_batch
+
+OpenAI 대신 로컬 HTTP 서버가 /files, /batches 엔드포인트를 흉내냅니다.
+API 키가 필요 없습니다.
+"""
+import asyncio
+import json
+import os
+import sys
+import threading
+from email.parser import BytesParser
+from email.policy import default as default_policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Windows 콘솔 UTF-8 설정
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+
+from src.ai.batch import BatchClient
+from src.ai.script_writer import ScriptWriter
+from src.models import NewsItem, NewsSource, SelectedNews
+from src.utils.logger import setup_logger
+
+
+class FakeBatchServer(BaseHTTPRequestHandler):
+    """OpenAI Files/Batches API 대체 서버"""
+    
+    files: dict[str, str] = {}
+    batches: dict[str, dict] = {}
+    # custom_id -> 오류 파일에 남길 상태 코드 (일시적 실패는 한 번만)
+    failures: dict[str, int] = {}
+    # 다음 배치를 이 상태로 끝내고 처리하지 않을 custom_id (expired는 오류 파일에 기록)
+    stop_status: str = ""
+    unfinished: set[str] = set()
+    
+    def log_message(self, format, *args):
+        pass
+    
+    def _send_json(self, data: dict, status: int = 200):
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def _read_body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+    
+    def do_POST(self):
+        if self.path == "/v1/files":
+            raw = self._read_body()
+            message = BytesParser(policy=default_policy).parsebytes(
+                f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode() + raw
+            )
+            content = ""
+            for part in message.iter_parts():
+                if part.get_filename():
+                    content = part.get_payload(decode=True).decode("utf-8")
+            file_id = f"file-{len(self.files)}"
+            self.files[file_id] = content
+            self._send_json({"id": file_id, "purpose": "batch"})
+            
+        elif self.path == "/v1/batches":
+            request = json.loads(self._read_body())
+            batch_id = f"batch-{len(self.batches)}"
+            self.batches[batch_id] = {
+                "id": batch_id,
+                "status": "validating",
+                "input_file_id": request["input_file_id"],
+                "polls": 0,
+            }
+            self._send_json(self.batches[batch_id])
+            
+        else:
+            self._send_json({"error": "not found"}, 404)
+    
+    def do_GET(self):
+        parts = self.path.strip("/").split("/")
+        
+        if parts[:2] == ["v1", "batches"]:
+            batch = self.batches[parts[2]]
+            batch["polls"] += 1
+            if batch["polls"] >= 2:
+                batch["status"] = "completed"
+                batch["output_file_id"], batch["error_file_id"] = self._complete(batch)
+                if self.unfinished:
+                    batch["status"] = type(self).stop_status
+                    type(self).unfinished = set()
+            else:
+                batch["status"] = "in_progress"
+            self._send_json(batch)
+            
+        elif parts[:2] == ["v1", "files"] and parts[-1] == "content":
+            body = self.files[parts[2]].encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            
+        else:
+            self._send_json({"error": "not found"}, 404)
+    
+    def _complete(self, batch: dict) -> tuple[str, str]:
+        """입력 요청마다 고정된 스크립트 응답을 만들고, (결과 파일 ID, 오류 파일 ID)를 반환"""
+        lines = []
+        errors = []
+        for line in self.files[batch["input_file_id"]].splitlines():
+            request = json.loads(line)
+            if request["custom_id"] in self.unfinished:
+                if self.stop_status == "expired":
+                    errors.append(json.dumps({
+                        "custom_id": request["custom_id"],
+                        "response": None,
+                        "error": {"code": "batch_expired", "message": "만료"},
+                    }))
+                continue
+            status_code = self.failures.get(request["custom_id"])
+            if status_code is not None:
+                if status_code != 400:
+                    del self.failures[request["custom_id"]]
+                errors.append(json.dumps({
+                    "custom_id": request["custom_id"],
+                    "response": {"status_code": status_code, "body": {"error": "실패"}},
+                    "error": None,
+                }))
+                continue
+            
+            # 응답 순서가 입력과 달라도 custom_id로 매핑되는지 확인하기 위해 역순으로 기록
+            content = json.dumps({
+                "title": f"{request['custom_id']} 제목",
+                "script": {"hook": "훅", "body": "본문", "outro": "마무리"},
+                "full_script": "훅 본문 마무리",
+                "keywords": ["technology"],
+                "hashtags": ["#IT뉴스"],
+                "description": "설명",
+            }, ensure_ascii=False)
+            lines.insert(0, json.dumps({
+                "custom_id": request["custom_id"],
+                "response": {
+                    "status_code": 200,
+                    "body": {"choices": [{"message": {"role": "assistant", "content": content}}]},
+                },
+            }, ensure_ascii=False))
+        
+        output_file_id = f"file-{len(self.files)}"
+        self.files[output_file_id] = "\n".join(lines)
+        error_file_id = f"file-{len(self.files)}"
+        self.files[error_file_id] = "\n".join(errors)
+        return output_file_id, error_file_id
+
+
+def make_news(i: int) -> SelectedNews:
+    return SelectedNews(
+        news_item=NewsItem(
+            title=f"테스트 뉴스 {i}",
+            summary="요약",
+            url=f"https://example.com/{i}",
+            source=NewsSource.GOOGLE_NEWS,
+            source_name="Test",
+        ),
+        selection_reason="테스트",
+        hook_idea="훅",
+    )
+
+
+def start_server() -> ThreadingHTTPServer:
+    FakeBatchServer.files = {}
+    FakeBatchServer.batches = {}
+    FakeBatchServer.failures = {}
+    FakeBatchServer.unfinished = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeBatchServer)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def test_batch_script_generation():
+    """Batch API 모드 스크립트 생성 테스트"""
+    print("\n" + "=" * 50)
+    print("[TEST] Batch API 스크립트 생성 테스트")
+    print("=" * 50)
+    
+    server = start_server()
+    
+    try:
+        base_url = f"http://127.0.0.1:{server.server_port}/v1"
+        batch_client = BatchClient(api_key="sk-test", base_url=base_url, poll_interval=0.1)
+        writer = ScriptWriter(batch_client=batch_client)
+        
+        selected_list = [make_news(i) for i in range(3)]
+        
+        scripts = await writer.write_batch(selected_list, mode="batch")
+    finally:
+        server.shutdown()
+    
+    assert [script and script.title for script in scripts] == [
+        "script-0 제목", "script-1 제목", "script-2 제목"
+    ]
+    print(f"\n[OK] {len(scripts)}개 스크립트 생성 (입력 순서 유지)")
+    
+    return scripts
+
+
+async def test_batch_error_file():
+    """오류 파일 처리 테스트 (일시적 실패는 재제출, 영구 실패는 제외)"""
+    print("\n" + "=" * 50)
+    print("[TEST] Batch 오류 파일 재시도 테스트")
+    print("=" * 50)
+    
+    server = start_server()
+    FakeBatchServer.failures = {"script-1": 500, "script-2": 400}
+    
+    try:
+        base_url = f"http://127.0.0.1:{server.server_port}/v1"
+        batch_client = BatchClient(api_key="sk-test", base_url=base_url, poll_interval=0.1)
+        writer = ScriptWriter(batch_client=batch_client)
+        
+        scripts = await writer.write_batch([make_news(i) for i in range(3)], mode="batch")
+        batches = list(FakeBatchServer.batches.values())
+        retried = FakeBatchServer.files[batches[-1]["input_file_id"]].splitlines()
+    finally:
+        server.shutdown()
+    
+    titles = [script and script.title for script in scripts]
+    print(f"\n[OK] 배치 {len(batches)}개, 재제출 {len(retried)}건 -> {titles}")
+    
+    # 입력 순서대로 정렬되어 영구 실패한 항목은 None
+    assert titles == ["script-0 제목", "script-1 제목", None]
+    assert len(batches) == 2
+    assert [json.loads(line)["custom_id"] for line in retried] == ["script-1"]
+    return len(batches)
+
+
+async def test_partial_batch():
+    """만료/취소된 배치 테스트 (끝난 결과는 쓰고 처리되지 않은 요청만 다시 제출)"""
+    print("\n" + "=" * 50)
+    print("[TEST] 만료/취소 배치 부분 결과 테스트")
+    print("=" * 50)
+    
+    resubmitted = {}
+    for status in ("expired", "cancelled"):
+        server = start_server()
+        FakeBatchServer.stop_status = status
+        FakeBatchServer.unfinished = {"script-0", "script-2"}
+        
+        try:
+            base_url = f"http://127.0.0.1:{server.server_port}/v1"
+            batch_client = BatchClient(api_key="sk-test", base_url=base_url, poll_interval=0.1)
+            writer = ScriptWriter(batch_client=batch_client)
+            
+            scripts = await writer.write_batch([make_news(i) for i in range(3)], mode="batch")
+            batches = list(FakeBatchServer.batches.values())
+            retried = FakeBatchServer.files[batches[-1]["input_file_id"]].splitlines()
+        finally:
+            server.shutdown()
+        
+        resubmitted[status] = sorted(json.loads(line)["custom_id"] for line in retried)
+        print(f"\n[OK] {status}: 재제출 {resubmitted[status]}")
+        
+        assert batches[0]["status"] == status and len(batches) == 2
+        assert resubmitted[status] == ["script-0", "script-2"]
+        assert [script.title for script in scripts] == [
+            "script-0 제목", "script-1 제목", "script-2 제목"
+        ]
+    return resubmitted
+
+
+async def main():
+    setup_logger(log_level="INFO")
+    
+    print("\n[START] Batch API 테스트 시작\n")
+    
+    scripts = await test_batch_script_generation()
+    batches = await test_batch_error_file()
+    resubmitted = await test_partial_batch()
+    
+    print("\n" + "=" * 50)
+    print("[SUMMARY] 테스트 결과 요약")
+    print("=" * 50)
+    print(f"생성된 스크립트: {len(scripts)}개")
+    print(f"오류 파일 재시도 배치: {batches}개")
+    print(f"부분 배치 재제출: {resubmitted}")
+    print("\n[DONE] 테스트 완료!")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
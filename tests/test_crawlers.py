@@ -3,7 +3,10 @@
 실행: python -m tests.test_crawlers
 """
 import asyncio
+import os
 import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 # Windows 콘솔 UTF-8 설정
@@ -13,7 +16,22 @@ if sys.platform == "win32":
 # 프로젝트 루트를 path에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.crawlers import GoogleNewsCrawler, NaverNewsCrawler
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+
+import httpx
+
+from src.crawlers import (
+    BaseCrawler,
+    CrawlJob,
+    CrawlOrchestrator,
+    FeedCache,
+    GoogleNewsCrawler,
+    NaverNewsCrawler,
+    NewsDeduplicator,
+    StoryIndex,
+    WatermarkStore,
+)
+from src.models import NewsItem, NewsSource
 from src.utils.logger import setup_logger, get_logger
 
 
@@ -39,6 +57,59 @@ async def test_google_news():
     return news_items
 
 
+FEED_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Google News</title>
+<item><title>삼성전자, 갤럭시 S25 공개 - 테스트일보</title>
+<link>https://example.com/s25</link>
+<pubDate>Mon, 20 Jan 2025 09:00:00 GMT</pubDate>
+<description>갤럭시 S25 시리즈 공개</description></item>
+<item><title>애플, 새 아이폰 발표 - 테스트뉴스</title>
+<link>https://example.com/iphone</link>
+<pubDate>Mon, 20 Jan 2025 10:00:00 GMT</pubDate>
+<description>새 아이폰 발표</description></item>
+</channel></rss>"""
+
+
+async def test_feed_cache():
+    """RSS 조건부 요청 테스트 (ETag/Last-Modified 왕복, 304면 캐시 사용)"""
+    print("\n" + "=" * 50)
+    print("[TEST] RSS 피드 캐시 테스트")
+    print("=" * 50)
+    
+    etag = '"feed-v1"'
+    last_modified = "Mon, 20 Jan 2025 10:00:00 GMT"
+    requests = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(dict(request.headers))
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            text=FEED_XML,
+            headers={"ETag": etag, "Last-Modified": last_modified},
+        )
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            crawler = GoogleNewsCrawler(client=client, cache=FeedCache(Path(tmp)))
+            first = await crawler.fetch(query="테스트", limit=5)
+            
+            # 캐시 파일만 남은 새 인스턴스도 검증자를 보내야 함
+            crawler = GoogleNewsCrawler(client=client, cache=FeedCache(Path(tmp)))
+            second = await crawler.fetch(query="테스트", limit=5)
+    
+    print(f"\n[OK] 1회차 {len(first)}개, 2회차(304) {len(second)}개")
+    
+    assert "if-none-match" not in requests[0]
+    assert requests[1]["if-none-match"] == etag
+    assert requests[1]["if-modified-since"] == last_modified
+    assert len(first) == 2
+    assert [item.url for item in second] == [item.url for item in first]
+    assert second[0].source_name == "테스트일보"
+    return second
+
+
 async def test_naver_news():
     """네이버 뉴스 크롤러 테스트"""
     print("\n" + "=" * 50)
@@ -81,11 +152,238 @@ async def test_naver_search():
     return news_items
 
 
+async def test_orchestrator():
+    """크롤링 오케스트레이터 테스트 (공유 커넥션 풀)"""
+    print("\n" + "=" * 50)
+    print("[TEST] 크롤링 오케스트레이터 테스트")
+    print("=" * 50)
+    
+    google = GoogleNewsCrawler()
+    naver = NaverNewsCrawler()
+    jobs = [
+        CrawlJob(google, "AI 인공지능", 5),
+        CrawlJob(google, "스마트폰", 5),
+        CrawlJob(naver, "챗GPT", 5),
+        CrawlJob(naver, "", 5),
+    ]
+    
+    async with CrawlOrchestrator(per_host_concurrency=2) as orchestrator:
+        grouped = await orchestrator.run_grouped(jobs)
+    
+    print(f"\n[OK] {len(jobs)}개 작업 완료\n")
+    
+    for job, items in zip(jobs, grouped):
+        print(f"[{job.crawler.get_source_name()}] {job.query or '(섹션)'}: {len(items)}개")
+    
+    return [item for items in grouped for item in items]
+
+
+class RecordingCrawler(BaseCrawler):
+    """fetch 시점에 주입된 클라이언트와 검색어를 기록하는 대체 크롤러"""
+    
+    def __init__(self):
+        super().__init__()
+        self.clients = []
+        self.queries = []
+    
+    async def fetch(self, query: str = "기본 검색어", limit: int = 10) -> list[NewsItem]:
+        self.clients.append(self.client)
+        self.queries.append(query)
+        return []
+    
+    def get_source_name(self) -> str:
+        return "Recording"
+
+
+async def test_orchestrator_restores_clients():
+    """오케스트레이터가 끝난 뒤 크롤러의 클라이언트/리미터를 되돌리는지 테스트"""
+    print("\n" + "=" * 50)
+    print("[TEST] 오케스트레이터 클라이언트 복원 테스트")
+    print("=" * 50)
+    
+    crawler = RecordingCrawler()
+    async with CrawlOrchestrator() as orchestrator:
+        await orchestrator.run_grouped([
+            CrawlJob(crawler, "a"), CrawlJob(crawler, "b"), CrawlJob(crawler)
+        ])
+        shared = orchestrator.client
+    
+    assert crawler.clients == [shared, shared, shared]
+    assert crawler.client is None and crawler.limiter is None
+    # 검색어가 없는 작업은 크롤러 기본 검색어를 씀 (빈 문자열을 보내지 않음)
+    assert crawler.queries == ["a", "b", "기본 검색어"]
+    print("\n[OK] 실행 중에는 공유 클라이언트, 종료 후에는 원래 값")
+
+
+class FixedCrawler(BaseCrawler):
+    """미리 정해 둔 뉴스 목록을 돌려주는 대체 크롤러"""
+    
+    def __init__(self, news_items: list[NewsItem]):
+        super().__init__()
+        self.news_items = news_items
+    
+    async def fetch(self, query: str = "", limit: int = 10) -> list[NewsItem]:
+        return self.news_items[:limit]
+    
+    def get_source_name(self) -> str:
+        return "Fixed"
+
+
+async def test_fetch_new():
+    """증분 크롤링 테스트 (두 번째 수집은 워터마크 이후 뉴스만)"""
+    print("\n" + "=" * 50)
+    print("[TEST] 증분 크롤링 테스트")
+    print("=" * 50)
+    
+    base = datetime(2025, 1, 20, 9, tzinfo=timezone.utc)
+    
+    def item(i: int) -> NewsItem:
+        return NewsItem(
+            f"뉴스 {i}", "", f"https://example.com/{i}", NewsSource.GOOGLE_NEWS, "Fixed",
+            published_at=base + timedelta(hours=i),
+        )
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "watermarks.json"
+        crawler = FixedCrawler([item(1), item(0)])
+        first = [news async for news in crawler.fetch_new(WatermarkStore(path), "IT")]
+        
+        # 저장된 워터마크를 다시 읽은 저장소로 수집 (이전 뉴스 + 새 뉴스 1개)
+        crawler.news_items = [item(2), item(1), item(0)]
+        second = [news async for news in crawler.fetch_new(WatermarkStore(path), "IT")]
+        
+        # 오케스트레이터도 같은 저장소로 새 뉴스만 수집
+        crawler.news_items = [item(3), item(2)]
+        async with CrawlOrchestrator(watermarks=WatermarkStore(path)) as orchestrator:
+            third = await orchestrator.run([CrawlJob(crawler, "IT")])
+    
+    print(f"\n[OK] 1회차 {len(first)}개, 2회차 {len(second)}개, 3회차 {len(third)}개")
+    
+    assert [news.title for news in first] == ["뉴스 0", "뉴스 1"]
+    assert [news.title for news in second] == ["뉴스 2"]
+    assert [news.title for news in third] == ["뉴스 3"]
+    return second
+
+
+async def test_story_index():
+    """다룬 뉴스 인덱스 테스트 (다시 열어도 같은 URL/같은 제목은 이미 다룬 뉴스)"""
+    print("\n" + "=" * 50)
+    print("[TEST] 스토리 인덱스 테스트")
+    print("=" * 50)
+    
+    story = NewsItem(
+        "[단독] 삼성전자, 갤럭시 S25 공개", "", "https://www.example.com/s25?utm_source=rss",
+        NewsSource.GOOGLE_NEWS, "A",
+    )
+    same_url = NewsItem(
+        "갤S25 드디어 나왔다", "", "https://example.com/s25", NewsSource.NAVER_NEWS, "B",
+    )
+    same_title = NewsItem(
+        "삼성전자 갤럭시 S25 공개", "", "https://other.com/9", NewsSource.NAVER_NEWS, "C",
+    )
+    other = NewsItem(
+        "애플, 새 아이폰 발표", "", "https://example.com/iphone", NewsSource.GOOGLE_NEWS, "A",
+    )
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "story_index.db"
+        with StoryIndex(db_path) as index:
+            index.record(story)
+        
+        with StoryIndex(db_path) as index:
+            count = len(index)
+            unseen = index.filter_unseen([same_url, same_title, other])
+    
+    print(f"\n[OK] 지문 {count}개, 새 뉴스: {[item.title for item in unseen]}")
+    
+    assert count == 2
+    assert unseen == [other]
+    return unseen
+
+
+async def test_dedup(news_items=None):
+    """소스 간 중복 뉴스 제거 테스트"""
+    print("\n" + "=" * 50)
+    print("[TEST] 중복 뉴스 클러스터링 테스트")
+    print("=" * 50)
+    
+    if news_items is None:
+        news_items = [
+            NewsItem("[단독] 삼성전자, 갤럭시 S25 공개", "", "https://a.com/1", NewsSource.GOOGLE_NEWS, "A"),
+            NewsItem("삼성전자 갤럭시S25 공개", "요약", "https://b.com/2", NewsSource.NAVER_NEWS, "B"),
+            NewsItem("애플, 새 아이폰 발표", "", "https://c.com/3", NewsSource.GOOGLE_NEWS, "C"),
+        ]
+    
+    deduplicator = NewsDeduplicator()
+    clusters = deduplicator.cluster(news_items)
+    
+    print(f"\n[OK] {len(news_items)}개 -> {len(clusters)}개 클러스터\n")
+    
+    for cluster in clusters:
+        if len(cluster) > 1:
+            print(f"[중복 {len(cluster)}개]")
+            for item in cluster:
+                print(f"    {item.source_name}: {item.title}")
+    
+    return deduplicator.deduplicate(news_items)
+
+
+async def test_dedup_pairs():
+    """같은 뉴스는 합치고, 반대 내용의 비슷한 제목은 합치지 않는지 테스트"""
+    print("\n" + "=" * 50)
+    print("[TEST] 중복 판정 고정 쌍 테스트")
+    print("=" * 50)
+    
+    def item(title: str, summary: str, url: str, source_name: str) -> NewsItem:
+        return NewsItem(title, summary, url, NewsSource.GOOGLE_NEWS, source_name)
+    
+    duplicates = [
+        (
+            item("[단독] 삼성전자, 갤럭시 S25 공개",
+                 "삼성전자가 미국 샌프란시스코에서 갤럭시 S25 시리즈를 공개했다.",
+                 "https://a.com/1", "A"),
+            item("삼성전자 갤럭시S25 공개",
+                 "삼성전자는 22일 샌프란시스코에서 갤럭시 S25 시리즈를 공개했다고 밝혔다.",
+                 "https://b.com/2", "B"),
+        ),
+    ]
+    distinct = [
+        (
+            item("삼성전자 주가 상승", "삼성전자 주가가 외국인 매수에 상승 마감했다.",
+                 "https://a.com/3", "A"),
+            item("삼성전자 주가 하락", "삼성전자 주가가 외국인 매도에 하락 마감했다.",
+                 "https://b.com/4", "B"),
+        ),
+        (
+            item("SK하이닉스 HBM4 양산 시작", "SK하이닉스가 HBM4 양산을 시작했다.",
+                 "https://a.com/5", "A"),
+            item("SK하이닉스 HBM4 양산 연기", "SK하이닉스가 HBM4 양산을 연기했다.",
+                 "https://a.com/6", "A"),
+        ),
+    ]
+    
+    deduplicator = NewsDeduplicator()
+    for a, b in duplicates:
+        assert len(deduplicator.deduplicate([a, b])) == 1, (a.title, b.title)
+    for a, b in distinct:
+        assert len(deduplicator.deduplicate([a, b])) == 2, (a.title, b.title)
+    
+    print(f"\n[OK] 중복 {len(duplicates)}쌍 병합, 다른 뉴스 {len(distinct)}쌍 유지")
+    return len(duplicates) + len(distinct)
+
+
 async def main():
     setup_logger(log_level="INFO")
     
     print("\n[START] 크롤러 테스트 시작\n")
     
+    # 오프라인 테스트
+    dedup_pairs = await test_dedup_pairs()
+    await test_orchestrator_restores_clients()
+    cached_results = await test_feed_cache()
+    await test_fetch_new()
+    await test_story_index()
+    
     # Google News 테스트
     google_results = await test_google_news()
     
@@ -95,12 +393,24 @@ async def main():
     # 네이버 검색 테스트
     naver_search_results = await test_naver_search()
     
+    # 오케스트레이터 테스트
+    orchestrated_results = await test_orchestrator()
+    
+    # 중복 제거 테스트
+    deduped_results = await test_dedup(
+        google_results + naver_results + naver_search_results + orchestrated_results
+    )
+    
     print("\n" + "=" * 50)
     print("[SUMMARY] 테스트 결과 요약")
     print("=" * 50)
     print(f"Google News: {len(google_results)}개")
     print(f"Naver Section: {len(naver_results)}개")
     print(f"Naver Search: {len(naver_search_results)}개")
+    print(f"Orchestrator: {len(orchestrated_results)}개")
+    print(f"Deduplicated: {len(deduped_results)}개")
+    print(f"Dedup pairs: {dedup_pairs}쌍")
+    print(f"Feed cache: {len(cached_results)}개")
     print("\n[DONE] 테스트 완료!")
 
 
@@ -0,0 +1,197 @@
+"""미디어 모듈 테스트 스크립트
+
+실행: python -m tests.test_media
+
+랭킹/라이브러리 테스트는 오프라인으로 동작하고,
+Pexels 검색 테스트는 PEXELS_API_KEY가 있을 때만 실행됩니다.
+"""
+import asyncio
+import hashlib
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import httpx
+
+# Windows 콘솔 UTF-8 설정
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+
+from config.settings import settings
+from src.media import MediaDownloader, MediaLibrary, PexelsClient
+from src.media.pexels import PexelsVideo, PexelsVideoFile
+from src.media.ranking import pick_file, rank_videos
+from src.utils.logger import setup_logger
+
+
+def make_video(video_id: int, width: int, height: int, duration: float) -> PexelsVideo:
+    return PexelsVideo(
+        id=video_id,
+        url=f"https://www.pexels.com/video/{video_id}/",
+        duration=duration,
+        width=width,
+        height=height,
+        files=[
+            PexelsVideoFile(f"https://cdn/{video_id}/uhd.mp4", width * 2, height * 2, "uhd", "video/mp4"),
+            PexelsVideoFile(f"https://cdn/{video_id}/hd.mp4", width, height, "hd", "video/mp4"),
+            PexelsVideoFile(f"https://cdn/{video_id}/sd.mp4", width // 2, height // 2, "sd", "video/mp4"),
+        ],
+    )
+
+
+async def test_ranking():
+    """9:16 적합도 랭킹 테스트"""
+    print("\n" + "=" * 50)
+    print("[TEST] 9:16 랭킹 테스트")
+    print("=" * 50)
+    
+    videos = [
+        make_video(1, 1920, 1080, 30),  # 가로
+        make_video(2, 1080, 1920, 3),   # 세로, 너무 짧음
+        make_video(3, 1080, 1920, 20),  # 세로, 길이 충분
+    ]
+    ranked = rank_videos(videos, min_duration=10.0)
+    best_file = pick_file(ranked[0])
+    
+    print(f"\n[OK] 순위: {[video.id for video in ranked]}")
+    print(f"선택 파일: {best_file.quality} ({best_file.width}x{best_file.height})")
+    
+    assert ranked[0].id == 3
+    assert (best_file.width, best_file.height) == (1080, 1920)
+    return ranked
+
+
+async def test_library():
+    """내용 주소 라이브러리 테스트"""
+    print("\n" + "=" * 50)
+    print("[TEST] 미디어 라이브러리 테스트")
+    print("=" * 50)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        clip = root / "clip.mp4"
+        clip.write_bytes(b"fake video bytes")
+        
+        library = MediaLibrary(root / "library")
+        asset = library.add(clip, "Smartphone", "https://pexels/1", duration=12.0)
+        
+        # 새 인스턴스로 다시 열어도 인덱스에서 찾을 수 있어야 함
+        reopened = MediaLibrary(root / "library")
+        hits = reopened.find("smartphone")
+        tagged = reopened.get_by_source("https://pexels/1", "phone")
+        
+        print(f"\n[OK] 저장 위치: {Path(asset.file_path).relative_to(root)}")
+        print(f"키워드 조회: {len(hits)}개, 원본 URL 조회: {tagged is not None}")
+        
+        assert hits and hits[0].file_path == asset.file_path
+        assert reopened.find("phone")
+        return hits
+
+
+class DroppingStream(httpx.AsyncByteStream):
+    """중간에 연결이 끊기는 응답 스트림"""
+    
+    def __init__(self, data: bytes, drop_after: int):
+        self.data = data
+        self.drop_after = drop_after
+    
+    async def __aiter__(self):
+        yield self.data[:self.drop_after]
+        raise httpx.ReadError("connection reset")
+
+
+async def test_download():
+    """Range 이어 받기 다운로드 테스트"""
+    print("\n" + "=" * 50)
+    print("[TEST] 이어 받기 다운로드 테스트")
+    print("=" * 50)
+    
+    data = os.urandom(300_000)
+    requests = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        range_header = request.headers.get("range")
+        requests.append(range_header)
+        if range_header is None:
+            # 첫 요청은 1/3 지점에서 끊김
+            return httpx.Response(
+                200,
+                headers={"Content-Length": str(len(data))},
+                stream=DroppingStream(data, len(data) // 3),
+            )
+        
+        start = int(range_header.split("=")[1].rstrip("-"))
+        return httpx.Response(
+            206,
+            headers={"Content-Range": f"bytes {start}-{len(data) - 1}/{len(data)}"},
+            content=data[start:],
+        )
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        dest = Path(tmp) / "clip.mp4"
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            downloader = MediaDownloader(client, chunk_size=64 * 1024)
+            downloader.RETRY_BACKOFF = 0.0
+            result = await downloader.download(
+                "https://cdn.example/clip.mp4",
+                dest,
+                expected_sha256=hashlib.sha256(data).hexdigest(),
+            )
+        
+        print(f"\n[OK] {result.size:,} bytes, 요청: {requests}")
+        
+        assert dest.read_bytes() == data
+        assert len(requests) == 2 and requests[1].startswith("bytes=")
+        return result
+
+
+async def test_pexels_search():
+    """Pexels 검색 테스트"""
+    print("\n" + "=" * 50)
+    print("[TEST] Pexels 검색 테스트")
+    print("=" * 50)
+    
+    if not settings().pexels_api_key:
+        print("[SKIP] PEXELS_API_KEY 없음")
+        return []
+    
+    videos = await PexelsClient().search_videos("smartphone", per_page=5)
+    ranked = rank_videos(videos, min_duration=10.0)
+    
+    print(f"\n[OK] {len(videos)}개 검색\n")
+    for video in ranked:
+        video_file = pick_file(video)
+        print(f"- {video.id}: {video.width}x{video.height}, {video.duration:.0f}초 "
+              f"-> {video_file.width}x{video_file.height}")
+    
+    return ranked
+
+
+async def main():
+    setup_logger(log_level="INFO")
+    
+    print("\n[START] 미디어 모듈 테스트 시작\n")
+    
+    ranked = await test_ranking()
+    hits = await test_library()
+    downloaded = await test_download()
+    searched = await test_pexels_search()
+    
+    print("\n" + "=" * 50)
+    print("[SUMMARY] 테스트 결과 요약")
+    print("=" * 50)
+    print(f"랭킹 후보: {len(ranked)}개")
+    print(f"라이브러리 조회: {len(hits)}개")
+    print(f"다운로드: {downloaded.size:,} bytes")
+    print(f"Pexels 검색: {len(searched)}개")
+    print("\n[DONE] 테스트 완료!")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,316 @@
+"""파이프라인 단계 실행기 테스트
+
+실행: python -m tests.test_pipeline
+
+API 키 없이 가짜 단계 함수로 단계 겹침 실행과 중단된 실행 재개를,
+대체 스크립트 생성기와 무음 TTS로 스크립트 스트리밍과 음성 합성의 겹침을 확인합니다.
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+# Windows 콘솔 UTF-8 설정
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+
+from src.ai import ScriptStreamError
+from src.crawlers import StoryIndex
+from src.models import NewsItem, NewsSource, Script, ScriptSegment, SelectedNews
+from src.pipeline import ShortsJob, ShortsPipeline, Stage, StageRunner
+from src.pipeline.journal import RunJournal
+from src.tts import TTSEngine
+from src.utils.logger import setup_logger
+from tests.test_tts import SilentTTSProvider
+
+
+def fake_render(job: ShortsJob) -> ShortsJob:
+    """프로세스 풀에서 실행되는 CPU 단계 흉내"""
+    time.sleep(0.3)
+    return job
+
+
+async def fake_script(job: ShortsJob) -> ShortsJob:
+    await asyncio.sleep(0.2)
+    if job.index == 2:
+        raise RuntimeError("스크립트 생성 실패")
+    return job
+
+
+async def fake_upload(job: ShortsJob) -> ShortsJob:
+    await asyncio.sleep(0.1)
+    return job
+
+
+def make_jobs(count: int) -> list[ShortsJob]:
+    return [
+        ShortsJob(
+            index=i,
+            selected=SelectedNews(
+                news_item=NewsItem(f"뉴스 {i}", "", f"https://example.com/{i}", NewsSource.GOOGLE_NEWS, "Test"),
+                selection_reason="",
+                hook_idea="",
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+async def test_stage_runner():
+    """단계 겹침 실행 테스트"""
+    print("\n" + "=" * 50)
+    print("[TEST] 파이프라인 단계 실행기 테스트")
+    print("=" * 50)
+    
+    stages = [
+        Stage("script", fake_script, workers=2),
+        Stage("render", fake_render, workers=2, executor="process"),
+        Stage("upload", fake_upload, workers=1),
+    ]
+    
+    started = time.perf_counter()
+    jobs = await StageRunner(stages, process_workers=2).run(make_jobs(6))
+    elapsed = time.perf_counter() - started
+    
+    serial = 6 * (0.2 + 0.3 + 0.1)
+    print(f"\n[OK] {len(jobs)}개 작업 완료: {elapsed:.2f}s (순차 실행 시 약 {serial:.1f}s)\n")
+    
+    for job in jobs:
+        status = job.error or ", ".join(job.completed_stages)
+        print(f"[{job.index}] {status}")
+    
+    assert [job.index for job in jobs] == list(range(6))
+    assert jobs[2].failed and not jobs[2].completed_stages
+    assert elapsed < serial
+    
+    return jobs
+
+
+async def test_resume_killed_run():
+    """중단된 실행 재개 테스트 (완료된 단계는 건너뛰고 첫 미완료 단계부터)"""
+    print("\n" + "=" * 50)
+    print("[TEST] 중단된 실행 재개 테스트")
+    print("=" * 50)
+    
+    calls: list[tuple[str, int]] = []
+    killed = asyncio.Event()
+    
+    def stage(name: str, hang: bool = False):
+        async def func(job: ShortsJob) -> ShortsJob:
+            calls.append((name, job.index))
+            if hang:
+                # 렌더링 도중 프로세스가 죽은 상황: 끝나지 않고 취소됨
+                killed.set()
+                await asyncio.Event().wait()
+            return job
+        return Stage(name, func)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        runs_dir = Path(tmp)
+        
+        journal = RunJournal("killed_run", runs_dir=runs_dir)
+        journal.record_selection([job.selected for job in make_jobs(1)])
+        runner = StageRunner(
+            [stage("script"), stage("tts"), stage("render", hang=True), stage("upload")],
+            on_stage_done=journal.record_job,
+        )
+        run = asyncio.create_task(runner.run(journal.restore_jobs()))
+        await killed.wait()
+        run.cancel()
+        await asyncio.gather(run, return_exceptions=True)
+        
+        first_calls = list(calls)
+        calls.clear()
+        
+        journal = RunJournal.load("killed_run", runs_dir=runs_dir)
+        runner = StageRunner(
+            [stage("script"), stage("tts"), stage("render"), stage("upload")],
+            on_stage_done=journal.record_job,
+        )
+        jobs = await runner.run(journal.restore_jobs())
+        
+        for bad_id in ("../escape", "a/b", "", "run id"):
+            try:
+                RunJournal.load(bad_id, runs_dir=runs_dir)
+                raise AssertionError(f"ValueError가 발생해야 합니다: {bad_id!r}")
+            except ValueError:
+                pass
+        assert not (runs_dir.parent / "escape").exists()
+    
+    print(f"\n[OK] 첫 실행: {first_calls}")
+    print(f"[OK] 재개: {calls} -> {jobs[0].completed_stages}")
+    print("[OK] 경로를 벗어나는 실행 ID 거부")
+    
+    assert first_calls == [("script", 0), ("tts", 0), ("render", 0)]
+    assert calls == [("render", 0), ("upload", 0)]
+    assert jobs[0].completed_stages == ["script", "tts", "render", "upload"]
+    return jobs
+
+
+async def test_runner_edge_cases():
+    """워커 수 0인 단계와 진행 기록 실패 테스트 (멈추거나 작업을 실패시키지 않음)"""
+    print("\n" + "=" * 50)
+    print("[TEST] 단계 실행기 경계 조건 테스트")
+    print("=" * 50)
+    
+    recorded = []
+    
+    def flaky_record(job: ShortsJob, stage_name: str) -> None:
+        if job.index == 1 and stage_name == "script":
+            raise OSError("디스크가 가득 찼습니다")
+        recorded.append((stage_name, job.index))
+    
+    runner = StageRunner(
+        [Stage("script", fake_upload, workers=0), Stage("upload", fake_upload, workers=0)],
+        on_stage_done=flaky_record,
+    )
+    jobs = await asyncio.wait_for(runner.run(make_jobs(3)), timeout=10)
+    
+    print(f"\n[OK] 워커 0 설정으로 {len(jobs)}개 작업 완료, 기록 {len(recorded)}건")
+    
+    assert all(job.completed_stages == ["script", "upload"] for job in jobs)
+    assert not any(job.failed for job in jobs)
+    assert ("script", 1) not in recorded and ("upload", 1) in recorded
+    return jobs
+
+
+STREAM_SCRIPT = Script(
+    title="스트리밍 제목",
+    hook="훅 문장입니다.",
+    body="본문 문장입니다.",
+    outro="마무리 문장입니다.",
+    full_script="훅 문장입니다. 본문 문장입니다. 마무리 문장입니다.",
+    keywords=["테크"],
+    hashtags=[],
+    description="설명",
+)
+FALLBACK_SCRIPT = Script(
+    "다시 생성한 제목", "", "", "", "다시 생성한 스크립트입니다.", ["테크"], [], "설명"
+)
+
+
+class RecordingTTSProvider(SilentTTSProvider):
+    """합성한 문장을 사건 목록에 기록하는 무음 제공자"""
+    
+    def __init__(self, events: list):
+        super().__init__()
+        self.events = events
+    
+    async def synthesize(self, text, config, output_path):
+        self.events.append(("tts", text))
+        return await super().synthesize(text, config, output_path)
+
+
+class TempDirTTSEngine(TTSEngine):
+    """합성 결과를 출력 폴더 대신 임시 폴더에 쓰는 TTS 엔진"""
+    
+    def __init__(self, provider, out_dir: Path):
+        super().__init__(provider)
+        self.cache = None
+        self.out_dir = out_dir
+    
+    def _output_path(self) -> Path:
+        return self.out_dir / f"tts_{uuid.uuid4().hex[:8]}.wav"
+    
+    async def synthesize(self, script, config=None, output_path=None):
+        return await super().synthesize(script, config, output_path or self._output_path())
+    
+    async def synthesize_stream(self, segments, config=None, output_path=None):
+        return await super().synthesize_stream(segments, config, output_path or self._output_path())
+
+
+class StreamingWriterStub:
+    """구간 사이에 생성 지연을 두는 대체 스크립트 생성기 (fail_index 작업은 스트림이 깨짐)"""
+    
+    def __init__(self, events: list, fail_index: int):
+        self.events = events
+        self.fail_index = fail_index
+        self.writes = 0
+    
+    async def write_stream(self, selected: SelectedNews):
+        index = int(selected.news_item.title.split()[-1])
+        for name in ("hook", "body", "outro"):
+            self.events.append(("segment", name))
+            yield ScriptSegment(name=name, text=getattr(STREAM_SCRIPT, name))
+            # 다음 구간을 생성하는 동안 앞 구간 합성이 진행되어야 함
+            await asyncio.sleep(0.1)
+            if index == self.fail_index:
+                raise ScriptStreamError("Streamed script invalid")
+        yield ScriptSegment(name="complete", text=STREAM_SCRIPT.full_script, script=STREAM_SCRIPT)
+    
+    async def write(self, selected: SelectedNews) -> Script:
+        self.writes += 1
+        return FALLBACK_SCRIPT
+
+
+async def test_script_stream_tts():
+    """스크립트 스트리밍 + 훅 선합성 테스트 (스트림이 깨지면 write()로 재생성)"""
+    print("\n" + "=" * 50)
+    print("[TEST] 스크립트 스트리밍 TTS 겹침 테스트")
+    print("=" * 50)
+    
+    events: list[tuple[str, str]] = []
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        pipeline = ShortsPipeline(story_index=StoryIndex(tmp / "stories.db"), upload=False)
+        pipeline.writer = StreamingWriterStub(events, fail_index=1)
+        pipeline.tts = TempDirTTSEngine(RecordingTTSProvider(events), tmp)
+        
+        runner = StageRunner([
+            Stage("script", pipeline._script_stage, workers=2),
+            Stage("tts", pipeline._tts_stage, workers=2),
+        ])
+        streamed, fallback = await runner.run(make_jobs(2))
+        pipeline.story_index.close()
+    
+    print(f"\n[OK] 스트리밍: {streamed.script.title} ({streamed.tts.duration:.2f}s)")
+    print(f"[OK] 재생성: {fallback.script.title} ({fallback.tts.duration:.2f}s)")
+    
+    assert not streamed.failed and not fallback.failed
+    # 훅 합성이 body 구간이 나오기 전에 시작됨
+    hook = events.index(("tts", STREAM_SCRIPT.hook))
+    assert hook < [i for i, event in enumerate(events) if event == ("segment", "body")][0]
+    assert streamed.script is STREAM_SCRIPT
+    # 구간별로 시작한 합성을 그대로 이어 붙임 (전체 스크립트를 다시 합성하지 않음)
+    assert ("tts", STREAM_SCRIPT.full_script) not in events
+    assert events.count(("tts", STREAM_SCRIPT.outro)) == 1
+    assert len(streamed.tts.sentence_timings) == 3
+    assert streamed.tts.character_count == len(STREAM_SCRIPT.full_script)
+    # 깨진 스트림의 구간은 버리고 다시 생성한 스크립트로 합성
+    assert fallback.script is FALLBACK_SCRIPT and pipeline.writer.writes == 1
+    assert fallback.tts.character_count == len(FALLBACK_SCRIPT.full_script)
+    assert len(fallback.tts.sentence_timings) == 1
+    assert not pipeline._pending_tts
+    return events
+
+
+async def main():
+    setup_logger(log_level="INFO")
+    
+    print("\n[START] 파이프라인 테스트 시작\n")
+    
+    jobs = await test_stage_runner()
+    await test_resume_killed_run()
+    await test_runner_edge_cases()
+    events = await test_script_stream_tts()
+    
+    print("\n" + "=" * 50)
+    print("[SUMMARY] 테스트 결과 요약")
+    print("=" * 50)
+    print(f"성공: {sum(not job.failed for job in jobs)}개")
+    print(f"실패: {sum(job.failed for job in jobs)}개")
+    print(f"스트리밍 TTS 사건: {len(events)}개")
+    print("\n[DONE] 테스트 완료!")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
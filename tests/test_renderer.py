@@ -0,0 +1,312 @@
+"""렌더러 테스트 스크립트
+
+실행: python -m tests.test_renderer
+
+ffmpeg lavfi로 테스트 소재를 만들어 렌더링하므로 API 키가 필요 없습니다.
+"""
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Windows 콘솔 UTF-8 설정
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+
+from src.media import FFmpegRenderer, RenderFarm, RenderTask
+from src.media.captions import CaptionAtlas, group_captions
+from src.media.benchmark import pick_profile, run_benchmark, write_profile
+from src.media.render_farm import plan_capacity
+from src.media.renderer import find_ffmpeg, find_font
+from src.models import MediaAsset, Script, TTSProvider, TTSResult
+from src.tts.timing import align_chunks, estimate_word_timings
+from src.utils.cache import DiskCache
+from src.utils.logger import setup_logger
+
+
+SCRIPT_TEXT = "삼성전자가 새 스마트폰을 공개했습니다. 이번 제품은 AI 기능이 대폭 강화됐는데요."
+DURATION = 8.0
+
+
+def temp_caches(work_dir: Path) -> dict[str, DiskCache]:
+    """output/cache 대신 작업 폴더에 두는 세그먼트/자막 캐시 (렌더러, RenderTask 인자)"""
+    return {
+        "segment_cache": DiskCache(work_dir / "render", suffix=".mp4"),
+        "caption_cache": DiskCache(work_dir / "captions", suffix=".png"),
+    }
+
+
+def make_fixtures(work_dir: Path) -> tuple[TTSResult, list[MediaAsset]]:
+    """가로/세로 테스트 영상과 사인파 음성 생성"""
+    ffmpeg = find_ffmpeg()
+    sources = {
+        "landscape.mp4": ("testsrc=s=1920x1080:r=25:d=4", 1920, 1080, 4.0),
+        "portrait.mp4": ("testsrc2=s=720x1280:r=30:d=2", 720, 1280, 2.0),
+    }
+    
+    media = []
+    for name, (source, width, height, duration) in sources.items():
+        path = work_dir / name
+        subprocess.run(
+            [ffmpeg, "-y", "-loglevel", "error", "-f", "lavfi", "-i", source,
+             "-c:v", "libx264", "-preset", "ultrafast", str(path)],
+            check=True,
+        )
+        media.append(MediaAsset(str(path), "video", "", "test", duration, width, height))
+    
+    audio_path = work_dir / "tts.mp3"
+    subprocess.run(
+        [ffmpeg, "-y", "-loglevel", "error", "-f", "lavfi",
+         "-i", f"sine=f=440:d={DURATION}", str(audio_path)],
+        check=True,
+    )
+    tts = TTSResult(
+        audio_path=str(audio_path),
+        duration=DURATION,
+        character_count=len(SCRIPT_TEXT),
+        provider=TTSProvider.EDGE,
+        word_timings=estimate_word_timings(SCRIPT_TEXT, 0.0, DURATION),
+    )
+    return tts, media
+
+
+async def test_group_captions():
+    """자막 줄 묶기 테스트"""
+    print("\n" + "=" * 50)
+    print("[TEST] 자막 줄 묶기 테스트")
+    print("=" * 50)
+    
+    words = estimate_word_timings(SCRIPT_TEXT, 0.0, DURATION)
+    captions = group_captions(words, max_chars=14)
+    
+    print(f"\n[OK] {len(words)}개 단어 → {len(captions)}줄\n")
+    for caption in captions:
+        print(f"  [{caption.start:5.2f} - {caption.end:5.2f}] {caption.text}")
+    
+    assert all(len(c.text.replace(" ", "")) <= 14 for c in captions)
+    assert captions[-1].end == DURATION
+    return captions
+
+
+async def test_caption_atlas():
+    """자막 줄 이미지 캐시 + overlay 렌더링 테스트"""
+    print("\n" + "=" * 50)
+    print("[TEST] 자막 이미지 캐시 테스트")
+    print("=" * 50)
+    
+    font_file = find_font()
+    if font_file is None:
+        print("\n[SKIP] 한글 글꼴이 없습니다 (RENDER_FONT_FILE 또는 assets/fonts)")
+        return None
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(tmp)
+        cache = DiskCache(work_dir / "captions", suffix=".png")
+        atlas = CaptionAtlas(font_file, 72, cache=cache)
+        
+        line = atlas.rasterize("삼성전자가 새 스마트폰을")
+        assert line.ndim == 3 and line.shape[2] == 4
+        assert line.shape[1] <= atlas.max_width
+        assert atlas.rasterize("삼성전자가 새 스마트폰을") is line
+        
+        first = atlas.image_path("삼성전자가 새 스마트폰을")
+        assert atlas.image_path("삼성전자가 새 스마트폰을") == first
+        assert cache.stats.writes == 1
+        
+        tts, media = make_fixtures(work_dir)
+        script = Script("테스트", "", "", "", SCRIPT_TEXT, ["test"], [], "")
+        renderer = FFmpegRenderer(
+            preset="ultrafast",
+            font_file=str(font_file),
+            segment_cache=DiskCache(work_dir / "render", suffix=".mp4"),
+            caption_cache=cache,
+        )
+        
+        started = time.perf_counter()
+        video = renderer.render(script, tts, media, work_dir / "captions.mp4")
+        elapsed = time.perf_counter() - started
+        
+        print(f"\n[OK] {line.shape[1]}x{line.shape[0]} 자막 줄, "
+              f"overlay 렌더링 {elapsed:.1f}초")
+        print(f"캐시: {cache.stats.to_dict()}")
+        
+        assert renderer.caption_mode == "overlay"
+        assert Path(video.video_path).stat().st_size > 0
+        return cache.stats
+
+
+async def test_ffmpeg_render():
+    """단일 필터 그래프 렌더링 테스트"""
+    print("\n" + "=" * 50)
+    print("[TEST] FFmpeg 렌더링 테스트")
+    print("=" * 50)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(tmp)
+        tts, media = make_fixtures(work_dir)
+        script = Script("테스트", "", "", "", SCRIPT_TEXT, ["test"], [], "")
+        
+        started = time.perf_counter()
+        video = FFmpegRenderer(preset="ultrafast", **temp_caches(work_dir)).render(
+            script, tts, media, work_dir / "shorts.mp4"
+        )
+        elapsed = time.perf_counter() - started
+        
+        print(f"\n[OK] 렌더링 완료 ({elapsed:.1f}초)")
+        print(f"길이: {video.duration:.1f}초, 크기: {video.file_size_mb:.2f}MB")
+        
+        assert Path(video.video_path).stat().st_size > 0
+        return video
+
+
+async def test_segment_cache():
+    """세그먼트 캐시 증분 렌더링 테스트"""
+    print("\n" + "=" * 50)
+    print("[TEST] 세그먼트 캐시 테스트")
+    print("=" * 50)
+    
+    sentences = ["새 스마트폰이 나왔습니다.", "AI 기능이 강화됐는데요.", "출시는 다음 달입니다."]
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(tmp)
+        tts, media = make_fixtures(work_dir)
+        tts.word_timings, tts.sentence_timings = align_chunks(
+            sentences, [2.5, 3.0, 2.5], [None] * len(sentences)
+        )
+        script = Script("테스트", sentences[0], sentences[1], sentences[2],
+                        " ".join(sentences), ["test"], [], "")
+        caches = temp_caches(work_dir)
+        cache = caches["segment_cache"]
+        
+        renderer = FFmpegRenderer(preset="ultrafast", **caches)
+        renderer.render(script, tts, media, work_dir / "first.mp4")
+        encoded = cache.stats.writes
+        
+        # 입력이 같으면 모든 세그먼트를 캐시에서 가져와 이어 붙이기만 함
+        started = time.perf_counter()
+        video = renderer.render(script, tts, media, work_dir / "second.mp4")
+        elapsed = time.perf_counter() - started
+        
+        print(f"\n[OK] 첫 렌더 {encoded}개 세그먼트 인코딩, 재렌더 {elapsed:.1f}초")
+        print(f"캐시: {cache.stats.to_dict()}")
+        
+        assert cache.stats.writes == encoded
+        assert cache.stats.hits == encoded
+        assert abs(video.duration - tts.duration) < 0.01
+        return cache.stats
+
+
+async def test_render_farm():
+    """CPU 기반 배치 렌더 스케줄링 테스트"""
+    print("\n" + "=" * 50)
+    print("[TEST] 렌더 팜 테스트")
+    print("=" * 50)
+    
+    # 32코어 렌더 노드에서 하루 3편이면 동시에 3편, 렌더당 10스레드
+    assert plan_capacity(3, cpu_count=32, load=2.0, min_threads=2, threads=0) == (3, 10)
+    assert plan_capacity(3, cpu_count=2, load=0.0, min_threads=2, threads=0) == (1, 2)
+    # 프로필/설정으로 렌더당 스레드 수가 정해져 있으면 그대로 쓰고 동시 렌더 수만 조절
+    assert plan_capacity(3, cpu_count=32, load=2.0, min_threads=2, threads=4) == (3, 4)
+    assert plan_capacity(3, cpu_count=32, load=2.0, min_threads=2, threads=16) == (1, 16)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(tmp)
+        tts, media = make_fixtures(work_dir)
+        script = Script("테스트", "", "", "", SCRIPT_TEXT, ["test"], [], "")
+        
+        caches = temp_caches(work_dir)
+        
+        tasks = []
+        for index, duration in enumerate([2.0, 6.0, 4.0]):
+            short_tts = TTSResult(tts.audio_path, duration, tts.character_count, tts.provider)
+            tasks.append(RenderTask(
+                index, script, short_tts, media, work_dir / f"{index}.mp4", **caches
+            ))
+        
+        async with RenderFarm(job_count=len(tasks), workers=1) as farm:
+            reports = await farm.run(tasks)
+        
+        print(f"\n[OK] 렌더 순서: {[report.index for report in farm.reports]}\n")
+        for report in reports:
+            print(f"  #{report.index}: {report.seconds:.1f}초 ({report.threads}스레드)")
+        
+        assert all(report.video for report in reports)
+        assert [report.index for report in farm.reports] == [1, 2, 0]
+        
+        # 기다리던 쪽이 취소된 작업은 워커에 보내지 않음
+        async with RenderFarm(job_count=len(tasks), workers=1) as farm:
+            waiters = [asyncio.ensure_future(farm.submit(task)) for task in tasks]
+            await asyncio.sleep(0.1)  # 가장 큰 #1이 워커에 배정된 뒤
+            waiters[0].cancel()
+            waiters[2].cancel()
+            await asyncio.gather(*waiters, return_exceptions=True)
+            await asyncio.sleep(0)
+            # #1이 끝난 뒤 취소된 작업이 다음 워커 자리를 차지하지 않음
+            assert farm._running == 0 and not farm._pending
+        
+        print(f"[OK] 대기 취소 후 렌더: {[report.index for report in farm.reports]}")
+        assert [report.index for report in farm.reports] == [1]
+        assert waiters[1].result().video
+        return reports
+
+
+async def test_benchmark():
+    """인코더 설정 벤치마크 테스트 (프로필 파일은 쓰지 않음)"""
+    print("\n" + "=" * 50)
+    print("[TEST] 인코더 벤치마크 테스트")
+    print("=" * 50)
+    
+    results = run_benchmark(["ultrafast", "veryfast"], [23], [0], duration=2.0)
+    best = pick_profile(results, min_ssim=0.9)
+    
+    print(f"\n[OK] {len(results)}개 설정 측정\n")
+    for result in results:
+        print(f"  {result.preset} crf={result.crf}: {result.seconds:.1f}초, "
+              f"{result.file_size_mb:.2f}MB, SSIM {result.ssim:.4f}")
+    print(f"선택: {best.preset} crf={best.crf}")
+    
+    assert all(0.9 < result.ssim <= 1.0 for result in results)
+    
+    # 아직 없는 폴더에도 프로필을 쓸 수 있음
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_profile(best, Path(tmp) / "node" / "render_profile.json")
+        assert json.loads(path.read_text(encoding="utf-8"))["preset"] == best.preset
+    return best
+
+
+async def main():
+    setup_logger(log_level="INFO")
+    
+    print("\n[START] 렌더러 테스트 시작\n")
+    
+    captions = await test_group_captions()
+    atlas_stats = await test_caption_atlas()
+    video = await test_ffmpeg_render()
+    stats = await test_segment_cache()
+    reports = await test_render_farm()
+    best = await test_benchmark()
+    
+    print("\n" + "=" * 50)
+    print("[SUMMARY] 테스트 결과 요약")
+    print("=" * 50)
+    print(f"자막 줄: {len(captions)}개")
+    if atlas_stats:
+        print(f"자막 이미지 캐시: {atlas_stats.writes}개 저장")
+    print(f"영상 길이: {video.duration:.1f}초")
+    print(f"세그먼트 캐시 적중: {stats.hits}개")
+    print(f"배치 렌더: {len(reports)}편")
+    print(f"벤치마크 프로필: {best.preset} crf={best.crf}")
+    print("\n[DONE] 테스트 완료!")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,197 @@
+"""스크립트 생성기 테스트 (API 호출 없음)
+
+실행: python -m tests.test_script_writer
+
+OpenAI 클라이언트 대신 미리 정해 둔 응답을 돌려주는 대체 클라이언트를 씁니다.
+"""
+import asyncio
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+# Windows 콘솔 UTF-8 설정
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+
+from src.ai import ScriptStreamError, ScriptWriter
+from src.models import NewsItem, NewsSource, SelectedNews
+from src.utils.logger import setup_logger
+
+
+SCRIPT_RESPONSE = json.dumps({
+    "title": "갤럭시 S25 공개",
+    "script": {
+        "hook": "삼성이 또 일을 냈습니다.",
+        "body": "갤럭시 S25는 AI 기능이 대폭 강화됐습니다.",
+        "outro": "여러분의 생각은 어떠신가요?",
+    },
+    "full_script": "삼성이 또 일을 냈습니다. 갤럭시 S25는 AI 기능이 대폭 강화됐습니다.",
+    "keywords": ["삼성", "스마트폰"],
+    "hashtags": ["#갤럭시"],
+    "description": "갤럭시 S25 공개 소식",
+}, ensure_ascii=False)
+
+
+def make_news(i: int = 0) -> SelectedNews:
+    return SelectedNews(
+        news_item=NewsItem(
+            title=f"테스트 뉴스 {i}",
+            summary="요약",
+            url=f"https://example.com/{i}",
+            source=NewsSource.GOOGLE_NEWS,
+            source_name="Test",
+        ),
+        selection_reason="테스트",
+        hook_idea="훅",
+    )
+
+
+class StreamStub:
+    """chat_stream이 주어진 응답을 작은 조각으로 나눠 돌려주는 대체 클라이언트"""
+    
+    model = "stub"
+    
+    def __init__(self, response: str, chunk_size: int = 7):
+        self.response = response
+        self.chunk_size = chunk_size
+    
+    async def chat_stream(self, **kwargs):
+        for i in range(0, len(self.response), self.chunk_size):
+            await asyncio.sleep(0)
+            yield self.response[i:i + self.chunk_size]
+
+
+class ConcurrencyStub:
+    """동시에 처리 중인 chat_structured 호출 수를 세는 대체 클라이언트
+    
+    뒤쪽 뉴스일수록 빨리 끝나도록 지연을 줘서 완료 순서를 입력과 반대로 만듭니다.
+    """
+    
+    model = "stub"
+    
+    def __init__(self, count: int, fail_index: int = -1):
+        self.count = count
+        self.fail_index = fail_index
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.finished = []
+    
+    async def chat_structured(self, user_prompt: str, **kwargs) -> dict:
+        index = int(re.search(r"테스트 뉴스 (\d+)", user_prompt).group(1))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep((self.count - index) * 0.01)
+            if index == self.fail_index:
+                raise ValueError("스키마 불일치")
+            self.finished.append(index)
+            return {**json.loads(SCRIPT_RESPONSE), "title": f"스크립트 {index}"}
+        finally:
+            self.in_flight -= 1
+
+
+async def collect_stream(response: str) -> tuple[list, int]:
+    """write_stream 결과와 (재생성이 일어났는지 보기 위한) write 호출 수"""
+    writer = ScriptWriter()
+    writer.client = StreamStub(response)
+    
+    calls = 0
+    
+    async def write(selected):
+        nonlocal calls
+        calls += 1
+        raise AssertionError("스트림 실패 시 새로 생성하면 안 됩니다")
+    
+    writer.write = write
+    segments = [segment async for segment in writer.write_stream(make_news())]
+    return segments, calls
+
+
+async def test_write_stream():
+    """스트리밍 스크립트 생성 테스트 (잘린 꼬리 복구 / 복구 불가 시 예외)"""
+    print("\n" + "=" * 50)
+    print("[TEST] 스트리밍 스크립트 생성 테스트")
+    print("=" * 50)
+    
+    # 1) 정상 응답: 구간이 순서대로 나오고 마지막 Script와 일치
+    segments, _ = await collect_stream(SCRIPT_RESPONSE)
+    names = [segment.name for segment in segments]
+    script = segments[-1].script
+    assert names == ["hook", "body", "outro", "complete"]
+    assert [s.text for s in segments[:3]] == [script.hook, script.body, script.outro]
+    print(f"\n[OK] 정상 응답: {names}")
+    
+    # 2) 마지막 필드가 잘린 응답: 같은 응답을 복구해 마무리
+    truncated = SCRIPT_RESPONSE[:SCRIPT_RESPONSE.index('"description"') + 20]
+    segments, calls = await collect_stream(truncated)
+    script = segments[-1].script
+    assert calls == 0
+    assert segments[0].text == script.hook
+    assert script.description.startswith("갤럭시")
+    print(f"[OK] 잘린 꼬리 복구: description={script.description!r}")
+    
+    # 3) 필수 항목 전에 깨진 응답: 다른 생성 결과를 섞지 않고 예외
+    malformed = SCRIPT_RESPONSE[:SCRIPT_RESPONSE.index('"full_script"')] + '"full_scr}}}'
+    yielded = []
+    writer = ScriptWriter()
+    writer.client = StreamStub(malformed)
+    try:
+        async for segment in writer.write_stream(make_news()):
+            yielded.append(segment.name)
+        raise AssertionError("ScriptStreamError가 발생해야 합니다")
+    except ScriptStreamError as e:
+        print(f"[OK] 복구 불가 응답: {yielded} 이후 예외 ({e})")
+    
+    assert "complete" not in yielded
+    return names
+
+
+async def test_write_batch():
+    """동시 스크립트 생성 테스트 (세마포어 한도, 입력 순서 유지, 실패 항목 제외)"""
+    print("\n" + "=" * 50)
+    print("[TEST] 동시 스크립트 생성 테스트")
+    print("=" * 50)
+    
+    count, limit = 8, 3
+    writer = ScriptWriter()
+    writer.client = ConcurrencyStub(count, fail_index=5)
+    
+    scripts = await writer.write_batch([make_news(i) for i in range(count)], max_concurrency=limit)
+    titles = [script and script.title for script in scripts]
+    
+    print(f"\n[OK] 최대 동시 요청 {writer.client.max_in_flight}개 (한도 {limit})")
+    print(f"완료 순서: {writer.client.finished}")
+    print(f"결과 순서: {titles}")
+    
+    assert writer.client.max_in_flight == limit
+    assert writer.client.finished != sorted(writer.client.finished)
+    # 입력과 같은 길이로 정렬되어 실패한 항목은 None
+    assert titles == [None if i == 5 else f"스크립트 {i}" for i in range(count)]
+    return scripts
+
+
+async def main():
+    setup_logger(log_level="INFO")
+    
+    print("\n[START] 스크립트 생성기 테스트 시작\n")
+    
+    names = await test_write_stream()
+    scripts = await test_write_batch()
+    
+    print("\n" + "=" * 50)
+    print("[SUMMARY] 테스트 결과 요약")
+    print("=" * 50)
+    print(f"스트리밍 구간: {', '.join(names)}")
+    print(f"동시 생성: {sum(script is not None for script in scripts)}/{len(scripts)}개")
+    print("\n[DONE] 테스트 완료!")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
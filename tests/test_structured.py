@@ -0,0 +1,154 @@
+"""구조화 응답 처리 테스트 (JSON 복구, 스키마 검사, 스트리밍 필드 파서)
+
+실행: python -m tests.test_structured
+
+API 호출 없이 고정된 응답 문자열만 사용합니다.
+"""
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# Windows 콘솔 UTF-8 설정
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+
+from config.prompts import SCRIPT_GENERATION_SCHEMA
+from src.ai.structured import (
+    StreamingFieldParser,
+    parse_json,
+    repair_json,
+    validate_schema,
+)
+from src.utils.logger import setup_logger
+
+
+# (설명, 응답, 기대 결과)
+REPAIR_CASES = [
+    ("뒤쪽 쉼표", '{"a": 1, "b": [1, 2,],}', {"a": 1, "b": [1, 2]}),
+    ("코드 펜스", '```json\n{"a": 1}\n```', {"a": 1}),
+    ("닫히지 않은 코드 펜스", '```json\n{"a": 1}', {"a": 1}),
+    ("앞뒤 설명 문장", '다음은 결과입니다: {"a": 1} 감사합니다', {"a": 1}),
+    ("값 안의 백틱", '{"a": "b```c"}', {"a": "b```c"}),
+    ("잘린 문자열", '{"a": 1, "b": "안녕하', {"a": 1, "b": "안녕하"}),
+    ("잘린 이스케이프", '{"a": "x\\', {"a": "x"}),
+    ("값 없이 잘림", '{"a": 1, "b": ', {"a": 1, "b": None}),
+    ("잘린 배열", '{"a": [1, 2', {"a": [1, 2]}),
+    ("잘린 리터럴", '{"a": 1, "b": tr', {"a": 1}),
+    ("잘린 중첩 객체", '{"a": {"b": [{"c": 1}, {"d":', {"a": {"b": [{"c": 1}, {"d": None}]}}),
+]
+
+
+async def test_repair_json():
+    """JSON 복구 테스트 (쉼표, 코드 펜스, 잘린 객체)"""
+    print("\n" + "=" * 50)
+    print("[TEST] JSON 복구 테스트")
+    print("=" * 50)
+    print()
+    
+    for name, text, expected in REPAIR_CASES:
+        result = parse_json(text)
+        print(f"[OK] {name}: {result}")
+        assert result == expected, (name, result)
+    
+    for text in ("죄송합니다, 답변할 수 없습니다", ""):
+        try:
+            repair_json(text)
+            raise AssertionError(f"ValueError가 발생해야 합니다: {text!r}")
+        except ValueError as e:
+            print(f"[OK] 복구 불가: {text!r} ({e})")
+    
+    return len(REPAIR_CASES)
+
+
+async def test_validate_schema():
+    """스키마 검사 테스트 (필수 항목, 타입, 중첩 경로)"""
+    print("\n" + "=" * 50)
+    print("[TEST] 스키마 검사 테스트")
+    print("=" * 50)
+    
+    valid = {
+        "title": "제목",
+        "script": {"hook": "훅", "body": "본문", "outro": "아웃트로"},
+        "full_script": "훅 본문 아웃트로",
+        "keywords": ["삼성"],
+        "hashtags": ["#IT"],
+        "description": "설명",
+    }
+    assert validate_schema(valid, SCRIPT_GENERATION_SCHEMA) == []
+    
+    invalid = {
+        **valid,
+        "script": {"hook": "훅", "body": 3},
+        "keywords": ["삼성", 1],
+    }
+    del invalid["title"]
+    errors = validate_schema(invalid, SCRIPT_GENERATION_SCHEMA)
+    
+    print("\n[OK] 유효한 스크립트: 오류 없음")
+    for error in errors:
+        print(f"[OK] {error}")
+    
+    assert "$.title: 필수 항목이 없습니다" in errors
+    assert "$.script.outro: 필수 항목이 없습니다" in errors
+    assert "$.script.body: string 타입이어야 합니다" in errors
+    assert "$.keywords[1]: string 타입이어야 합니다" in errors
+    
+    # bool은 정수로 보지 않음, 최상위 타입이 다르면 하위 항목은 검사하지 않음
+    assert validate_schema(True, {"type": "integer"}) == ["$: integer 타입이어야 합니다"]
+    assert validate_schema(1.5, {"type": "number"}) == []
+    assert validate_schema([], SCRIPT_GENERATION_SCHEMA) == ["$: object 타입이어야 합니다"]
+    return errors
+
+
+async def test_streaming_field_parser():
+    """스트리밍 필드 파서 테스트 (완성된 필드만 순서대로)"""
+    print("\n" + "=" * 50)
+    print("[TEST] 스트리밍 필드 파서 테스트")
+    print("=" * 50)
+    
+    response = '{"script": {"hook": "따옴표 \\"인용\\" 포함", "body": "본문\\n둘째 줄", "outro": "끝"}}'
+    
+    parser = StreamingFieldParser(["hook", "body", "outro"])
+    fields = []
+    for i in range(0, len(response), 3):
+        fields.extend(parser.feed(response[i:i + 3]))
+    
+    print(f"\n[OK] {fields}")
+    assert fields == [("hook", '따옴표 "인용" 포함'), ("body", "본문\n둘째 줄"), ("outro", "끝")]
+    assert parser.pending == []
+    
+    # 닫는 따옴표 전에는 내보내지 않고, 앞 필드가 오기 전까지 뒤 필드는 보류
+    parser = StreamingFieldParser(["hook", "body"])
+    assert parser.feed('{"body": "본문", "hook": "훅이 아직') == []
+    assert parser.pending == ["hook", "body"]
+    assert parser.feed(' 안 끝남"') == [("hook", "훅이 아직 안 끝남"), ("body", "본문")]
+    print("[OK] 미완성 필드 보류")
+    return fields
+
+
+async def main():
+    setup_logger(log_level="INFO")
+    
+    print("\n[START] 구조화 응답 처리 테스트 시작\n")
+    
+    repaired = await test_repair_json()
+    errors = await test_validate_schema()
+    fields = await test_streaming_field_parser()
+    
+    print("\n" + "=" * 50)
+    print("[SUMMARY] 테스트 결과 요약")
+    print("=" * 50)
+    print(f"JSON 복구: {repaired}개 사례")
+    print(f"스키마 오류: {len(errors)}개")
+    print(f"스트리밍 필드: {len(fields)}개")
+    print("\n[DONE] 테스트 완료!")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
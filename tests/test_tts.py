@@ -0,0 +1,206 @@
+"""TTS 모듈 테스트 스크립트
+
+실행: python -m tests.test_tts
+
+Edge TTS는 API 키 없이 동작합니다 (인터넷 연결 필요, 연결이 안 되면 건너뜀).
+타이밍/캐시 테스트는 무음 wav를 만드는 대체 제공자를 써서 오프라인으로 동작합니다.
+"""
+import asyncio
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Windows 콘솔 UTF-8 설정
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+
+import aiohttp
+from pydub import AudioSegment
+
+from src.models import Script, TextTiming, TTSProvider
+from src.tts import EdgeTTSProvider, TTSEngine
+from src.tts.base import BaseTTSProvider
+from src.tts.cache import TTSCache
+from src.tts.splitter import split_sentences
+from src.tts.timing import align_chunks
+from src.utils.logger import setup_logger
+
+
+SAMPLE_SCRIPT = Script(
+    title="테스트",
+    hook="삼성전자가 새 스마트폰을 공개했습니다.",
+    body="이번 제품은 AI 기능이 대폭 강화됐는데요. 실시간 통역과 사진 자동 편집이 들어갔습니다.",
+    outro="출시는 다음 달입니다.",
+    full_script=(
+        "삼성전자가 새 스마트폰을 공개했습니다. "
+        "이번 제품은 AI 기능이 대폭 강화됐는데요. "
+        "실시간 통역과 사진 자동 편집이 들어갔습니다. "
+        "출시는 다음 달입니다."
+    ),
+    keywords=["smartphone"],
+    hashtags=["#IT뉴스"],
+    description="",
+)
+
+
+async def test_split_sentences():
+    """한국어 문장 분리 테스트"""
+    print("\n" + "=" * 50)
+    print("[TEST] 문장 분리 테스트")
+    print("=" * 50)
+    
+    sentences = split_sentences(SAMPLE_SCRIPT.full_script)
+    
+    print(f"\n[OK] {len(sentences)}개 문장\n")
+    for i, sentence in enumerate(sentences, 1):
+        print(f"[{i}] {sentence}")
+    
+    assert "".join(sentences).replace(" ", "") == SAMPLE_SCRIPT.full_script.replace(" ", "")
+    return sentences
+
+
+class SilentTTSProvider(BaseTTSProvider):
+    """글자 수에 비례한 무음 wav를 만드는 대체 제공자 (합성 횟수 기록)"""
+    
+    provider = TTSProvider.EDGE
+    audio_format = "wav"
+    
+    def __init__(self):
+        super().__init__(max_concurrency=4)
+        self.calls = 0
+    
+    async def synthesize(self, text, config, output_path):
+        self.calls += 1
+        AudioSegment.silent(duration=len(text) * 50).export(output_path, format="wav")
+        return None
+
+
+async def test_tts_cache():
+    """문장 캐시 테스트 (두 번째 합성은 모두 캐시 적중)"""
+    print("\n" + "=" * 50)
+    print("[TEST] TTS 문장 캐시 테스트")
+    print("=" * 50)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        provider = SilentTTSProvider()
+        cache = TTSCache(cache_dir=tmp / "cache", max_size_mb=1)
+        engine = TTSEngine(provider, cache=cache)
+        
+        first = await engine.synthesize(SAMPLE_SCRIPT, output_path=tmp / "first.wav")
+        synthesized = provider.calls
+        second = await engine.synthesize(SAMPLE_SCRIPT, output_path=tmp / "second.wav")
+        
+        print(f"\n[OK] 합성 {synthesized}회 -> 재합성 {provider.calls - synthesized}회")
+        print(f"캐시: {cache.stats.hits} hits / {cache.stats.misses} misses")
+        
+        assert provider.calls == synthesized == len(split_sentences(SAMPLE_SCRIPT.full_script))
+        assert cache.stats.hits == synthesized
+        assert abs(first.duration - second.duration) < 0.01
+        
+        # 포맷별 저장소와 메타데이터가 한도 하나를 함께 씀
+        small = TTSCache(cache_dir=tmp / "small", max_size_mb=0.05)
+        for i, sentence in enumerate(split_sentences(SAMPLE_SCRIPT.full_script)):
+            path = tmp / f"chunk_{i}.wav"
+            await provider.synthesize(sentence, None, path)
+            small.put(small.make_key(provider.provider, provider.default_config(), sentence), path)
+        print(f"[OK] 공유 한도: {small.size_mb:.3f} MB / {small.max_size_mb} MB")
+        assert small.size_mb <= small.max_size_mb
+    
+    return cache.stats
+
+
+async def test_align_chunks():
+    """문장 타이밍 정렬 테스트 (제공자 단어 타이밍은 오프셋 적용, 없으면 추정)"""
+    print("\n" + "=" * 50)
+    print("[TEST] 타이밍 정렬 테스트")
+    print("=" * 50)
+    
+    sentences = ["첫 문장입니다.", "둘째 문장은 조금 더 깁니다."]
+    # 첫 문장은 제공자 단어 타이밍(끝이 문장 길이를 넘는 값 포함), 둘째는 없음
+    words = [[TextTiming("첫", 0.1, 0.4), TextTiming("문장입니다.", 0.5, 1.8)], None]
+    word_timings, sentence_timings = align_chunks(sentences, [1.5, 2.0], words)
+    
+    assert [(t.start, t.end) for t in sentence_timings] == [(0.0, 1.5), (1.5, 3.5)]
+    assert (word_timings[1].start, word_timings[1].end) == (0.5, 1.5)
+    assert [t.text for t in word_timings[2:]] == ["둘째", "문장은", "조금", "더", "깁니다."]
+    assert word_timings[2].start == 1.5 and word_timings[-1].end == 3.5
+    print(f"\n[OK] 단어 {len(word_timings)}개, 문장 {len(sentence_timings)}개 정렬")
+    
+    # 엔진: 실제로 이어 붙인 오디오 길이 기준으로 문장/단어 타이밍 계산
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        engine = TTSEngine(SilentTTSProvider(), cache=TTSCache(cache_dir=tmp / "cache"))
+        result = await engine.synthesize(SAMPLE_SCRIPT, output_path=tmp / "silent.wav")
+    
+    sentences = split_sentences(SAMPLE_SCRIPT.full_script)
+    starts = [timing.start for timing in result.word_timings]
+    for timing in result.sentence_timings:
+        print(f"  [{timing.start:5.2f} - {timing.end:5.2f}] {timing.text}")
+    
+    assert [timing.text for timing in result.sentence_timings] == sentences
+    for timing, sentence in zip(result.sentence_timings, sentences):
+        assert abs((timing.end - timing.start) - len(sentence) * 0.05) < 0.01
+    assert starts == sorted(starts)
+    assert len(result.word_timings) == len(SAMPLE_SCRIPT.full_script.split())
+    assert abs(result.sentence_timings[-1].end - result.duration) < 0.01
+    return result
+
+
+async def test_edge_tts():
+    """Edge TTS 병렬 합성 테스트"""
+    print("\n" + "=" * 50)
+    print("[TEST] Edge TTS 병렬 합성 테스트")
+    print("=" * 50)
+    
+    engine = TTSEngine(EdgeTTSProvider(max_concurrency=4))
+    result = await engine.synthesize(SAMPLE_SCRIPT)
+    
+    print(f"\n[OK] 합성 완료\n")
+    print(f"파일: {result.audio_path}")
+    print(f"길이: {result.duration:.1f}초")
+    print(f"글자수: {result.character_count}자")
+    print(f"단어 타이밍: {len(result.word_timings)}개")
+    for timing in result.sentence_timings:
+        print(f"  [{timing.start:5.2f} - {timing.end:5.2f}] {timing.text}")
+    
+    starts = [timing.start for timing in result.word_timings]
+    assert starts == sorted(starts)
+    assert abs(result.sentence_timings[-1].end - result.duration) < 0.01
+    return result
+
+
+async def main():
+    setup_logger(log_level="INFO")
+    
+    print("\n[START] TTS 모듈 테스트 시작\n")
+    
+    sentences = await test_split_sentences()
+    cache_stats = await test_tts_cache()
+    timings = await test_align_chunks()
+    try:
+        result = await test_edge_tts()
+    except (aiohttp.ClientError, OSError, asyncio.TimeoutError) as e:
+        # 네트워크가 없는 환경에서도 나머지 결과는 보여 줌
+        print(f"\n[SKIP] Edge TTS 합성 실패 (인터넷 연결 필요): {e!r}")
+        result = None
+    
+    print("\n" + "=" * 50)
+    print("[SUMMARY] 테스트 결과 요약")
+    print("=" * 50)
+    print(f"문장 수: {len(sentences)}개")
+    print(f"캐시 적중: {cache_stats.hits}회")
+    print(f"무음 합성 타이밍: {len(timings.sentence_timings)}문장, {timings.duration:.1f}초")
+    if result:
+        print(f"오디오 길이: {result.duration:.1f}초")
+    print("\n[DONE] 테스트 완료!")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
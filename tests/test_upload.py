@@ -0,0 +1,413 @@
+"""YouTube 업로드 테스트 (로컬 대체 서버 사용)
+
+실행: python -m tests.test_upload
+
+YouTube 대신 로컬 HTTP 서버가 재개 가능 업로드 프로토콜을 흉내냅니다.
+OAuth 토큰이나 API 할당량이 필요 없습니다.
+"""
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Windows 콘솔 UTF-8 설정
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+
+from google.oauth2.credentials import Credentials
+
+from src.media import FFmpegRenderer
+from src.models import Script, ShortsVideo, UploadPrivacy
+from src.upload import QuotaLedger, UploadError, UploadSessionStore, YouTubeUploader
+from src.upload.quota import quota_day
+from src.utils.logger import setup_logger
+from tests.test_renderer import SCRIPT_TEXT, make_fixtures, temp_caches
+
+
+CHUNK_SIZE = 256 * 1024
+VIDEO_SIZE = 4 * 1024 * 1024 + 12345
+
+
+class FakeYouTubeServer(BaseHTTPRequestHandler):
+    """YouTube 재개 가능 업로드 대체 서버
+    
+    drop_after 비율을 넘는 청크를 받으면 저장만 하고 응답 없이 연결을 끊습니다
+    (최대 drop_limit회). 전체 크기 미정(`bytes a-b/*`) 청크 수는 open_chunks에 셉니다.
+    """
+    
+    sessions: dict[str, dict] = {}
+    posts = 0
+    received = 0
+    open_chunks = 0
+    drop_after: float = 0.0
+    drop_limit = 1
+    drops = 0
+    
+    def log_message(self, format, *args):
+        pass
+    
+    def _send_json(self, data: dict, status: int = 200):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def _send_incomplete(self, session: dict):
+        self.send_response(308)
+        if session["data"]:
+            self.send_header("Range", f"bytes=0-{len(session['data']) - 1}")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+    
+    def do_POST(self):
+        assert self.headers["Authorization"] == "Bearer test-token"
+        metadata = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        assert metadata["status"]["privacyStatus"] == "private"
+        
+        cls = type(self)
+        cls.posts += 1
+        session_id = f"s{len(cls.sessions)}"
+        size = self.headers.get("X-Upload-Content-Length")
+        cls.sessions[session_id] = {
+            "size": int(size) if size else None,
+            "data": bytearray(),
+        }
+        
+        self.send_response(200)
+        self.send_header(
+            "Location", f"http://127.0.0.1:{self.server.server_port}/upload/session/{session_id}"
+        )
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+    
+    def do_PUT(self):
+        cls = type(self)
+        session_id = self.path.rsplit("/", 1)[1]
+        session = cls.sessions.get(session_id)
+        if session is None:
+            self._send_json({"error": "not found"}, 404)
+            return
+        
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        content_range = self.headers["Content-Range"]
+        total = content_range.rsplit("/", 1)[1]
+        if total == "*":
+            cls.open_chunks += not content_range.startswith("bytes */")
+        else:
+            session["size"] = int(total)
+        
+        if content_range.startswith("bytes */"):
+            if len(session["data"]) == session["size"]:
+                self._send_json({"id": f"video-{session_id}"})
+            else:
+                self._send_incomplete(session)
+            return
+        
+        start = int(content_range.split(" ")[1].split("-")[0])
+        if start != len(session["data"]):
+            self._send_incomplete(session)
+            return
+        
+        session["data"] += body
+        cls.received += len(body)
+        
+        if (
+            cls.drop_after
+            and cls.drops < cls.drop_limit
+            and len(session["data"]) >= session["size"] * cls.drop_after
+        ):
+            # 서버는 받았지만 응답 전에 연결이 끊긴 상황
+            cls.drops += 1
+            self.close_connection = True
+            return
+        
+        if len(session["data"]) == session["size"]:
+            self._send_json({"id": f"video-{session_id}"}, 201)
+        else:
+            self._send_incomplete(session)
+    
+    @classmethod
+    def reset(cls, drop_after: float = 0.0, drop_limit: int = 1):
+        cls.sessions = {}
+        cls.posts = 0
+        cls.received = 0
+        cls.open_chunks = 0
+        cls.drop_after = drop_after
+        cls.drop_limit = drop_limit
+        cls.drops = 0
+
+
+def make_video(work_dir: Path, name: str) -> ShortsVideo:
+    path = work_dir / f"{name}.mp4"
+    path.write_bytes(os.urandom(VIDEO_SIZE))
+    script = Script(f"{name} 제목", "", "", "", "", ["테크"], ["#IT뉴스"], "설명")
+    return ShortsVideo(script=script, audio_path="", video_path=str(path))
+
+
+def make_uploader(server, work_dir: Path, **kwargs) -> YouTubeUploader:
+    kwargs.setdefault("ledger", QuotaLedger(work_dir / "quota.json"))
+    kwargs.setdefault("sessions", UploadSessionStore(work_dir / "sessions.json"))
+    uploader = YouTubeUploader(
+        credentials=Credentials(token="test-token"),
+        chunk_size=CHUNK_SIZE,
+        upload_url=f"http://127.0.0.1:{server.server_port}/upload/youtube/v3/videos",
+        **kwargs,
+    )
+    uploader.RETRY_BACKOFF = 0.01
+    return uploader
+
+
+def start_server() -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeYouTubeServer)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def test_quota_day():
+    """할당량 기준 날짜(태평양 시간) 테스트"""
+    print("\n" + "=" * 50)
+    print("[TEST] 할당량 기준 날짜 테스트")
+    print("=" * 50)
+    
+    # 한국 시간 1월 1일 16시 = 태평양 시간 12월 31일 23시
+    assert quota_day(datetime(2026, 1, 1, 7, 0, tzinfo=timezone.utc)) == "2025-12-31"
+    assert quota_day(datetime(2026, 1, 1, 8, 0, tzinfo=timezone.utc)) == "2026-01-01"
+    
+    print(f"\n[OK] 오늘 할당량 기준 날짜: {quota_day()}")
+    return quota_day()
+
+
+async def test_resume_after_drop():
+    """95% 지점에서 연결이 끊겨도 이어 올리는지 테스트"""
+    print("\n" + "=" * 50)
+    print("[TEST] 끊긴 업로드 이어 올리기 테스트")
+    print("=" * 50)
+    
+    FakeYouTubeServer.reset(drop_after=0.95)
+    server = start_server()
+    
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            work_dir = Path(tmp)
+            video = make_video(work_dir, "drop")
+            uploader = make_uploader(server, work_dir)
+            
+            result = await uploader.upload(video, UploadPrivacy.PRIVATE)
+            
+            print(f"\n[OK] {result.video_id} 업로드 완료")
+            print(f"연결 끊김: {FakeYouTubeServer.drops}회, "
+                  f"전송량: {FakeYouTubeServer.received}/{VIDEO_SIZE} bytes")
+            
+            assert result.success and result.video_id == "video-s0"
+            assert FakeYouTubeServer.drops == 1
+            # 끊기기 전에 받은 바이트는 다시 보내지 않음
+            assert FakeYouTubeServer.received == VIDEO_SIZE
+            assert uploader.ledger.used() == 1600
+            assert uploader.sessions.get(uploader.sessions.make_key(Path(video.video_path))) is None
+            return result
+    finally:
+        server.shutdown()
+
+
+async def test_resume_saved_session():
+    """프로세스가 바뀌어도 저장된 세션 URI로 이어 올리는지 테스트"""
+    print("\n" + "=" * 50)
+    print("[TEST] 저장된 세션 재개 테스트")
+    print("=" * 50)
+    
+    # 재시도 한 번으로는 못 끝나도록 계속 끊김
+    FakeYouTubeServer.reset(drop_after=0.5, drop_limit=100)
+    server = start_server()
+    
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            work_dir = Path(tmp)
+            video = make_video(work_dir, "saved")
+            
+            first = make_uploader(server, work_dir, max_retries=1)
+            try:
+                await first.upload(video, UploadPrivacy.PRIVATE)
+                raise AssertionError("업로드가 실패해야 합니다")
+            except UploadError as e:
+                print(f"\n첫 시도 실패: {e}")
+            
+            saved = first.sessions.get(first.sessions.make_key(Path(video.video_path)))
+            assert saved is not None and saved.offset >= VIDEO_SIZE * 0.5
+            
+            # 새 프로세스: 같은 세션/할당량 파일을 다시 읽음
+            FakeYouTubeServer.drop_after = 0.0
+            second = make_uploader(
+                server,
+                work_dir,
+                ledger=QuotaLedger(work_dir / "quota.json"),
+                sessions=UploadSessionStore(work_dir / "sessions.json"),
+            )
+            result = await second.upload(video, UploadPrivacy.PRIVATE)
+            
+            print(f"[OK] {saved.offset} bytes부터 재개 → {result.video_id}")
+            
+            assert result.video_id == "video-s0"
+            assert FakeYouTubeServer.posts == 1
+            assert FakeYouTubeServer.received == VIDEO_SIZE
+            assert second.ledger.used() == 1600
+            return saved.offset
+    finally:
+        server.shutdown()
+
+
+async def test_parallel_uploads_with_quota():
+    """동시 업로드와 할당량 한도 테스트"""
+    print("\n" + "=" * 50)
+    print("[TEST] 동시 업로드 + 할당량 테스트")
+    print("=" * 50)
+    
+    FakeYouTubeServer.reset()
+    server = start_server()
+    
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            work_dir = Path(tmp)
+            videos = [make_video(work_dir, f"short{i}") for i in range(3)]
+            # 업로드 두 편만큼의 할당량
+            uploader = make_uploader(
+                server,
+                work_dir,
+                concurrency=3,
+                ledger=QuotaLedger(work_dir / "quota.json", daily_limit=3200),
+            )
+            
+            results = await uploader.upload_many(videos, UploadPrivacy.PRIVATE)
+            
+            print()
+            for result in results:
+                status = result.video_id if result.success else f"실패 ({result.error_message})"
+                print(f"  {result.title}: {status}")
+            
+            assert sum(result.success for result in results) == 2
+            assert FakeYouTubeServer.posts == 2
+            assert uploader.ledger.remaining() == 0
+            return results
+    finally:
+        server.shutdown()
+
+
+async def test_upload_while_rendering():
+    """fragmented MP4 렌더링과 동시에 업로드하는지 테스트"""
+    print("\n" + "=" * 50)
+    print("[TEST] 렌더링 중 업로드 테스트")
+    print("=" * 50)
+    
+    FakeYouTubeServer.reset()
+    server = start_server()
+    
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            work_dir = Path(tmp)
+            tts, media = make_fixtures(work_dir)
+            script = Script("스트리밍 제목", "", "", "", SCRIPT_TEXT, ["테크"], [], "설명")
+            output_path = work_dir / "streamed.mp4"
+            
+            uploader = make_uploader(server, work_dir)
+            uploader.STREAM_POLL_INTERVAL = 0.05
+            renderer = FFmpegRenderer(preset="ultrafast", fragmented=True, **temp_caches(work_dir))
+            
+            rendering = asyncio.ensure_future(
+                asyncio.to_thread(renderer.render, script, tts, media, output_path)
+            )
+            result = await uploader.upload_while_rendering(
+                output_path, script, rendering, UploadPrivacy.PRIVATE
+            )
+            
+            uploaded = bytes(FakeYouTubeServer.sessions["s0"]["data"])
+            size = output_path.stat().st_size
+            print(f"\n[OK] {result.video_id}: {size / 1024 / 1024:.1f}MB, "
+                  f"렌더링 중 {FakeYouTubeServer.open_chunks}개 청크 전송")
+            
+            assert result.success
+            assert uploaded == output_path.read_bytes()
+            assert FakeYouTubeServer.open_chunks > 0
+            return FakeYouTubeServer.open_chunks
+    finally:
+        server.shutdown()
+
+
+async def test_fallback_upload_quota():
+    """스트리밍 실패 후 전체 업로드해도 할당량을 한 번만 차감하는지 테스트"""
+    print("\n" + "=" * 50)
+    print("[TEST] 대체 렌더 후 재업로드 할당량 테스트")
+    print("=" * 50)
+    
+    FakeYouTubeServer.reset()
+    server = start_server()
+    
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            work_dir = Path(tmp)
+            fallback = make_video(work_dir, "fallback")
+            uploader = make_uploader(server, work_dir)
+            uploader.STREAM_POLL_INTERVAL = 0.01
+            
+            # 렌더러가 다른 경로에 결과를 쓴 상황 (대체 렌더러)
+            rendering = asyncio.get_running_loop().create_future()
+            rendering.set_result(fallback)
+            try:
+                await uploader.upload_while_rendering(
+                    work_dir / "streamed.mp4", fallback.script, rendering, UploadPrivacy.PRIVATE
+                )
+                raise AssertionError("스트리밍 업로드가 실패해야 합니다")
+            except UploadError as e:
+                print(f"\n스트리밍 실패: {e}")
+            
+            result = await uploader.upload(fallback, UploadPrivacy.PRIVATE)
+            used = uploader.ledger.used()
+            print(f"[OK] {result.video_id} 업로드, 할당량 {used} 사용")
+            
+            assert result.success and FakeYouTubeServer.posts == 2
+            assert used == 1600
+            
+            # 업로드가 끝난 영상을 다시 올리면 새로 차감
+            await uploader.upload(fallback, UploadPrivacy.PRIVATE)
+            assert uploader.ledger.used() == 3200
+            return used
+    finally:
+        server.shutdown()
+
+
+async def main():
+    setup_logger(log_level="INFO")
+    
+    print("\n[START] 업로드 테스트 시작\n")
+    
+    day = await test_quota_day()
+    result = await test_resume_after_drop()
+    offset = await test_resume_saved_session()
+    results = await test_parallel_uploads_with_quota()
+    open_chunks = await test_upload_while_rendering()
+    fallback_quota = await test_fallback_upload_quota()
+    
+    print("\n" + "=" * 50)
+    print("[SUMMARY] 테스트 결과 요약")
+    print("=" * 50)
+    print(f"할당량 기준 날짜: {day}")
+    print(f"끊김 후 재개 업로드: {result.video_id}")
+    print(f"저장된 세션 재개 위치: {offset} bytes")
+    print(f"동시 업로드: {sum(r.success for r in results)}/{len(results)}편 (할당량 한도)")
+    print(f"렌더링 중 전송한 청크: {open_chunks}개")
+    print(f"대체 렌더 재업로드 할당량: {fallback_quota}")
+    print("\n[DONE] 테스트 완료!")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())